@@ -16,134 +16,39 @@
 #   Suite 330, Boston, MA  02111-1307, USA
 #                                                                         
 
-import Draft, Part, FreeCADGui
+import Part
 import FreeCAD as App
-import os
+if App.GuiUp:
+	import FreeCADGui
+import os, time
 from pathlib import Path
+from grabbag import profiler, fingerprint, pool, scheduler
+from grabbag.core.gcode import gcode, writeLines
+from grabbag.core.sketch import curvesPlacement, sketchGeometry, addToSketch
+from grabbag.split import addSplitPattern, splitPattern
+from grabbag.core.biarc import SegmentCache, CompactModes, EdgeToBiArcs, cachedBiArcs, EdgeToBSpline, joinShape, getRad, splitGeo, splitGeoByLen, cumulativeLengths, SegmentByLength, SegmentByRadius, makeCumulative, toBiArcsShape
+
+# SegmentCache of each feature and Base link by (document, object, link) name.
+# Kept here rather than on the proxy, which FreeCAD saves in the document.
+_segments = {}
+
+def segmentCache(obj, base):
+	return _segments.setdefault((obj.Document.Name, obj.Name, base.Name), SegmentCache())
+
+def _forgetSegments(doc, name):
+	for k in [ k for k in _segments if k[0] == doc and name in (None, k[1]) ]:
+		del _segments[k]
+
+fingerprint.onForget(_forgetSegments)
 
 def fixPlacement(s,p):
 	s.Placement=p
 	return s
 
-def EdgeToBiArcs(Edge, tolerance=0.01):
-	if type(Edge.Curve) in [ Part.Line, Part.Circle ]:
-		l=  Edge.Curve.toNurbs(Edge.FirstParameter,Edge.LastParameter)
-		l = l.toBiArcs(tolerance)
-	else:
-		l = Edge.Curve.toBiArcs(tolerance)
-	return l
-
-def EdgeToBSpline(e):
-	try:
-		c=e.toNurbs().Edge1.Curve
-	except:
-		print("Nurbs Fail")
-		c=e.Curve.toBSpline()
-	c.segment(e.FirstParameter,e.LastParameter)
-	return c
-
-def joinShape(shp):
-	bs = [ EdgeToBSpline(e) for e in shp.Edges ]
-
-	c=bs[0]
-
-	for b in bs[1:]:
-		if not c.join(b):
-			print("JoinFail")
-#			forcejoin(c,b)
-	return c.toShape()
-
-def getRad(c):
-	if type(c) in [Part.Circle, Part.ArcOfCircle]:
-		return c.Radius
-	else:
-		return 1000000
-
-def splitGeo(c):
-	a=c.copy()
-	b=c.copy()
-
-	a.setParameterRange(a.FirstParameter, (a.FirstParameter+a.LastParameter)/2)
-	b.setParameterRange(a.LastParameter, b.LastParameter)
-	return a,b
-
-def splitGeoByLen(c,l):
-	if(l<=0):
-		raise Exception("BUG! can't splitGeoByLen by <=0 length!")
-
-	a=c.copy()
-	b=c.copy()
-
-	r=a.LastParameter-a.FirstParameter
-	l=l/a.length()
-	r*=l
-	r+=a.FirstParameter
-
-#	print("splitGeoByLen: ", a.FirstParameter, r, b.LastParameter)
-	if type(c) in [Part.LineSegment,Part.BSplineCurve ]:
-		a = a.toNurbs(a.FirstParameter,r)
-		b = b.toNurbs(r, b.LastParameter)
-#		print("type b=",type(b))
-	else:
-		a.setParameterRange(a.FirstParameter, r)
-		b.setParameterRange(r, b.LastParameter)
-	return a,b
-
-def SegmentByLength(l, lenlist):	# lenlist must be sorted in reverse order
-	i=j=0
-	curlen=0
-	cmplen=0
-
-	while j<len(l):
-		if not cmplen:
-			try:
-				cmplen=lenlist.pop()
-			except:
-				yield l[i:]
-				return
-
-		if curlen+l[j].length()>cmplen:
-			a,b = splitGeoByLen(l[j], cmplen-curlen)
-			l[j]=a
-			yield l[i:j+1]
-			curlen+= a.length()	# b's length will be added below
-			i=j
-			l[j]=b
-			cmplen=0	# cause pop of new cmplen
-			continue	# re-asess the second part of the curve in case it's long enough to go past the next length
-		elif cmplen+l[j].length()==cmplen:
-			yield l[i:j+1]
-			i=j+1
-
-		curlen+= l[j].length()
-		j+=1
-
-	yield l[-1]
-			
-def SegmentByRadius( l, radii):
-	i=j=0
-	curlen=0
-	while j<len(l):
-		while j<len(l) and not getRad(l[j]) in radii:
-			j+=1
-		if(True and j<len(l)):
-			a,b = splitGeo(l[j])
-			l[j]=a
-			yield l[i:j+1]
-			l[j]=b
-		else:
-			yield l[i:j]
-		i=j
-		j+=1
-
-def makeCumulative(l):
-	acc=0
-
-	for i in l:
-		acc+=i
-		yield acc
-		
+@profiler.instrumented
 class ToBiArcs:
+	OutputProperties = ( 'RadiusSplits', 'FailedSeams', 'ArcsBefore', 'ArcsAfter', 'MaxDeviation', 'PoleCount' )	# written by execute, see grabbag.fingerprint
+
 	def __init__(self, obj):
 		obj.Proxy = self
 		obj.addProperty("App::PropertyLinkList", "Base", "Dimensions")
@@ -156,47 +61,121 @@ class ToBiArcs:
 		obj.addProperty("App::PropertyInteger", "NumRadii", "Split").NumRadii=1
 		obj.addProperty("App::PropertyFloatList", "RadiusSplits", "Split").RadiusSplits=[]
 		obj.addProperty("App::PropertyBool", "ClaimChildren", "Dimensions").ClaimChildren=True
+		fingerprint.addProperties(obj)
+		pool.addProperties(obj)
+		self._addProperties(obj)
 
 	def onDocumentRestored(self, obj):
-		pass
-
+		fingerprint.addProperties(obj)
+		pool.addProperties(obj)
+		self._addProperties(obj)
+		fingerprint.restore(self, obj)
+
+	def _addProperties(self, obj):
+		"properties added after the first release, for __init__ and onDocumentRestored"
+		if not hasattr(obj, 'ParallelFit'):
+			obj.addProperty("App::PropertyBool", "ParallelFit", "Cache", "Fit the biarcs of many edges in the GrabBag worker pool").ParallelFit=False
+		if not hasattr(obj, 'FailedSeams'):
+			obj.addProperty("App::PropertyFloatList", "FailedSeams", "Split", "Distances from the start where neighbouring arcs could not be joined")
+			obj.setEditorMode("FailedSeams", 1)
+		addSplitPattern(obj, "Split")
+		if not hasattr(obj, 'RadiusBelow'):
+			obj.addProperty("App::PropertyFloat", "RadiusBelow", "Split", "Split by Radii splits every arc with a radius below this instead of the NumRadii smallest, 0 to use NumRadii")
+		if not hasattr(obj, 'Input'):
+			obj.addProperty("App::PropertyEnumeration", "Input", "Dimensions", "Fit the Base edges, or the points of a point cloud or of polyline wires (e.g. Draft wires)").Input=['Edges', 'Points']
+		if not hasattr(obj, 'Simplify'):
+			obj.addProperty("App::PropertyBool", "Simplify", "Dimensions", "Merge neighbouring arcs on the same circle and lines on the same line, within Tolerance").Simplify=False
+		for name, doc in ( ('ArcsBefore', "Number of arcs and lines fitted"), ('ArcsAfter', "Number of arcs and lines left after Simplify") ):
+			if not hasattr(obj, name):
+				obj.addProperty("App::PropertyInteger", name, "Dimensions", doc)
+				obj.setEditorMode(name, 1)
+		if not hasattr(obj, 'Compact'):
+			obj.addProperty("App::PropertyEnumeration", "Compact", "Compact", "Reduce the poles of the joined curves within Tolerance, by knot removal or by reapproximating them").Compact=CompactModes
+		for name, kind, doc in ( ('MaxDeviation', "App::PropertyFloat", "Largest distance of the compacted curves from the joined biarcs"), ('PoleCount', "App::PropertyInteger", "Poles of all joined curves") ):
+			if not hasattr(obj, name):
+				obj.addProperty(kind, name, "Compact", doc)
+				obj.setEditorMode(name, 1)
+
+	@fingerprint.cached
 	def execute(self, obj):
-		c = [ EdgeToBiArcs(e,obj.Tolerance) for e in obj.Base[0].Shape.Edges ]
-		c = [ i for sub in c for i in sub ]	# combine the list of lists into a single list of elements
-
-		# a dirty test, ignore all properties nd just do the length split!
-
-		if 'Distance' in obj.Mode:
-			dlist=obj.SplitDistances.copy()
-			if obj.SplitDistance:
-				dlist.append( obj.SplitDistance)
-			dlist=list(set(dlist))
-			dlist.sort()
-			dlist.reverse()
-#			print("dlist=",dlist)
-			j = [ joinShape(Part.makeCompound(e)) for e in SegmentByLength(c, dlist ) ]
-#			print(j)
-			c=Part.makeCompound(j)
-		elif 'Radii' in obj.Mode and obj.NumRadii>0:
-			r = [ getRad(i) for i in c]
-			r = list(dict.fromkeys(r))	# de-dup list
-			r.sort()
-
-			j = [ joinShape(Part.makeCompound(e)) for e in SegmentByRadius(c, r[:obj.NumRadii] ) ]
-			c=Part.makeCompound(j)
-			l=[ i.Length for i in c.Edges ]
-			obj.RadiusSplits = [ i for i in makeCumulative(l[:-1])] if len(l)>1 else []
-
-		elif 'Join' in obj.Mode:
-			c=Part.makeCompound(c)
-			c = joinShape(c)
-		else:
-			c=Part.makeCompound(c)
-
-		obj.Shape=c
-		return
+		"every Base link is converted on its own, and only again when it or the settings changed"
+		results = self._results(obj)
+
+		splits = [ d for c, s, report, curves in results if s is not None for d in s ]
+		if any(s is not None for c, s, report, curves in results):
+			obj.RadiusSplits = splits
+		obj.FailedSeams = [ d for c, s, report, curves in results for d in report['FailedSeams'] ]
+		obj.ArcsBefore = sum(report['ArcsBefore'] for c, s, report, curves in results)
+		obj.ArcsAfter = sum(report['ArcsAfter'] for c, s, report, curves in results)
+		obj.MaxDeviation = max((report['MaxDeviation'] for c, s, report, curves in results), default=0)
+		obj.PoleCount = sum(report['PoleCount'] for c, s, report, curves in results)
+		for base, (c, s, report, curves) in zip(obj.Base, results):
+			failed = report['FailedSeams']
+			if failed:
+				App.Console.PrintWarning(f"{obj.Label}: {len(failed)} seams of {base.Label} could not be joined, at {', '.join(f'{d:.3f}' for d in failed)}\n")
+		shapes = [ c for c, s, report, curves in results ]
+		if not shapes:	# no Base yet, the report above is all zeros
+			obj.Shape = Part.Shape()
+			return
+		obj.Shape = shapes[0] if len(shapes) == 1 else Part.makeCompound(shapes)
+
+	def _results(self, obj):
+		"_convert of every Base link, reused for the links that didn't change since the last call"
+		key = fingerprint.inputKey(obj, self.OutputProperties)
+		return fingerprint.perLink(obj, obj.Base, key, lambda base: self._convert(obj, base))
+
+	def _convert(self, obj, base):
+		"toBiArcsShape of one Base link: the shape, the RadiusSplits, the report and the curves of the shape"
+		fit = pool.fitBiArcs if obj.ParallelFit else None
+		report = {}
+		curves = []
+		points = self._points(obj, base) if obj.Input == 'Points' else None
+		c, splits = toBiArcsShape(getattr(base, 'Shape', None), obj.Tolerance, obj.Mode, self._distances(obj), obj.NumRadii, fit, obj.Simplify, report, points, splitPattern(obj), segmentCache(obj, base), obj.RadiusBelow, obj.Compact, curves)
+		return c, splits, report, curves
+
+	def curves(self, obj):
+		"""
+		the curves of the feature's result, Base link after Base link, for the
+		exporters: arcs and lines as fitted, simplified and split, or the
+		compacted BSplines. From the per link cache, converted again only if
+		the feature is out of date or was computed in a worker.
+		"""
+		return [ c for shape, s, report, curves in self._results(obj) for c in curves ]
+
+	def _distances(self, obj):
+		dlist=obj.SplitDistances.copy()
+		if obj.SplitDistance:
+			dlist.append( obj.SplitDistance)
+		return dlist
+
+	def _points(self, obj, base):
+		"the ordered points of a Points feature, or the polyline of every wire of the base"
+		if hasattr(getattr(base, 'Points', None), 'Points'):	# Points::Feature
+			return [ [ tuple(v) for v in base.Points.Points ] ]
+		res = []
+		for w in base.Shape.Wires:
+			if all(isinstance(e.Curve, Part.Line) for e in w.Edges):
+				pts = [ v.Point for v in w.OrderedVertexes ]
+				if w.isClosed():
+					pts.append(pts[0])
+			else:
+				pts = w.discretize(Deflection=obj.Tolerance/4)
+			res.append([ tuple(p) for p in pts ])
+		return res
+
+	def offload(self, obj):
+		"job for grabbag.pool, see grabbag.worker"
+		if obj.Input == 'Points':	# fast enough here
+			return None
+		if len(obj.Base) != 1:	# done here link by link, see execute
+			return None
+		if 'Distance' in obj.Mode and segmentCache(obj, obj.Base[0]).segments:	# only the changed segments are rejoined here
+			return None
+		return ('toBiArcs', (obj.Base[0].Shape.exportBrepToString(), obj.Tolerance, obj.Mode, self._distances(obj), obj.NumRadii, obj.Simplify, splitPattern(obj), obj.RadiusBelow, obj.Compact))
 
 	def onChanged(self, obj, name):
+		if obj.Document.Restoring:	# don't recompute while the document is loading
+			return
 		if name == 'AddDistance':
 			if obj.AddDistance:
 				l=obj.SplitDistances
@@ -204,8 +183,8 @@ class ToBiArcs:
 				obj.SplitDistances = l
 				obj.AddDistance=False
 #				print("Added")
-		if name in ['NumRadii', 'Tolerance', 'SplitDistance']:
-			obj.recompute(False)
+		if name in ['NumRadii', 'Tolerance', 'SplitDistance', 'Simplify', 'Input', 'SplitInterval', 'SplitOffset', 'SplitCount', 'RadiusBelow', 'Compact']:
+			scheduler.request(obj)
 		pass
 #		print("onChanged", name)
 		
@@ -287,6 +266,33 @@ class ViewProviderToBiArcs:
         Called during document restore.
         """
 
+def exportGCode(obj, path, feed=None, plane='XY'):
+	"""
+	write the curves of a ToBiArcs feature to path as G2/G3/G1 moves, the
+	same curves its shape is made of (see ToBiArcs.curves). Returns ( line
+	count, bytes ).
+	"""
+	with open(path, 'w') as f:
+		return writeLines(f, gcode(obj.Proxy.curves(obj), feed, plane, obj.Tolerance))
+
+def exportSketch(obj, sketch=None, name="BiArcSketch"):
+	"""
+	write the curves of a ToBiArcs feature (see ToBiArcs.curves) into sketch,
+	or a new sketch in their plane, joined by coincident constraints, in one
+	addGeometry and one addConstraint call. Curves out of the plane of an
+	existing sketch are projected on it. Returns the sketch.
+	"""
+	arcs = obj.Proxy.curves(obj)
+	t = time.perf_counter()
+	if sketch is None:
+		sketch = obj.Document.addObject("Sketcher::SketchObject", name)
+		sketch.Placement = curvesPlacement(arcs, obj.Tolerance)
+	geo, coincident = sketchGeometry(arcs, sketch.getGlobalPlacement(), obj.Tolerance)
+	addToSketch(sketch, geo, coincident)
+	sketch.solve()
+	App.Console.PrintMessage(f"{sketch.Label}: {len(geo)} curves, {len(coincident)} coincident constraints in {(time.perf_counter()-t)*1000:.1f} ms\n")
+	return sketch
+
 def attach(myObj, obj):
     myObj.addExtension('Part::AttachExtensionPython')
     myObj.AttacherEngine="Engine 3D"
@@ -294,23 +300,26 @@ def attach(myObj, obj):
     myObj.AttachmentSupport=obj
     myObj.MapPathParameter=0
 
-def _create(obj, name="ToBiArcs"):
+def _create(objs, name="ToBiArcs"):
+    if not isinstance(objs, (list, tuple)):
+        objs = [ objs ]
     myObj = App.ActiveDocument.addObject("Part::FeaturePython", name)
     ToBiArcs(myObj)
-    myObj.Base= obj 
+    myObj.Base= objs
     ViewProviderToBiArcs(myObj.ViewObject)
-    obj.ViewObject.Visibility=False
+    for obj in objs:
+        obj.ViewObject.Visibility=False
     App.ActiveDocument.recompute()
     return myObj
 
 def create(name="ToBiArcs"):
-    sel = FreeCADGui.Selection.getSelectionEx()[0]
-    return _create(sel.Object, name=name)
+    "a ToBiArcs of every selected object"
+    return _create([ sel.Object for sel in FreeCADGui.Selection.getSelectionEx() ], name=name)
 
 # -------------------------- Gui command --------------------------------------------------
 if "FCMacro" in __file__:
 	create()
-else:
+elif App.GuiUp:
 	from PySide import QtCore
 	from PySide import QtGui
 
@@ -349,7 +358,7 @@ else:
 			else:
 				return False
             
-	if App.GuiUp:
+	if not '4Axis_ToBiArcs' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
 		FreeCADGui.addCommand('4Axis_ToBiArcs', _CommandToBiArcs())
 		print("Added Command")
 
@@ -16,10 +16,13 @@
 #   Suite 330, Boston, MA  02111-1307, USA
 #                                                                         
 
-import Draft, Part, FreeCADGui
+import Part
 import FreeCAD as App
+if App.GuiUp:
+	import FreeCADGui
 import os
 from pathlib import Path
+from grabbag import profiler, fingerprint
 
 def computeShape(inshp, offset, length):
 	shapes=[]
@@ -35,6 +38,7 @@ def computeShape(inshp, offset, length):
 #	return Part.makeSolid(Part.makeCompound(shapes))
 	return Part.makeCompound(shapes)
 
+@profiler.instrumented
 class Extruder:
 	def __init__(self, obj):
 		obj.Proxy = self
@@ -47,8 +51,10 @@ class Extruder:
 	def onDocumentRestored(self, obj):
 		if (not hasattr(obj,"Reverse")):
 			obj.addProperty("App::PropertyBool", "Reverse", "Dimensions").Reverse=False
-		obj.ViewObject.Proxy.fp = obj
+		if obj.ViewObject:	# None in FreeCADCmd
+			obj.ViewObject.Proxy.fp = obj
 
+	@fingerprint.cached
 	def execute(self, obj):
 		print("Base=", obj.Base.Shape)
 		obj.Shape=computeShape(obj.Base.Shape, obj.Offset, obj.Length)
@@ -175,57 +181,58 @@ def create(name="Extruder"):
 
 # -------------------------- Gui command --------------------------------------------------
 
-from PySide import QtCore
-from PySide import QtGui
-
-def translate(context, text, disambig):
-    #Extruder is not translatable, sorry...
-    return text
-
-def activeBody():
-    if App.ActiveDocument is None: return None
-    if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
-        return None
-    return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
-
-def CreateExtruder(name):
-    App.ActiveDocument.openTransaction("Create Extruder")
-    FreeCADGui.addModule("Extruder")
-    FreeCADGui.doCommand("f = Extruder.create(name = '"+name+"')")
-#    FreeCADGui.doCommand("f.Base = FreeCADGui.Selection.getSelection()[0]")
-#    FreeCADGui.doCommand("lattice2Executer.executeFeature(f)")
-#    FreeCADGui.doCommand("f.Spine.ViewObject.hide()")
-    FreeCADGui.doCommand("f = None")
-    App.ActiveDocument.commitTransaction()
-
-class _CommandExtruder:
-    "Command to create Extruder feature"
-    def GetResources(self):
-        return {'Pixmap'  : str(Path(__file__).parent / 'Extruder.svg'),
-                'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_Extruder","Extruder"),
-                'Accel': "",
-                'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_Extruder","Extrude individual shapes in a compound shape")}
+if App.GuiUp:
+    from PySide import QtCore
+    from PySide import QtGui
+
+    def translate(context, text, disambig):
+        #Extruder is not translatable, sorry...
+        return text
+
+    def activeBody():
+        if App.ActiveDocument is None: return None
+        if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
+            return None
+        return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
+
+    def CreateExtruder(name):
+        App.ActiveDocument.openTransaction("Create Extruder")
+        FreeCADGui.addModule("Extruder")
+        FreeCADGui.doCommand("f = Extruder.create(name = '"+name+"')")
+    #    FreeCADGui.doCommand("f.Base = FreeCADGui.Selection.getSelection()[0]")
+    #    FreeCADGui.doCommand("lattice2Executer.executeFeature(f)")
+    #    FreeCADGui.doCommand("f.Spine.ViewObject.hide()")
+        FreeCADGui.doCommand("f = None")
+        App.ActiveDocument.commitTransaction()
+
+    class _CommandExtruder:
+        "Command to create Extruder feature"
+        def GetResources(self):
+            return {'Pixmap'  : str(Path(__file__).parent / 'Extruder.svg'),
+                    'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_Extruder","Extruder"),
+                    'Accel': "",
+                    'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_Extruder","Extrude individual shapes in a compound shape")}
         
-    def Activated(self):
-        if len(FreeCADGui.Selection.getSelection()) == 1 :
-            CreateExtruder(name = "Extruder")
-        else:
-            mb = QtGui.QMessageBox()
-            mb.setIcon(mb.Icon.Warning)
-            mb.setText(translate("4Axis_Extruder", "Select a shape that is a compound first!", None))
-            mb.setWindowTitle(translate("4axis_Extruder","Bad selection", None))
-            mb.exec_()
+        def Activated(self):
+            if len(FreeCADGui.Selection.getSelection()) == 1 :
+                CreateExtruder(name = "Extruder")
+            else:
+                mb = QtGui.QMessageBox()
+                mb.setIcon(mb.Icon.Warning)
+                mb.setText(translate("4Axis_Extruder", "Select a shape that is a compound first!", None))
+                mb.setWindowTitle(translate("4axis_Extruder","Bad selection", None))
+                mb.exec_()
             
-    def IsActive(self):
-        if App.ActiveDocument:
-            return activeBody() is None
-        else:
-            return False
+        def IsActive(self):
+            if App.ActiveDocument:
+                return activeBody() is None
+            else:
+                return False
             
-if App.GuiUp:
-    FreeCADGui.addCommand('4Axis_Extruder', _CommandExtruder())
-    print("Added Command")
+    if not '4Axis_Extruder' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
+        FreeCADGui.addCommand('4Axis_Extruder', _CommandExtruder())
+        print("Added Command")
 
-exportedCommands = ['4Axis_Extruder']
-print("I am Extruder!")
+    exportedCommands = ['4Axis_Extruder']
+    print("I am Extruder!")
 # -------------------------- /Gui command --------------------------------------------------
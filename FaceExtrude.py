@@ -16,11 +16,15 @@
 #   Suite 330, Boston, MA  02111-1307, USA
 #                                                                         
 
-import Draft, Part, FreeCADGui
+import Part
 import FreeCAD as App
+if App.GuiUp:
+	import FreeCADGui
 import os
 from pathlib import Path
+from grabbag import profiler, fingerprint
 
+@profiler.instrumented
 class FaceExtrude:
 	def __init__(self, obj):
 		obj.Proxy = self
@@ -35,8 +39,10 @@ class FaceExtrude:
 	def onDocumentRestored(self, obj):
 		if (not hasattr(obj,"Reverse")):
 			obj.addProperty("App::PropertyBool", "Reverse", "Dimensions").Reverse=False
-		obj.ViewObject.Proxy.fp = obj
+		if obj.ViewObject:	# None in FreeCADCmd
+			obj.ViewObject.Proxy.fp = obj
 
+	@fingerprint.cached
 	def execute(self, obj):
 		if self.Internal:
 			f = obj.Base.InternalShape.Faces[obj.Face]
@@ -173,57 +179,58 @@ def create(name="FaceExtrude"):
 
 # -------------------------- Gui command --------------------------------------------------
 
-from PySide import QtCore
-from PySide import QtGui
-
-def translate(context, text, disambig):
-    #FaceExtrude is not translatable, sorry...
-    return text
-
-def activeBody():
-    if App.ActiveDocument is None: return None
-    if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
-        return None
-    return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
-
-def CreateFaceExtrude(name):
-    App.ActiveDocument.openTransaction("Create FaceExtrude")
-    FreeCADGui.addModule("FaceExtrude")
-    FreeCADGui.doCommand("f = FaceExtrude.create(name = '"+name+"')")
-#    FreeCADGui.doCommand("f.Base = FreeCADGui.Selection.getSelection()[0]")
-#    FreeCADGui.doCommand("lattice2Executer.executeFeature(f)")
-#    FreeCADGui.doCommand("f.Spine.ViewObject.hide()")
-    FreeCADGui.doCommand("f = None")
-    App.ActiveDocument.commitTransaction()
-
-class _CommandFaceExtrude:
-    "Command to create FaceExtrude feature"
-    def GetResources(self):
-        return {'Pixmap'  : str(Path(__file__).parent / 'FaceExtrude.svg'),
-                'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_FaceExtrude","FaceExtrude"),
-                'Accel': "",
-                'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_FaceExtrude","Extrude individual shapes in a compound shape")}
+if App.GuiUp:
+    from PySide import QtCore
+    from PySide import QtGui
+
+    def translate(context, text, disambig):
+        #FaceExtrude is not translatable, sorry...
+        return text
+
+    def activeBody():
+        if App.ActiveDocument is None: return None
+        if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
+            return None
+        return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
+
+    def CreateFaceExtrude(name):
+        App.ActiveDocument.openTransaction("Create FaceExtrude")
+        FreeCADGui.addModule("FaceExtrude")
+        FreeCADGui.doCommand("f = FaceExtrude.create(name = '"+name+"')")
+    #    FreeCADGui.doCommand("f.Base = FreeCADGui.Selection.getSelection()[0]")
+    #    FreeCADGui.doCommand("lattice2Executer.executeFeature(f)")
+    #    FreeCADGui.doCommand("f.Spine.ViewObject.hide()")
+        FreeCADGui.doCommand("f = None")
+        App.ActiveDocument.commitTransaction()
+
+    class _CommandFaceExtrude:
+        "Command to create FaceExtrude feature"
+        def GetResources(self):
+            return {'Pixmap'  : str(Path(__file__).parent / 'FaceExtrude.svg'),
+                    'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_FaceExtrude","FaceExtrude"),
+                    'Accel': "",
+                    'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_FaceExtrude","Extrude individual shapes in a compound shape")}
         
-    def Activated(self):
-        if len(FreeCADGui.Selection.getSelection()) == 1 :
-            CreateFaceExtrude(name = "FaceExtrude")
-        else:
-            mb = QtGui.QMessageBox()
-            mb.setIcon(mb.Icon.Warning)
-            mb.setText(translate("4Axis_FaceExtrude", "Select a shape that is a compound first!", None))
-            mb.setWindowTitle(translate("4axis_FaceExtrude","Bad selection", None))
-            mb.exec_()
+        def Activated(self):
+            if len(FreeCADGui.Selection.getSelection()) == 1 :
+                CreateFaceExtrude(name = "FaceExtrude")
+            else:
+                mb = QtGui.QMessageBox()
+                mb.setIcon(mb.Icon.Warning)
+                mb.setText(translate("4Axis_FaceExtrude", "Select a shape that is a compound first!", None))
+                mb.setWindowTitle(translate("4axis_FaceExtrude","Bad selection", None))
+                mb.exec_()
             
-    def IsActive(self):
-        if App.ActiveDocument:
-            return activeBody() is None
-        else:
-            return False
+        def IsActive(self):
+            if App.ActiveDocument:
+                return activeBody() is None
+            else:
+                return False
             
-if App.GuiUp:
-    FreeCADGui.addCommand('4Axis_FaceExtrude', _CommandFaceExtrude())
-    print("Added Command")
+    if not '4Axis_FaceExtrude' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
+        FreeCADGui.addCommand('4Axis_FaceExtrude', _CommandFaceExtrude())
+        print("Added Command")
 
-exportedCommands = ['4Axis_FaceExtrude']
-print("I am FaceExtrude!")
+    exportedCommands = ['4Axis_FaceExtrude']
+    print("I am FaceExtrude!")
 # -------------------------- /Gui command --------------------------------------------------
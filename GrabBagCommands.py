@@ -0,0 +1,100 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+
+# Lazy command registry.
+#
+# Every tool module pulls in PySide, FreeCADGui and friends and registers its
+# command when imported. Importing all of them from InitGui makes every FreeCAD
+# launch pay for tools nobody has clicked yet, so the commands are registered
+# here from static metadata and the real module is only imported the first time
+# the command is activated. Documents containing GrabBag features import the
+# module on their own when the pickled proxy is restored.
+
+import importlib
+from pathlib import Path
+
+import FreeCAD as App
+
+_here = Path(__file__).parent
+
+# command name: (module, command class, icon, menu text, tooltip)
+Commands = {
+	'4Axis_PathHelix':	('PathHelix', '_CommandPathHelix', 'PathHelix.svg', 'PathHelix',
+		"Create a Helix that follows a path.\nSelect an object with a single edge as a path.\nOptionally select a second object with a single edge as a guide."),
+	'4Axis_Extruder':	('Extruder', '_CommandExtruder', 'Extruder.svg', 'Extruder',
+		"Extrude each shape of a compound individually along its normal"),
+	'4Axis_FaceExtrude':	('FaceExtrude', '_CommandFaceExtrude', 'FaceExtrude.svg', 'FaceExtrude',
+		"Extrude a single face of a shape along its normal"),
+	'4Axis_PipeLoft':	('PipeLoft', '_CommandPipeLoft', 'PipeLoft.svg', 'PipeLoft',
+		"Create a loft between 2 pipe-like faces"),
+	'4Axis_NormalLine':	('NormalLine', '_CommandNormalLine', 'NormalLine.svg', 'NormalLine',
+		"Create a line normal to the selected feature (generally a face or a closed planar edge)"),
+	'4Axis_WireBinder':	('WireBinder', '_CommandWireBinder', 'WireBinder.svg', 'WireBinder',
+		"Bind selected wires of a shape by number"),
+	'4Axis_Sine':		('Sine', '_CommandSine', 'Sine.svg', 'Sine',
+		"Create a sine wave wrapped around a circle or a sphere"),
+	'4Axis_RibThread':	('RibThread', '_CommandRibThread', 'RibThread.svg', 'RibThread',
+		"Create a hole cutting tool that leaves ribs for cutting threads with a machine bolt"),
+	'4Axis_Teardrop':	('TearDrop', '_CommandTeardrop', 'TearDrop.svg', 'Teardrop',
+		"Create a hole cutting tool with a tear drop shape at the top"),
+	'4Axis_ToBiArcs':	('BiArc', '_CommandToBiArcs', 'ToBiArcs.svg', 'ToBiArcs',
+		"Convert a curve into arcs and lines, optionally splitting it"),
+	'4Axis_Recompose':	('Recompose', '_CommandRecompose', 'Recompose.svg', 'Recompose',
+		"Automatically split a curve using several different approaches"),
+	'4Axis_SineWall':	('SineWall', '_CommandSineWall', 'SineWall.svg', 'SineWall',
+		"Create a sine wave that follows the outline of a face"),
+	'4Axis_ProfileReport':	('Profiler', '_CommandProfileReport', None, 'GrabBag profiler',
+		"Toggle recompute profiling of GrabBag features and report the results"),
+}
+
+class _LazyCommand:
+	"Stand-in command that imports the real tool module on first use"
+	def __init__(self, name):
+		self.name = name
+		self.module, self.cmdClass, self.icon, self.menuText, self.toolTip = Commands[name]
+		self.cmd = None
+
+	def load(self):
+		if self.cmd is None:
+			mod = importlib.import_module(self.module)
+			self.cmd = getattr(mod, self.cmdClass)()
+		return self.cmd
+
+	def GetResources(self):
+		res = {'MenuText': self.menuText,
+			'Accel': "",
+			'ToolTip': self.toolTip}
+		if self.icon:
+			res['Pixmap'] = str(_here / self.icon)
+		return res
+
+	def Activated(self):
+		self.load().Activated()
+
+	def IsActive(self):
+		if self.cmd is None:	# don't import the tool just to grey out a button
+			return App.ActiveDocument is not None
+		return self.cmd.IsActive()
+
+def register():
+	import FreeCADGui
+
+	for name in Commands:
+		FreeCADGui.addCommand(name, _LazyCommand(name))
+
+exportedCommands = list(Commands)
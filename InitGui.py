@@ -1,15 +1,6 @@
-import PathHelix
-import Extruder
-import FaceExtrude
-import PipeLoft
-import NormalLine
-import WireBinder
-import Sine
-import RibThread
-import TearDrop
-import BiArc
-import Recompose
-import SineWall
-#import PlaceEdges
+# Tool modules are imported lazily, see GrabBagCommands.py
+import FreeCAD
+import GrabBagCommands
 
-print("This is a test!")
+if FreeCAD.GuiUp:
+	GrabBagCommands.register()
@@ -16,10 +16,13 @@
 #   Suite 330, Boston, MA  02111-1307, USA
 #                                                                         
 
-import Draft, Part, FreeCADGui
+import Part
 import FreeCAD as App
+if App.GuiUp:
+	import FreeCADGui
 import os
 from pathlib import Path
+from grabbag import profiler, fingerprint
 
 def computeRadialTangent(normal, vertex, center, angle):
 	radial = vertex.Point - center
@@ -75,6 +78,7 @@ def computeShape(Object, sub, length, reverse=False, angle=0, U=0, V=0):
 
 	return ex
 
+@profiler.instrumented
 class NormalLine:
 	def __init__(self, obj):
 		obj.Proxy = self
@@ -90,6 +94,7 @@ class NormalLine:
 	def onDocumentRestored(self, obj):
 		pass
 
+	@fingerprint.cached
 	def execute(self, obj):
 		print(obj.Base)
 		o=obj.Base[0][0]
@@ -284,48 +289,49 @@ def create(name=NormalLine):
 
 # -------------------------- Gui command --------------------------------------------------
 
-from PySide import QtCore
-from PySide import QtGui
-
-def translate(context, text, disambig):
-    #NormalLine is not translatable, sorry...
-    return text
-
-def activeBody():
-    if App.ActiveDocument is None: return None
-    if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
-        return None
-    return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
-
-def CreateNormalLine(name):
-    App.ActiveDocument.openTransaction("Create NormalLine")
-    FreeCADGui.addModule("NormalLine")
-    FreeCADGui.doCommand("f = NormalLine.create(name = '"+name+"')")
-    FreeCADGui.doCommand("f = None")
-    App.ActiveDocument.commitTransaction()
-
-class _CommandNormalLine:
-    "Command to create NormalLine feature"
-    def GetResources(self):
-        return {'Pixmap'  : str(Path(__file__).parent / 'NormalLine.svg'),
-                'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_NormalLine","NormalLine"),
-                'Accel': "",
-                'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_NormalLine","Create a line normal to the selected feature (generally a face or a closed planar edge)")}
+if App.GuiUp:
+    from PySide import QtCore
+    from PySide import QtGui
+
+    def translate(context, text, disambig):
+        #NormalLine is not translatable, sorry...
+        return text
+
+    def activeBody():
+        if App.ActiveDocument is None: return None
+        if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
+            return None
+        return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
+
+    def CreateNormalLine(name):
+        App.ActiveDocument.openTransaction("Create NormalLine")
+        FreeCADGui.addModule("NormalLine")
+        FreeCADGui.doCommand("f = NormalLine.create(name = '"+name+"')")
+        FreeCADGui.doCommand("f = None")
+        App.ActiveDocument.commitTransaction()
+
+    class _CommandNormalLine:
+        "Command to create NormalLine feature"
+        def GetResources(self):
+            return {'Pixmap'  : str(Path(__file__).parent / 'NormalLine.svg'),
+                    'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_NormalLine","NormalLine"),
+                    'Accel': "",
+                    'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_NormalLine","Create a line normal to the selected feature (generally a face or a closed planar edge)")}
         
-    def Activated(self):
-        CreateNormalLine(name = "NormalLine")
+        def Activated(self):
+            CreateNormalLine(name = "NormalLine")
             
-    def IsActive(self):
-        return True
-        if App.ActiveDocument:
-            return activeBody() is None
-        else:
-            return False
+        def IsActive(self):
+            return True
+            if App.ActiveDocument:
+                return activeBody() is None
+            else:
+                return False
             
-if App.GuiUp:
-    FreeCADGui.addCommand('4Axis_NormalLine', _CommandNormalLine())
-    print("Added Command")
+    if not '4Axis_NormalLine' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
+        FreeCADGui.addCommand('4Axis_NormalLine', _CommandNormalLine())
+        print("Added Command")
 
-exportedCommands = ['4Axis_NormalLine']
-print("I am NormalLine!")
+    exportedCommands = ['4Axis_NormalLine']
+    print("I am NormalLine!")
 # -------------------------- /Gui command --------------------------------------------------
@@ -16,142 +16,17 @@
 #   Suite 330, Boston, MA  02111-1307, USA
 #                                                                         
 
-import Part, FreeCADGui
+import Part
 import FreeCAD as App
 import os
 from pathlib import Path
-from math import sin, cos, pi
-
-def radiusToGuide(p0,p1,guide):
-	N=p1-p0
-	N.normalize()
-	plane = Part.Plane(p0,N)
-
-	rp=guide.intersect(plane)[0]
-	# rp may be multiple points
-	rp = [p0.distanceToPoint(App.Vector(p.X,p.Y,p.Z)) for p in rp]	# convert Point to Vector then find distance to p0
-
-	return min(rp)
-
-def ComputePlane2d(angle):
-	y=sin(angle)
-	x=cos(angle)
-	z=0
-	return App.Vector(x,y,z)
-
-def computeRadial(v0,v1, angle, radius):#	-- start and end are vectors representing the sample point and the next sample point on the path
-	axis=v1-v0
-	axis.normalize()
-	u=ComputePlane2d(angle) * radius
-
-	Z=App.Vector(0,0,1)	# since the plane lies on XY
-	Y=App.Vector(0,1,0)
-
-	if abs(Z*axis) > abs(Y*axis): # compute u axis basis vector
-		y=axis.cross(Y)
-	else:
-		y=axis.cross(Z)
-
-	y.normalize()
-
-	t=axis.cross(y)		# compute x axis basis vector
-	t.normalize()
-	m=App.Matrix(t,y,axis)	# build a matrix to project the UV space into 3D space
-	v=m*u
-	return v	# Apply the transformed vector so that the origin is on the path.
-
-def DoesIntersect(line,face):
-	i=face.Surface.intersect(line)[0]
-
-	v = [ App.Vector(j.X,j.Y,j.Z) for j in i]
-	return [ i for i in v if face.isInside(i,0.001,True) ]	# Surface.intersect can return false positives sometimes, I don't know why
-								# face.isInside removes those
-
-def findIntersect(p, p1, theta, s):    # p is point as vector, v is direction from point, s is list of surfaves that might intersect.
-	v=computeRadial(p,p1, theta, 1)
-	v.normalize()
-	q = p+v*1000
-	ls=Part.LineSegment(p,q)
-	
-	i= [ DoesIntersect(ls,f) for f in s]
-	i = sum(i,[])
-	d= [ p.distanceToPoint(po) for po in i]
-	return p+(min(d)*v)
-
-def MakeHelix(path, pitch, radius, cont=0, rotation=0, direction=1, join=False, Guide=None, res=4):
-	PathDistance=path.Length*res/pitch	# 4 sample points per turn
-	print("distance=",PathDistance)
-	pathPoints = path.discretize(Distance=path.Length/PathDistance)
-#	print("pathPoints=", pathPoints)
-
-	radialPoints = []
-
-	angle=rotation
-	increment = (-2*pi)*direction/res
-	rad = radius
-	for i in range(len(pathPoints)-1):
-		if Guide:
-			rad = radiusToGuide(pathPoints[i], pathPoints[i+1], Guide.Curve)
-		radialPoints.append( computeRadial(pathPoints[i], pathPoints[i+1], angle, rad) + pathPoints[i] )
-		angle = (angle+increment)%(2*pi)
-	if(cont):
-		i = len(pathPoints)-2
-		for x in range(cont):
-			radialPoints.append( computeRadial(pathPoints[i], pathPoints[i+1], angle, rad) + pathPoints[i] )
-			angle = (angle+increment)%(2*pi)
-
-	if path.isClosed():
-		radialPoints.append(radialPoints[0])
-		
-	arcs=[]
-	for i in range(0,len(radialPoints),2):
-		try:
-			arcs.append(Part.Arc(radialPoints[i], radialPoints[i+1], radialPoints[i+2]))
-		except:
-			print(f"Arc failed {radialPoints[i]}, {radialPoints[i]},{radialPoints[i]}")
-			pass
-
-
-	if join:
-		bs = [ a.toBSpline(a.FirstParameter, a.LastParameter) for a in arcs ]
-		b = bs[0]
-		[ b.join(e) for e in bs[1:] ]
-		return b.toShape()
-
-	shp=Part.Shape(arcs)
-	w = Part.Wire(shp.Edges)
-	print("W=",w)
-
-	return w
-
-def FillHelix(path, pitch, shape, rotation=0, direction=1, res=128):
-	PathDistance=path.Length*res/pitch	# 4 sample points per turn
-	print("distance=",PathDistance)
-	pathPoints = path.discretize(Distance=path.Length/PathDistance)
-
-	shp = shape.Shape.Faces
-	print(f"FillHelix shp={shp}")
-
-	angle=rotation
-	increment = (-2*pi)*direction/res
-
-	radialPoints = []
-	for i in range(len(pathPoints)-1):
-		radialPoints.append(findIntersect(pathPoints[i], pathPoints[i+1], angle, shp))
-		angle = (angle+increment)%(2*pi)
-
-	if path.isClosed():
-		radialPoints.append(radialPoints[0])
-
-	b = Part.BSplineCurve(radialPoints)
-
-	# need to approximate the BSplineCurve so it can work in a sweep
-	c=b.toBiArcs(0.001)
-	e=[ i.toBSpline(i.FirstParameter, i.LastParameter) for i in c]
-	c=e[0]
-	[ c.join(i) for i in e[1:]]
-	return c.toShape()
+from grabbag import profiler, fingerprint, pool, progress
+from math import pi
+from grabbag.core.helix import MakeHelix, FillHelix
+if App.GuiUp:
+	import FreeCADGui
 
+@profiler.instrumented
 class PathHelix:
 	def __init__(self, obj):
 		obj.Proxy = self
@@ -166,12 +41,14 @@ class PathHelix:
 		obj.addProperty("App::PropertyBool", "Reverse", "Dimensions").Reverse=False
 		obj.addProperty("App::PropertyBool", "Join", "Dimensions").Join=True
 		obj.addProperty("App::PropertyLink", "FillShape", "Fill")
-
+		fingerprint.addProperties(obj)
+		pool.addProperties(obj)
 
 	def onDocumentRestored(self, obj):
 		if (not hasattr(obj,"Reverse")):
 			obj.addProperty("App::PropertyBool", "Reverse", "Dimensions").Reverse=False
-		obj.ViewObject.Proxy.fp = obj
+		if obj.ViewObject:	# None in FreeCADCmd
+			obj.ViewObject.Proxy.fp = obj
 		if (not hasattr(obj,"Join")):
 			obj.addProperty("App::PropertyBool", "Join", "Dimensions").Join=False
 
@@ -184,23 +61,41 @@ class PathHelix:
 		if (not hasattr(obj,"Resolution")):
 			obj.addProperty("App::PropertyInteger", "Resolution", "Dimensions")
 
+		fingerprint.addProperties(obj)
+		pool.addProperties(obj)
+		fingerprint.restore(self, obj)
+
+	@fingerprint.cached
+	@progress.reporting
 	def execute(self, obj):
 		print("Spine=", obj.Spine.Shape)
 		if obj.FillShape:
 			if obj.Resolution<4:
 				obj.Resolution=16
-			w=FillHelix(obj.Spine.Shape, obj.Pitch, obj.FillShape, rotation=obj.Rotation*pi/180, direction= -1 if(obj.Reverse) else 1, res=obj.Resolution)
+			w=FillHelix(obj.Spine.Shape, obj.Pitch, obj.FillShape.Shape, rotation=obj.Rotation*pi/180, direction= -1 if(obj.Reverse) else 1, res=obj.Resolution, progress=progress.current())
 		else:
 			edge=None
 			if obj.Resolution<4:
 				obj.Resolution=8
 			if obj.Guide:
 				edge=obj.Guide.Shape.Edge1
-			w = MakeHelix(obj.Spine.Shape, obj.Pitch, obj.Radius, rotation=obj.Rotation*pi/180, cont=2 if(obj.ExtraHalf) else 0, direction= -1 if(obj.Reverse) else 1, join=obj.Join, Guide=edge)
+			w = MakeHelix(obj.Spine.Shape, obj.Pitch, obj.Radius, rotation=obj.Rotation*pi/180, cont=2 if(obj.ExtraHalf) else 0, direction= -1 if(obj.Reverse) else 1, join=obj.Join, Guide=edge, progress=progress.current())
 		obj.Shape=w
 #		Part.show(obj.Shape)
 
+	def offload(self, obj):
+		"job for grabbag.pool, see grabbag.worker"
+		direction = -1 if(obj.Reverse) else 1
+		spine = obj.Spine.Shape.exportBrepToString()
+		if obj.FillShape:
+			res = obj.Resolution if obj.Resolution>=4 else 16
+			return ('fillHelix', (spine, obj.Pitch, obj.FillShape.Shape.exportBrepToString(), obj.Rotation*pi/180, direction, res))
+		guide = obj.Guide.Shape.Edge1.exportBrepToString() if obj.Guide else None
+		return ('helix', (spine, obj.Pitch, obj.Radius, 2 if(obj.ExtraHalf) else 0, obj.Rotation*pi/180, direction, obj.Join, guide))
+
 	def onChanged(self, obj, name):
+		if obj.Document.Restoring:	# don't recompute while the document is loading
+			return
 		l = obj.Spine.Shape.Length
 		print("onChanged", name, l)
 		if (name == "Count"):
@@ -350,53 +245,54 @@ def create(name="PathHelix", obj=None):
 
 # -------------------------- Gui command --------------------------------------------------
 
-from PySide import QtCore, QtGui
-
-
-def activeBody():
-    if App.ActiveDocument is None: return None
-    if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
-        return None
-    return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
-
-def CreatePathHelix(name):
-    App.ActiveDocument.openTransaction("Create PathHelix")
-    FreeCADGui.addModule("PathHelix")
-    FreeCADGui.doCommand("f = PathHelix.create(name = '"+name+"')")
-#    FreeCADGui.doCommand("f.Base = FreeCADGui.Selection.getSelection()[0]")
-#    FreeCADGui.doCommand("lattice2Executer.executeFeature(f)")
-#    FreeCADGui.doCommand("f.Spine.ViewObject.hide()")
-    FreeCADGui.doCommand("f = None")
-    App.ActiveDocument.commitTransaction()
-
-class _CommandPathHelix:
-    "Command to create PathHelix feature"
-    def GetResources(self):
-        return {'Pixmap'  : str(Path(__file__).parent / 'PathHelix.svg'),
-                'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_PathHelix","PathHelix"),
-                'Accel': "",
-                'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_PathHelix","Create a Helix that follows a path.\nSelect an object with a single edge as a path.\nOptionally select a second object with a single edge as a guide.")}
+if App.GuiUp:
+    from PySide import QtCore, QtGui
+
+
+    def activeBody():
+        if App.ActiveDocument is None: return None
+        if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
+            return None
+        return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
+
+    def CreatePathHelix(name):
+        App.ActiveDocument.openTransaction("Create PathHelix")
+        FreeCADGui.addModule("PathHelix")
+        FreeCADGui.doCommand("f = PathHelix.create(name = '"+name+"')")
+    #    FreeCADGui.doCommand("f.Base = FreeCADGui.Selection.getSelection()[0]")
+    #    FreeCADGui.doCommand("lattice2Executer.executeFeature(f)")
+    #    FreeCADGui.doCommand("f.Spine.ViewObject.hide()")
+        FreeCADGui.doCommand("f = None")
+        App.ActiveDocument.commitTransaction()
+
+    class _CommandPathHelix:
+        "Command to create PathHelix feature"
+        def GetResources(self):
+            return {'Pixmap'  : str(Path(__file__).parent / 'PathHelix.svg'),
+                    'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_PathHelix","PathHelix"),
+                    'Accel': "",
+                    'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_PathHelix","Create a Helix that follows a path.\nSelect an object with a single edge as a path.\nOptionally select a second object with a single edge as a guide.")}
         
-    def Activated(self):
-        if len(FreeCADGui.Selection.getSelection()) >= 1 :
-            CreatePathHelix(name = "PathHelix")
-        else:
-            mb = QtGui.QMessageBox()
-            mb.setIcon(mb.Icon.Warning)
-            mb.setText(QtCore.QT_TRANSLATE_NOOP("4Axis_PathHelix", "Select a shape with a single edge first!"))
-            mb.setWindowTitle(QtCore.QT_TRANSLATE_NOOP("4axis_PathHelix","Bad selection"))
-            mb.exec_()
+        def Activated(self):
+            if len(FreeCADGui.Selection.getSelection()) >= 1 :
+                CreatePathHelix(name = "PathHelix")
+            else:
+                mb = QtGui.QMessageBox()
+                mb.setIcon(mb.Icon.Warning)
+                mb.setText(QtCore.QT_TRANSLATE_NOOP("4Axis_PathHelix", "Select a shape with a single edge first!"))
+                mb.setWindowTitle(QtCore.QT_TRANSLATE_NOOP("4axis_PathHelix","Bad selection"))
+                mb.exec_()
             
-    def IsActive(self):
-        if App.ActiveDocument:
-            return activeBody() is None
-        else:
-            return False
+        def IsActive(self):
+            if App.ActiveDocument:
+                return activeBody() is None
+            else:
+                return False
             
-if App.GuiUp:
-    FreeCADGui.addCommand('4Axis_PathHelix', _CommandPathHelix())
-    print("Added Command")
+    if not '4Axis_PathHelix' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
+        FreeCADGui.addCommand('4Axis_PathHelix', _CommandPathHelix())
+        print("Added Command")
 
-exportedCommands = ['4Axis_PathHelix']
+    exportedCommands = ['4Axis_PathHelix']
 
 # -------------------------- /Gui command --------------------------------------------------
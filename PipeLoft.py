@@ -16,10 +16,13 @@
 #   Suite 330, Boston, MA  02111-1307, USA
 #                                                                         
 
-import Draft, Part, FreeCADGui
+import Part
 import FreeCAD as App
+if App.GuiUp:
+	import FreeCADGui
 import os
 from pathlib import Path
+from grabbag import profiler, fingerprint
 
 def getFace(sublink):
 	if not sublink[1]:
@@ -41,6 +44,7 @@ def makePipeShape(From, To, UnTwist):
 	p = l[0].cut(l[1:])
 	return p
 
+@profiler.instrumented
 class PipeLoft:
 	def __init__(self, obj):
 		obj.Proxy = self
@@ -51,8 +55,10 @@ class PipeLoft:
 	def onDocumentRestored(self, obj):
 		if (not hasattr(obj,"UnTwist")):
 			obj.addProperty("App::PropertyBool", "UnTwist", "Dimensions").UnTwist=False
-		obj.ViewObject.Proxy.fp = obj
+		if obj.ViewObject:	# None in FreeCADCmd
+			obj.ViewObject.Proxy.fp = obj
 
+	@fingerprint.cached
 	def execute(self, obj):
 		From=(obj.Base[0][0],obj.Base[0][1][0])
 		To=(obj.Base[1][0],obj.Base[1][1][0])
@@ -190,57 +196,58 @@ def create(name="PipeLoft"):
 
 # -------------------------- Gui command --------------------------------------------------
 
-from PySide import QtCore
-from PySide import QtGui
-
-def translate(context, text, disambig):
-    #PipeLoft is not translatable, sorry...
-    return text
-
-def activeBody():
-    if App.ActiveDocument is None: return None
-    if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
-        return None
-    return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
-
-def CreatePipeLoft(name):
-    App.ActiveDocument.openTransaction("Create PipeLoft")
-    FreeCADGui.addModule("PipeLoft")
-    FreeCADGui.doCommand("f = PipeLoft.create(name = '"+name+"')")
-#    FreeCADGui.doCommand("f.Base = FreeCADGui.Selection.getSelection()[0]")
-#    FreeCADGui.doCommand("lattice2Executer.executeFeature(f)")
-#    FreeCADGui.doCommand("f.Spine.ViewObject.hide()")
-    FreeCADGui.doCommand("f = None")
-    App.ActiveDocument.commitTransaction()
-
-class _CommandPipeLoft:
-    "Command to create PipeLoft feature"
-    def GetResources(self):
-        return {'Pixmap'  : str(Path(__file__).parent / 'PipeLoft.svg'),
-                'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_PipeLoft","PipeLoft"),
-                'Accel': "",
-                'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_PipeLoft","Create a loft between 2 pipe-like faces")}
+if App.GuiUp:
+    from PySide import QtCore
+    from PySide import QtGui
+
+    def translate(context, text, disambig):
+        #PipeLoft is not translatable, sorry...
+        return text
+
+    def activeBody():
+        if App.ActiveDocument is None: return None
+        if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
+            return None
+        return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
+
+    def CreatePipeLoft(name):
+        App.ActiveDocument.openTransaction("Create PipeLoft")
+        FreeCADGui.addModule("PipeLoft")
+        FreeCADGui.doCommand("f = PipeLoft.create(name = '"+name+"')")
+    #    FreeCADGui.doCommand("f.Base = FreeCADGui.Selection.getSelection()[0]")
+    #    FreeCADGui.doCommand("lattice2Executer.executeFeature(f)")
+    #    FreeCADGui.doCommand("f.Spine.ViewObject.hide()")
+        FreeCADGui.doCommand("f = None")
+        App.ActiveDocument.commitTransaction()
+
+    class _CommandPipeLoft:
+        "Command to create PipeLoft feature"
+        def GetResources(self):
+            return {'Pixmap'  : str(Path(__file__).parent / 'PipeLoft.svg'),
+                    'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_PipeLoft","PipeLoft"),
+                    'Accel': "",
+                    'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_PipeLoft","Create a loft between 2 pipe-like faces")}
         
-    def Activated(self):
-        if len(FreeCADGui.Selection.getSelection()) == 2 :
-            CreatePipeLoft(name = "PipeLoft")
-        else:
-            mb = QtGui.QMessageBox()
-            mb.setIcon(mb.Icon.Warning)
-            mb.setText(translate("4Axis_PipeLoft", "Select two faces first!", None))
-            mb.setWindowTitle(translate("4axis_PipeLoft","Bad selection", None))
-            mb.exec_()
+        def Activated(self):
+            if len(FreeCADGui.Selection.getSelection()) == 2 :
+                CreatePipeLoft(name = "PipeLoft")
+            else:
+                mb = QtGui.QMessageBox()
+                mb.setIcon(mb.Icon.Warning)
+                mb.setText(translate("4Axis_PipeLoft", "Select two faces first!", None))
+                mb.setWindowTitle(translate("4axis_PipeLoft","Bad selection", None))
+                mb.exec_()
             
-    def IsActive(self):
-        if App.ActiveDocument:
-            return activeBody() is None
-        else:
-            return False
+        def IsActive(self):
+            if App.ActiveDocument:
+                return activeBody() is None
+            else:
+                return False
             
-if App.GuiUp:
-    FreeCADGui.addCommand('4Axis_PipeLoft', _CommandPipeLoft())
-    print("Added Command")
+    if not '4Axis_PipeLoft' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
+        FreeCADGui.addCommand('4Axis_PipeLoft', _CommandPipeLoft())
+        print("Added Command")
 
-exportedCommands = ['4Axis_PipeLoft']
-print("I am PipeLoft!")
+    exportedCommands = ['4Axis_PipeLoft']
+    print("I am PipeLoft!")
 # -------------------------- /Gui command --------------------------------------------------
@@ -0,0 +1,71 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+import FreeCAD as App
+if App.GuiUp:
+	import FreeCADGui
+import os, time
+from grabbag import profiler, fingerprint, scheduler
+from grabbag.core.biarc import biArcCache, MB
+from grabbag.core.biarctable import tableCache
+
+def profileDir():
+	d = os.path.join(App.getUserAppDataDir(), 'GrabBag')
+	os.makedirs(d, exist_ok=True)
+	return d
+
+def showReport():
+	"print the report, dump the json/cProfile files and return their base name"
+	base = os.path.join(profileDir(), time.strftime('profile-%Y%m%d-%H%M%S'))
+	App.Console.PrintMessage(profiler.report() + "\n")
+	App.Console.PrintMessage("Input fingerprint cache:\n" + fingerprint.report() + "\n")
+	App.Console.PrintMessage(scheduler.report() + "\n")
+	App.Console.PrintMessage("Biarc cache: " + biArcCache.report(MB, ' MB') + "\n")
+	App.Console.PrintMessage("Biarc table cache: " + tableCache.report(MB, ' MB') + "\n")
+	profiler.dump(base)
+	App.Console.PrintMessage(f"GrabBag profile written to {base}.json and {base}.prof\n")
+	return base
+
+# -------------------------- Gui command --------------------------------------------------
+
+if App.GuiUp:
+	class _CommandProfileReport:
+		"Command to toggle GrabBag profiling and report the results"
+		def GetResources(self):
+			return {'MenuText': "GrabBag profiler",
+				'Accel': "",
+				'ToolTip': "First use switches recompute profiling of GrabBag features on.\nUse again after a recompute to print the report, write it to disk and switch profiling off."}
+
+		def Activated(self):
+			if not profiler.enabled:
+				profiler.clear()
+				profiler.enable()
+				App.Console.PrintMessage("GrabBag profiling enabled, recompute and use the command again for the report\n")
+				return
+			profiler.disable()
+			showReport()
+			profiler.clear()
+
+		def IsActive(self):
+			return True
+
+	if not '4Axis_ProfileReport' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
+		FreeCADGui.addCommand('4Axis_ProfileReport', _CommandProfileReport())
+
+	exportedCommands = ['4Axis_ProfileReport']
+# -------------------------- /Gui command --------------------------------------------------
@@ -16,180 +16,22 @@
 #   Suite 330, Boston, MA  02111-1307, USA
 #                                                                         
 
-import Draft, Part, FreeCADGui
+import Part
 import FreeCAD as App
+if App.GuiUp:
+	import FreeCADGui
 import os
 from pathlib import Path
-from MinMaxHelper import ComputeMinMax
-
-
-def parameterization(pts, val):
-	params = [0]
-	for i in range(1, len(pts)):
-		p = pts[i].sub(pts[i - 1])
-		pl = pow(p.Length, val)
-		params.append(params[-1] + pl)
-	m = float(max(params))
-	return [p / m for p in params]
-
-
-def periodic_interpolate(pts, params=None, tol=0):
-	if not params:
-		ptmp = pts + pts[:1]
-		params = parameterization(ptmp,1)
-
-	nbp = len(pts)
-	n = 1
-	if nbp <= 4:
-		n = 2
-	npts = pts
-	npts.extend(pts * (2 * n))
-	period = params[-1] - params[0]
-	nparams = []
-	for p in params:
-		for i in range(1, n + 1):
-			nparams.append(p)
-			nparams.append(p - i * period)
-			nparams.append(p + i * period)
-	npars = list(set(nparams))
-	npars.sort()
-	# interpolate the extended list of points
-	bs = Part.BSplineCurve()
-	bs.interpolate(Points=npts, Parameters=npars, PeriodicFlag=True)
-	# extract a one turn BSpline curve in the middle
-	offset = n * nbp
-	npoles = bs.getPoles()[offset:-offset - 1]
-	nmults = bs.getMultiplicities()[offset:-offset]
-	nknots = bs.getKnots()[offset:-offset]
-	nbs = Part.BSplineCurve()
-	nbs.buildFromPolesMultsKnots(npoles, nmults, nknots, True, 3)
-	return nbs.toShape()
-
-def resampleCurve(e, n, tol=0):
-	inc = e.Length/n
-	points = [ e.valueAt(e.FirstParameter+i*inc) for i in range(n) ]
-	
-	return periodic_interpolate(points, tol=tol)
-
-def EdgeToBiArcs(Edge, tolerance=0.01):
-	if type(Edge.Curve) in [ Part.Line, Part.Circle ]:
-		l=  Edge.Curve.toNurbs(Edge.FirstParameter,Edge.LastParameter)
-		l = l.toBiArcs(tolerance)
-	else:
-		l = Edge.Curve.toBiArcs(tolerance)
-	return l
-
-def makeCumulative(l):
-	acc=0
-
-	for i in l:
-		acc+=i
-		yield acc
-		
-def forceRange(val, rnge):
-	while val<0:
-		val+=rnge
-	while val >= rnge:
-		val -= rnge
-
-	return val
-
-def joinEdges(l):
-	if not l:
-		return None
-	if len(l)==1:
-		return l[0]
-
-	c = [ e.Curve.toBSpline(e.FirstParameter, e.LastParameter) for e in l ]
-	r = c[0]
-	res = [ r.join(i) for i in c[1:] ]
-	if False in res:
-		return False
-
-	return r.toShape()
-
-def moveStart(e,d):
-	p=e.getParameterByLength(d)
-	el = e.split(p).Edges
-	el = [ e.reversed() for e in el]
-	s=joinEdges(el)
-	return s.Edge1
-
-def getRad(c):
-	if type(c) in [Part.Circle, Part.ArcOfCircle]:
-		return c.Radius
-	else:
-		return 1000000
-
-def getStartDistances(l):
-	acc=0
-
-	for e in l:
-		yield(acc)
-		acc+= e.length()
-
-def getLength(l):
-	acc=0
-	for e in l:
-		acc+=e.length()
-	return acc
-
-def getSmallest(c, i,j):
-	minval = getRad(c[i])
-	idx = i
-
-	for k in range(i+1,j):
-		r=getRad(c[k])
-		if r < minval:
-			minval=r
-			idx=k
-
-	return idx
-	
-
-def getRadii(edge, tr, tolerance=0.01):
-	"""
-	given an edge and a radius threshold, return a list of
-	distances where the radius is smallest.
-	"""
-	c = EdgeToBiArcs(edge,tolerance) # c, a list of all biArcs
-
-	active=False
-	regions=[]
-	i=j=k=0
-	for k,e in enumerate(c):
-		if getRad(e) <tr:
-			if not active:
-				i=k
-				active=True
-		else:
-			if active:
-				j=k
-				regions.append( (i,j) )
-				active = False
-
-	dists = [ i for i in getStartDistances(c) ]	# a corresponding list of all distances from the start of the edge
-
-	curveidx=[]
-	for i,j in regions:
-		curveidx.append(getSmallest(c,i,j))
-
-	distances=[]
-	for i in curveidx:
-		l = c[i].length()
-		distances.append(l/2 + dists[i])
-
-	return distances
-
-def getKnotParams(edge):
-	c=edge.Curve
-	k = [ i for i in c.KnotSequence if i > edge.FirstParameter and i < edge.LastParameter ]
-	return k
-#	coeff = edge.Length/(edge.LastParameter - edge.FirstParameter)
-
-#	return [ d*coeff for d in k]
+from grabbag import profiler, fingerprint, progress, scheduler
+from grabbag.core.minmax import ComputeMinMax
+from grabbag.core.biarc import EdgeToBiArcs, cachedBiArcs, getRad, makeCumulative, compactCurve, CompactModes
+from grabbag.split import addSplitPattern, splitPattern
+from grabbag.core.recompose import parameterization, periodic_interpolate, resampleCurve, forceRange, joinEdges, moveStart, getStartDistances, getLength, getSmallest, getRadii, getKnotParams, periodicParameters
 
+@profiler.instrumented
 class Recompose:
+	OutputProperties = ( 'RadiusSplits', 'MaxDeviation', 'PoleCount' )	# written by execute, see grabbag.fingerprint
+
 	def __init__(self, obj):
 		obj.Proxy = self
 		obj.addProperty("App::PropertyLinkList", "Base", "Base")
@@ -214,18 +56,52 @@ class Recompose:
 		obj.addProperty("App::PropertyFloatConstraint", "Threshold", "Radius").Threshold=( 0.0, 0.0, 10000.0, 0.1)
 		obj.addProperty("App::PropertyFloatList", "RadiusSplits", "Radius").RadiusSplits=[]
 		obj.addProperty("App::PropertyBool", "UseRadius", "Radius").UseRadius=False
+		fingerprint.addProperties(obj)
+		self._addProperties(obj)
 
 	def onDocumentRestored(self, obj):
-		obj.ViewObject.Proxy.fp = obj
-
+		if obj.ViewObject:	# None in FreeCADCmd
+			obj.ViewObject.Proxy.fp = obj
+		fingerprint.addProperties(obj)
+		self._addProperties(obj)
+		fingerprint.restore(self, obj)
+
+	def _addProperties(self, obj):
+		"properties added after the first release, for __init__ and onDocumentRestored"
+		addSplitPattern(obj, "Distance")
+		if not hasattr(obj, 'Compact'):
+			obj.addProperty("App::PropertyEnumeration", "Compact", "Compact", "In Approximate mode, reduce the poles of the joined biarcs within Tolerance, by knot removal or by reapproximating them").Compact=CompactModes
+		for name, kind, doc in ( ('MaxDeviation', "App::PropertyFloat", "Largest distance of the compacted curve from the joined biarcs"), ('PoleCount', "App::PropertyInteger", "Poles of the joined biarcs, after Compact") ):
+			if not hasattr(obj, name):
+				obj.addProperty(kind, name, "Compact", doc)
+				obj.setEditorMode(name, 1)
+
+	@fingerprint.cached
+	@progress.reporting
 	def execute(self, obj):
-		if not obj.Base or not obj.Base[0].Shape.isValid():
+		"every valid Base link is recomposed on its own, and only again when it or the settings changed"
+		bases = [ b for b in obj.Base if b.Shape.isValid() ]
+		if not bases:
 			obj.Shape = Part.makeCompound([])
 			return
 
-		s = joinEdges( obj.Base[0].Shape.Edges)
+		key = fingerprint.inputKey(obj, self.OutputProperties)
+		results = fingerprint.perLink(obj, bases, key, lambda base: self._recompose(obj, base))
+
+		radii = [ d for shape, splits, stats in results if splits is not None for d in splits ]
+		if any(splits is not None for shape, splits, stats in results):
+			obj.RadiusSplits = radii
+		stats = [ st for shape, splits, st in results if st is not None ]
+		obj.MaxDeviation = max((d for d, n in stats), default=0.0)
+		obj.PoleCount = sum(n for d, n in stats)
+		shapes = [ shape for shape, splits, stats in results ]
+		obj.Shape = shapes[0] if len(shapes) == 1 else Part.makeCompound(shapes)
+
+	def _recompose(self, obj, base):
+		"the split shape of one Base link, its RadiusSplits (None unless UseRadius) and ( deviation, poles ) in Approximate mode"
+		s = joinEdges( base.Shape.Edges)
 		if not s:
-			raise Exception("{obj.Base[0].Name}:Can't join")
+			raise Exception(f"{base.Name}:Can't join")
 
 		if obj.Start:
 			e=moveStart(s.Edge1, obj.Start)
@@ -237,17 +113,22 @@ class Recompose:
 #			e = resampleCurve(e, obj.Samples, 0)
 
 		if 'Join' in obj.Mode:
-			obj.Shape=e
-			return
+			return e, None, None
 
 		if 'BiArcs' in obj.Mode:
-			c = EdgeToBiArcs(e,obj.Tolerance) # c, a list of all biArcs
-			obj.Shape = Part.makeCompound(c)
-			return
+			c = cachedBiArcs(e,obj.Tolerance) # c, a list of all biArcs
+			return Part.makeCompound(c), None, None
 
 		if 'Approximate' in obj.Mode:
-			c = EdgeToBiArcs(e,obj.Tolerance) # c, a list of all biArcs
+			c = cachedBiArcs(e,obj.Tolerance) # c, a list of all biArcs
 			e= joinEdges(Part.makeCompound(c).Edges)
+			curve = e.Curve	# a new copy every time it's read
+			bs, d = compactCurve(curve, obj.Tolerance, obj.Compact)
+			if bs is not curve:
+				e = bs.toShape()
+			stats = ( d, getattr(bs, 'NbPoles', 0) )
+		else:
+			stats = None
 
 		p = []
 
@@ -259,8 +140,12 @@ class Recompose:
 				params = [ e.getParameterByLength(i) for i in obj.SplitDistances ]
 				p = p + params
 
+			pattern = splitPattern(obj)
+			if pattern:
+				p = p + list(periodicParameters(e, *pattern))
+
 		if obj.UseMinMax:
-			cmm = ComputeMinMax(e, downmode=obj.MinMaxMode)
+			cmm = ComputeMinMax(e, downmode=obj.MinMaxMode, progress=progress.current())
 			if 'Set' in obj.MinMaxMode:
 				cmm.cg = obj.SetCG.Shape.CenterOfGravity
 			p = p + cmm.params
@@ -268,9 +153,10 @@ class Recompose:
 		if obj.UseKnots:
 			p = p + getKnotParams(e)
 
+		radii = None
 		if obj.UseRadius and obj.Threshold:
-			obj.RadiusSplits = getRadii(e, obj.Threshold)
-			params = [ e.getParameterByLength(i) for i in obj.RadiusSplits ]
+			radii = getRadii(e, obj.Threshold)
+			params = [ e.getParameterByLength(i) for i in radii ]
 			p = p + params
 #			print("params=", params)
 
@@ -278,10 +164,13 @@ class Recompose:
 		q = [ i for i in p if i!=e.FirstParameter and i!= e.LastParameter ]
 		w = e.split(q)
 #		print("w=", w)
-		obj.Shape = w
+		return w, radii, stats
 
 	def onChanged(self, obj, name):
-		if not obj.Base or not obj.Base[0].Shape.isValid():
+		if obj.Document.Restoring:	# don't recompute while the document is loading
+			return
+		lengths = [ b.Shape.Length for b in obj.Base if b.Shape.isValid() ]
+		if not lengths:
 			return
 		if name == 'AddDistance':
 			if obj.AddDistance:
@@ -290,17 +179,17 @@ class Recompose:
 				obj.SplitDistances = l
 				obj.AddDistance=False
 #				print("Added")
-		if name == 'SplitDistance':	# keep SplitDistance between 0 and the length of the Base edge
-			v = forceRange(obj.SplitDistance,obj.Base[0].Shape.Length)
+		if name == 'SplitDistance':	# keep SplitDistance between 0 and the length of the longest Base edge
+			v = forceRange(obj.SplitDistance,max(lengths))
 			if obj.SplitDistance != v:
 				obj.SplitDistance = v
-		if name == 'Start':	# keep SplitDistance between 0 and the length of the Base edge
-			v = forceRange(obj.Start,obj.Base[0].Shape.Length)
+		if name == 'Start':	# keep Start between 0 and the length of the longest Base edge
+			v = forceRange(obj.Start,max(lengths))
 			if obj.Start != v:
 				obj.Start = v
 
-		if name in ['Samples', 'Start', 'Threshold', 'Tolerance', 'SplitDistance']:
-			obj.recompute(False)
+		if name in ['Samples', 'Start', 'Threshold', 'Tolerance', 'SplitDistance', 'SplitInterval', 'SplitOffset', 'SplitCount', 'Compact']:
+			scheduler.request(obj)
 #		print("onChanged", name)
 		
 	def __repr__(self):
@@ -392,24 +281,28 @@ def attach(myObj, obj):
 	myObj.AttachmentSupport=obj
 	myObj.MapPathParameter=0
 
-def _create(obj, name="Recompose"):
+def _create(objs, name="Recompose"):
+	if not isinstance(objs, (list, tuple)):
+		objs = [ objs ]
 	myObj = App.ActiveDocument.addObject("Part::FeaturePython", name)
 	Recompose(myObj)
-	myObj.Base= obj 
-	myObj.Placement = obj.Placement
+	myObj.Base= objs
+	if len(objs) == 1:
+		myObj.Placement = objs[0].Placement
 	ViewProviderRecompose(myObj.ViewObject)
-	obj.ViewObject.Visibility=False
+	for obj in objs:
+		obj.ViewObject.Visibility=False
 	App.ActiveDocument.recompute()
 	return myObj
 
 def create(name="Recompose"):
-    sel = FreeCADGui.Selection.getSelectionEx()[0]
-    return _create(sel.Object, name=name)
+    "a Recompose of every selected object"
+    return _create([ sel.Object for sel in FreeCADGui.Selection.getSelectionEx() ], name=name)
 
 # -------------------------- Gui command --------------------------------------------------
 if "FCMacro" in __file__:
 	create()
-else:
+elif App.GuiUp:
 	from PySide import QtCore
 	from PySide import QtGui
 
@@ -448,7 +341,7 @@ else:
 			else:
 				return False
             
-	if App.GuiUp:
+	if not '4Axis_Recompose' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
 		FreeCADGui.addCommand('4Axis_Recompose', _CommandRecompose())
 		print("Added Command")
 
@@ -16,10 +16,13 @@
 #   Suite 330, Boston, MA  02111-1307, USA
 #                                                                         
 
-import Draft, Part, FreeCADGui
+import Part
 import FreeCAD as App
+if App.GuiUp:
+	import FreeCADGui
 import os
 from pathlib import Path
+from grabbag import profiler, fingerprint
 from math import pi, sin,cos
 
 def getXYvec(theta, radius, offset=0):
@@ -62,6 +65,7 @@ def getAttachedRadius(obj):
 	except:
 		return 0
 
+@profiler.instrumented
 class RibThread:
 	def __init__(self, obj):
 		obj.Proxy = self
@@ -79,6 +83,7 @@ class RibThread:
 #			obj.addProperty("App::PropertyBool", "Reverse", "Dimensions").Reverse=False
 #		obj.ViewObject.Proxy.fp = obj
 
+	@fingerprint.cached
 	def execute(self, obj):
 		dia = obj.Diameter
 		if not dia:
@@ -219,7 +224,7 @@ def create(name='RibThread'):
 
 if "FCMacro" in __file__:
 	create()
-else:
+elif App.GuiUp:
 	from PySide import QtCore
 	from PySide import QtGui
 
@@ -259,7 +264,7 @@ else:
 			else:
 				return False
 		    
-	if App.GuiUp:
+	if not '4Axis_RibThread' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
 		FreeCADGui.addCommand('4Axis_RibThread', _CommandRibThread())
 		print("Added Command")
 
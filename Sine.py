@@ -16,10 +16,13 @@
 #   Suite 330, Boston, MA  02111-1307, USA
 #                                                                         
 
-import Draft, Part, FreeCADGui
+import Part
 import FreeCAD as App
+if App.GuiUp:
+	import FreeCADGui
 import os
 from pathlib import Path
+from grabbag import profiler, fingerprint
 import math
 
 def computeRadialTangent(normal, vertex, center, angle):
@@ -86,6 +89,7 @@ def computeShape(radius, magnitude, frequency, phase, num, phi=0):
 	
 
 
+@profiler.instrumented
 class Sine:
 	def __init__(self, obj):
 		obj.Proxy = self
@@ -103,6 +107,7 @@ class Sine:
 	def onDocumentRestored(self, obj):
 		pass
 
+	@fingerprint.cached
 	def execute(self, obj):
 		if obj.Type == 'Circular':
 			obj.Shape=computeShape(obj.Radius, obj.Amplitude, obj.Frequency, obj.Phase, obj.Num, obj.Phi)
@@ -224,48 +229,49 @@ def create(name="Sine"):
 
 # -------------------------- Gui command --------------------------------------------------
 
-from PySide import QtCore
-from PySide import QtGui
-
-def translate(context, text, disambig):
-    #Sine is not translatable, sorry...
-    return text
-
-def activeBody():
-    if App.ActiveDocument is None: return None
-    if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
-        return None
-    return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
-
-def CreateSine(name):
-    App.ActiveDocument.openTransaction("Create Sine")
-    FreeCADGui.addModule("Sine")
-    FreeCADGui.doCommand("f = Sine.create(name = '"+name+"')")
-    FreeCADGui.doCommand("f = None")
-    App.ActiveDocument.commitTransaction()
-
-class _CommandSine:
-    "Command to create Sine feature"
-    def GetResources(self):
-        return {'Pixmap'  : str(Path(__file__).parent / 'Sine.svg'),
-                'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_Sine","Sine"),
-                'Accel': "",
-                'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_Sine","Extrude individual shapes in a compound shape")}
+if App.GuiUp:
+    from PySide import QtCore
+    from PySide import QtGui
+
+    def translate(context, text, disambig):
+        #Sine is not translatable, sorry...
+        return text
+
+    def activeBody():
+        if App.ActiveDocument is None: return None
+        if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
+            return None
+        return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
+
+    def CreateSine(name):
+        App.ActiveDocument.openTransaction("Create Sine")
+        FreeCADGui.addModule("Sine")
+        FreeCADGui.doCommand("f = Sine.create(name = '"+name+"')")
+        FreeCADGui.doCommand("f = None")
+        App.ActiveDocument.commitTransaction()
+
+    class _CommandSine:
+        "Command to create Sine feature"
+        def GetResources(self):
+            return {'Pixmap'  : str(Path(__file__).parent / 'Sine.svg'),
+                    'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_Sine","Sine"),
+                    'Accel': "",
+                    'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_Sine","Extrude individual shapes in a compound shape")}
         
-    def Activated(self):
-        CreateSine(name = "Sine")
+        def Activated(self):
+            CreateSine(name = "Sine")
             
-    def IsActive(self):
-        return True
-        if App.ActiveDocument:
-            return activeBody() is None
-        else:
-            return False
+        def IsActive(self):
+            return True
+            if App.ActiveDocument:
+                return activeBody() is None
+            else:
+                return False
             
-if App.GuiUp:
-    FreeCADGui.addCommand('4Axis_Sine', _CommandSine())
-    print("Added Command")
+    if not '4Axis_Sine' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
+        FreeCADGui.addCommand('4Axis_Sine', _CommandSine())
+        print("Added Command")
 
-exportedCommands = ['4Axis_Sine']
-print("I am Sine!")
+    exportedCommands = ['4Axis_Sine']
+    print("I am Sine!")
 # -------------------------- /Gui command --------------------------------------------------
@@ -16,12 +16,17 @@
 #   Suite 330, Boston, MA  02111-1307, USA
 #                                                                         
 
-import Draft, Part, FreeCADGui
+import Part
 import FreeCAD as App
+if App.GuiUp:
+	import FreeCADGui
 import os
 from pathlib import Path
-from math import pi, sin,radians
+from grabbag import profiler, fingerprint, pool, progress, scheduler
+from math import pi
+from grabbag.core.sinewall import computeEdge, computeWall, computeDiscreet, faceForEdge
 
+@profiler.instrumented
 class SineWall:
 	def __init__(self, obj):
 		obj.Proxy = self
@@ -49,106 +54,27 @@ class SineWall:
 
 		obj.addProperty("App::PropertyBool", "update", "Dimensions")
 		obj.update=False
+		fingerprint.addProperties(obj)
+		pool.addProperties(obj)
 
-#	def onDocumentRestored(self, obj):
-#		if (not hasattr(obj,"Reverse")):
-#			obj.addProperty("App::PropertyBool", "Reverse", "Dimensions").Reverse=False
-#		obj.ViewObject.Proxy.fp = obj
-
-	def _ComputeOutVec(self,edge, param):
-		P=edge.valueAt(param)
-		vc = (self.cg-P).normalize()
-		t = edge.tangentAt(param)
-		hinge = t.cross(vc).normalize()
-		return t.cross(hinge).normalize()
-
-	def _ComputeSinglePoint(self,edge, param, face, amplitude):
-		P=edge.valueAt(param)
-		vec = self._ComputeOutVec(edge,param)
-		if face.isInside(vec+P, 0.05, True):
-			vec = -vec
-
-		return P+(vec*amplitude)
+	def onDocumentRestored(self, obj):
+		fingerprint.addProperties(obj)
+		pool.addProperties(obj)
+		fingerprint.restore(self, obj)
 
 	def _ComputeEdge(self, obj, edge, face, phase=-1):
 		if phase<0:
 			phase=obj.Phase
-		start,end = edge.ParameterRange
-		prange = end-start
-#		count = int(edge.Length/obj.Wavelength)
-#		count *= obj.granularity
-		count = int( (edge.Length/obj.Wavelength) * obj.granularity)
-#		print(count, ( (edge.Length/obj.Wavelength) * obj.granularity))
-
-		if not count:
-			return [ edge.valueAt(start), edge.valueAt(end) ]
-		pInc = prange/count
-		# now, recompute count
-#		count = int(edge.Length/obj.Wavelength)
-#		count *= obj.granularity
-
-		def ComputeAval(i):
-			return sin((i%obj.granularity)*self.aInc + 3*pi/2 + radians(phase))+1
-						
-		res =  [ self._ComputeSinglePoint(edge,start+(pInc*i), face, obj.Amplitude*ComputeAval(i)) for i in range(count)]
-		if obj.CutCorners:
-			P = edge.valueAt(start)
-			if not P == res[0]:
-				Q = [P]
-				Q.extend(res)
-				res = Q
-				print(res)
-			P = edge.valueAt(end)
-			if not P == res[-1]:
-				res.extend([P])
-
-		return res
+		return computeEdge(edge, face, self.cg, obj.Amplitude, obj.Wavelength, obj.granularity, phase, obj.CutCorners)
 
 	def _compute(self, obj, edges):	# edges is a list of tuples ( edge, parent face of edge)
-		phase = obj.Phase
-		bs=Part.BSplineCurve()
-		pts=[]
-		for e,f in edges:
-			p1 = self._ComputeEdge(obj, e,f, phase)
-			if obj.AlternatePhase:
-				phase = (phase+180)%360
-			if pts and (p1[0]-pts[-1]).Length > (p1[-1]-pts[-1]).Length:	# if the end of the new segment is closer than the beginning (The edge is reversed)
-				p1.reverse()
-			if pts and (p1[0]-pts[-1]).Length > (p1[0] - pts[0]).Length:	# if the first one is backward compared to the second one
-				pts.reverse()
-			pts.extend(p1)
-		
-		if obj.debug:
-			bs1=Part.BSplineCurve(pts)
-			Part.show(bs1.toShape())
-		pts.append(pts[0])	# close the loop.
-		bs = Part.BSplineCurve(pts)
-		try:
-			return bs.approximateBSpline(0.2,len(pts)//10,3,'C0') # caution, len(pts)/10 guessed empirically!
-		except:
-			return bs
+		return computeWall(edges, self.cg, obj.Amplitude, obj.Wavelength, obj.granularity, obj.Phase, obj.AlternatePhase, obj.CutCorners, obj.debug, progress.current())
 		
 	def _computeDiscreet(self, obj, edges):
-		bss=[]
-		for e,f in edges:
-			pts=self._ComputeEdge(obj, e,f)
-#			pts.append(pts[0])	# close the curve
-			bs=Part.BSplineCurve(pts)
-			bss.append(bs.approximateBSpline(0.2, len(pts)//10, 3, 'C0'))	# caution, len(pts)/10 guessed empirically!
-			
-		return bss
+		return computeDiscreet(edges, self.cg, obj.Amplitude, obj.Wavelength, obj.granularity, obj.Phase, obj.CutCorners, progress.current())
 		
-	def _edgeInFace(self, edge, face):
-		for i in face.Edges:
-			if edge.isSame(i):
-				return True
-		return False
-
 	def _faceForEdge(self, edge, faces):
-		for f in faces:
-			if self._edgeInFace(edge, f):
-				return f
-		return None
+		return faceForEdge(edge, faces)
 	
 	def _getEdges(self, obj):
 		if not obj.Base[1]:
@@ -193,6 +119,8 @@ class SineWall:
 				
 		return edges
 		
+	@fingerprint.cached
+	@progress.reporting
 	def execute(self, obj):
 		if not obj.Base:	# not yet assigned.
 			return
@@ -214,9 +142,22 @@ class SineWall:
 #		obj.Placement=obj.Base[0].Placement
 #		obj.Shape=computeShape(dia/2, drill/2, obj.Height, obj.RibCount, obj.BoreDepth, obj.invert, obj.debug)
 
+	def offload(self, obj):
+		"job for grabbag.pool, see grabbag.worker"
+		if not obj.Base or obj.debug:	# debug shows intermediate shapes, that only works here
+			return None
+		self.cg = obj.Base[0].Shape.CenterOfGravity
+		edges = self._getEdges(obj)
+		faces = {}
+		pairs = []
+		for e,f in edges:
+			fi = faces.setdefault(f.exportBrepToString(), len(faces)) if f else None
+			pairs.append( (e.exportBrepToString(), fi) )
+		return ('sineWall', (pairs, list(faces), tuple(self.cg), obj.Amplitude, obj.Wavelength, obj.granularity, obj.Phase, obj.AlternatePhase, obj.CutCorners, self.discreet))
+
 	def onChanged(self, obj, name):
-		if obj.update and name in ['Amplitude', 'Phase', 'Wavelength']:
-			obj.recompute(True)
+		if obj.update and name in ['Amplitude', 'Phase', 'Wavelength'] and not obj.Document.Restoring:
+			scheduler.request(obj, True)
 		
 class ViewProviderSineWall:
 
@@ -326,7 +267,7 @@ def create(name='SineWall'):
 
 if "FCMacro" in __file__:
 	create()
-else:
+elif App.GuiUp:
 	from PySide import QtCore
 	from PySide import QtGui
 
@@ -366,7 +307,7 @@ else:
 			else:
 				return False
 		    
-	if App.GuiUp:
+	if not '4Axis_SineWall' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
 		FreeCADGui.addCommand('4Axis_SineWall', _CommandSineWall())
 		print("Added Command")
 
@@ -16,10 +16,13 @@
 #   Suite 330, Boston, MA  02111-1307, USA
 #                                                                         
 
-import Draft, Part, FreeCADGui
+import Part
 import FreeCAD as App
+if App.GuiUp:
+	import FreeCADGui
 import os
 from pathlib import Path
+from grabbag import profiler, fingerprint
 from math import pi, sin,cos, tan
 
 #Deg30 = pi/6
@@ -69,6 +72,7 @@ def getAttachedRadius(obj):
 def deg2rad(angle):
 	return angle*2*pi/360.0
 
+@profiler.instrumented
 class Teardrop:
 	def __init__(self, obj):
 		obj.Proxy = self
@@ -85,6 +89,7 @@ class Teardrop:
 #			obj.addProperty("App::PropertyBool", "Reverse", "Dimensions").Reverse=False
 #		obj.ViewObject.Proxy.fp = obj
 
+	@fingerprint.cached
 	def execute(self, obj):
 		dia = obj.Diameter
 		if not dia:
@@ -219,7 +224,7 @@ def create(name='Teardrop'):
 
 if "FCMacro" in __file__:
 	create()
-else:
+elif App.GuiUp:
 	from PySide import QtCore
 	from PySide import QtGui
 
@@ -259,7 +264,7 @@ else:
 			else:
 				return False
 		    
-	if App.GuiUp:
+	if not '4Axis_Teardrop' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
 		FreeCADGui.addCommand('4Axis_Teardrop', _CommandTeardrop())
 		print("Added Command")
 
@@ -16,15 +16,19 @@
 #   Suite 330, Boston, MA  02111-1307, USA
 #                                                                         
 
-import Draft, Part, FreeCADGui
+import Part
 import FreeCAD as App
+if App.GuiUp:
+	import FreeCADGui
 import os
 from pathlib import Path
+from grabbag import profiler, fingerprint, scheduler
 
 def fixPlacement(s,p):
 	s.Placement=p
 	return s
 
+@profiler.instrumented
 class WireBinder:
 	def __init__(self, obj):
 		obj.Proxy = self
@@ -40,6 +44,7 @@ class WireBinder:
 		if not hasattr(obj,"wAdd"):
 			obj.addProperty("App::PropertyBool", "wAdd", "Dimensions").wAdd=False
 
+	@fingerprint.cached
 	def execute(self, obj):
 #		print(obj.Base)
 		p = App.Placement()
@@ -60,6 +65,8 @@ class WireBinder:
 		obj.Shape = Part.makeCompound( [ fixPlacement(w,p) for w in wires])
 
 	def onChanged(self, obj, name):
+		if obj.Document.Restoring:	# don't recompute while the document is loading
+			return
 		if name=="Wire":
 			try:
 				if obj.Base[0].Shape.Wires:
@@ -69,7 +76,7 @@ class WireBinder:
 						obj.Wire=v
 			except:
 				pass
-			obj.recompute()
+			scheduler.request(obj)
 
 		if name == "wAdd" and obj.wAdd==True:
 			obj.wAdd=False
@@ -78,7 +85,7 @@ class WireBinder:
 					l = obj.Wires
 					l.append(obj.Wire)
 					obj.Wires=l
-					obj.recompute()
+					scheduler.request(obj)
 
 #		print("onChanged", name)
 		
@@ -211,48 +218,49 @@ def create(name="WireBinder"):
 
 # -------------------------- Gui command --------------------------------------------------
 
-from PySide import QtCore
-from PySide import QtGui
-
-def translate(context, text, disambig):
-    #WireBinder is not translatable, sorry...
-    return text
-
-def activeBody():
-    if App.ActiveDocument is None: return None
-    if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
-        return None
-    return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
-
-def CreateWireBinder(name):
-    App.ActiveDocument.openTransaction("Create WireBinder")
-    FreeCADGui.addModule("WireBinder")
-    FreeCADGui.doCommand("f = WireBinder.create(name = '"+name+"')")
-    FreeCADGui.doCommand("f = None")
-    App.ActiveDocument.commitTransaction()
-
-class _CommandWireBinder:
-    "Command to create WireBinder feature"
-    def GetResources(self):
-        return {'Pixmap'  : str(Path(__file__).parent / 'WireBinder.svg'),
-                'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_WireBinder","WireBinder"),
-                'Accel': "",
-                'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_WireBinder","Extrude individual shapes in a compound shape")}
+if App.GuiUp:
+    from PySide import QtCore
+    from PySide import QtGui
+
+    def translate(context, text, disambig):
+        #WireBinder is not translatable, sorry...
+        return text
+
+    def activeBody():
+        if App.ActiveDocument is None: return None
+        if not hasattr(FreeCADGui.ActiveDocument.ActiveView, 'getActiveObject'): #prevent errors in 0.16
+            return None
+        return FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
+
+    def CreateWireBinder(name):
+        App.ActiveDocument.openTransaction("Create WireBinder")
+        FreeCADGui.addModule("WireBinder")
+        FreeCADGui.doCommand("f = WireBinder.create(name = '"+name+"')")
+        FreeCADGui.doCommand("f = None")
+        App.ActiveDocument.commitTransaction()
+
+    class _CommandWireBinder:
+        "Command to create WireBinder feature"
+        def GetResources(self):
+            return {'Pixmap'  : str(Path(__file__).parent / 'WireBinder.svg'),
+                    'MenuText': QtCore.QT_TRANSLATE_NOOP("4axis_WireBinder","WireBinder"),
+                    'Accel': "",
+                    'ToolTip': QtCore.QT_TRANSLATE_NOOP("4axis_WireBinder","Extrude individual shapes in a compound shape")}
         
-    def Activated(self):
-        CreateWireBinder(name = "WireBinder")
+        def Activated(self):
+            CreateWireBinder(name = "WireBinder")
             
-    def IsActive(self):
-        return True
-        if App.ActiveDocument:
-            return activeBody() is None
-        else:
-            return False
+        def IsActive(self):
+            return True
+            if App.ActiveDocument:
+                return activeBody() is None
+            else:
+                return False
             
-if App.GuiUp:
-    FreeCADGui.addCommand('4Axis_WireBinder', _CommandWireBinder())
-    print("Added Command")
+    if not '4Axis_WireBinder' in FreeCADGui.listCommands():	# already registered lazily by GrabBagCommands
+        FreeCADGui.addCommand('4Axis_WireBinder', _CommandWireBinder())
+        print("Added Command")
 
-exportedCommands = ['4Axis_WireBinder']
-print("I am WireBinder!")
+    exportedCommands = ['4Axis_WireBinder']
+    print("I am WireBinder!")
 # -------------------------- /Gui command --------------------------------------------------
@@ -0,0 +1,216 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Algorithm benchmarks with scaling curves.
+#
+# Every case times one GrabBag algorithm on the fixture geometry of
+# benchmarks/fixtures.py at several input sizes. Run it with FreeCAD's python:
+#	python benchmarks/algorithms.py --output results.json
+#	python benchmarks/algorithms.py --save baseline.json
+#	python benchmarks/algorithms.py --baseline baseline.json --threshold 0.25
+# Results are JSON: { case: { size: seconds } } plus the machine they were taken
+# on. With --baseline, every case and size in the baseline is tracked and the
+# run fails (exit code 1) when one of them got slower than the threshold
+# allows. Baselines are per machine, record one before changing the code.
+
+import sys, io, json, time, platform, argparse, contextlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+class Case:
+	"time run(*setup(size)) for every size, setup is not timed"
+	def __init__(self, name, param, sizes, setup, run):
+		self.name = name
+		self.param = param
+		self.sizes = sizes
+		self.setup = setup
+		self.run = run
+
+	def time(self, size, repeat):
+		best = None
+		for i in range(repeat):
+			args = self.setup(size)	# fresh arguments, some algorithms consume their input
+			with contextlib.redirect_stdout(io.StringIO()):	# the algorithms print progress
+				t = time.perf_counter()
+				self.run(*args)
+				t = time.perf_counter()-t
+			best = t if best is None else min(best, t)
+		return best
+
+def cases():
+	import fixtures
+	from grabbag.core.helix import MakeHelix
+	from grabbag.core.minmax import ComputeMinMax
+	from grabbag.core.biarc import EdgeToBiArcs, SegmentByLength, SegmentCache, joinShape, mergeArcs
+	import Part
+	from grabbag.core.recompose import getRadii, periodic_interpolate
+	from grabbag.core.pointfit import fitPoints
+	from grabbag.core.biarctable import BiArcTable
+	from grabbag.core.sinewall import computeEdge, computeWall
+	import Extruder
+
+	def segments(poles):
+		l = fixtures.biArcs(poles)
+		total = sum(c.length() for c in l)
+		return l, [ total*k/20 for k in range(1, 20) ]
+
+	def splits(count):
+		l = fixtures.biArcs(128)
+		total = sum(c.length() for c in l)
+		return l, [ total*(k+0.37)/(count+1) for k in range(count) ]
+
+	def addDistance(count):
+		"a SegmentCache joined at count distances, and those plus one more"
+		l, lens = splits(count)
+		sc = SegmentCache()
+		sc.fitted('bench', lambda: l)
+		sc.join(lens)
+		return sc, sorted(lens + [ lens[0]/2 ])
+
+	def wall(edges):
+		f = fixtures.polygonFace(edges)
+		return [ (e, f) for e in f.Edges ], f.CenterOfMass
+
+	def edge(granularity):
+		edges, cg = wall(4)
+		return (*edges[0], cg, 1, 10, granularity)
+
+	return [
+		Case('MakeHelix', 'spine length', [ 50, 200, 800 ],
+			lambda n: (fixtures.spine(n), 2.0, 3.0),
+			lambda s, pitch, r: MakeHelix(s, pitch, r)),
+		Case('MakeHelix.resolution', 'samples per turn', [ 4, 16, 64 ],
+			lambda n: (fixtures.spine(200), n),
+			lambda s, res: MakeHelix(s, 2.0, 3.0, res=res)),
+		Case('findAllMinMax', 'poles', [ 8, 32, 128 ],
+			lambda n: (fixtures.curve(n),),
+			lambda e: ComputeMinMax(e).findAllMinMax()),
+		Case('SegmentByLength', 'poles', [ 8, 32, 128 ],
+			segments,
+			lambda l, lens: list(SegmentByLength(l, lens))),
+		Case('SegmentByLength.splits', 'split distances', [ 10, 100, 1000 ],
+			splits,
+			lambda l, lens: list(SegmentByLength(l, lens))),
+		Case('SegmentCache.addDistance', 'split distances', [ 10, 100, 1000 ],
+			addDistance,
+			lambda sc, lens: sc.join(lens)),
+		Case('BiArcTable.radiusMask', 'poles', [ 8, 32, 128 ],
+			lambda n: (BiArcTable.fromCurves(fixtures.biArcs(n)), 3),
+			lambda t, k: t.splitDistances(mask=t.radiusMask(k))),
+		Case('joinShape', 'poles', [ 8, 32, 128 ],
+			lambda n: (Part.makeCompound([ a.toShape() for a in fixtures.biArcs(n) ]),),
+			joinShape),
+		Case('mergeArcs', 'edges', [ 16, 128, 512 ],
+			lambda n: ([ a for e in fixtures.outline(n).Edges for a in EdgeToBiArcs(e) ],),
+			mergeArcs),
+		Case('fitPoints', 'points', [ 1000, 10000, 100000 ],
+			lambda n: (fixtures.polyline(n), 0.01),
+			fitPoints),
+		Case('fitPoints.features', 'points', [ 1000, 10000, 100000 ],
+			lambda n: (fixtures.busyPolyline(n), 0.01),
+			fitPoints),
+		Case('getRadii', 'poles', [ 8, 32, 128 ],
+			lambda n: (fixtures.curve(n), 5.0),
+			getRadii),
+		Case('periodic_interpolate', 'points', [ 8, 64, 512 ],
+			lambda n: (fixtures.wavyPoints(n),),
+			periodic_interpolate),
+		Case('computeEdge', 'granularity', [ 16, 64, 256 ],
+			edge,
+			computeEdge),
+		Case('computeWall', 'edges', [ 3, 12, 48 ],
+			lambda n: (*wall(n), 1, 10, 64),
+			computeWall),
+		Case('Extruder.computeShape', 'faces', [ 4, 32, 256 ],
+			lambda n: (fixtures.faceCompound(n), 1.0, 5.0),
+			Extruder.computeShape),
+	]
+
+def machine():
+	import FreeCAD as App
+	return { 'python': platform.python_version(), 'platform': platform.platform(),
+		'processor': platform.processor(), 'freecad': '.'.join(App.Version()[:3]) }
+
+def measure(selected, repeat):
+	res = {}
+	for case in selected:
+		res[case.name] = {}
+		for size in case.sizes:
+			t = case.time(size, repeat)
+			res[case.name][str(size)] = t
+			print(f"{case.name:24} {case.param:>18} {size:>6}: {t*1000:10.2f} ms")
+	return res
+
+def regressions(results, baseline, threshold, floor):
+	"(case, size, baseline, now) for every tracked measurement that is too slow"
+	res = []
+	for name, sizes in baseline.items():
+		for size, base in sizes.items():
+			now = results.get(name, {}).get(size)
+			if now is None:
+				continue
+			if now > base*(1+threshold) and now-base > floor:	# the floor keeps timer noise on tiny cases out
+				res.append( (name, size, base, now) )
+	return res
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="GrabBag algorithm benchmarks")
+	parser.add_argument('cases', nargs='*', help="case names to run, default all")
+	parser.add_argument('--repeat', type=int, default=3, help="runs per measurement, the best one counts")
+	parser.add_argument('--output', help="write the results to this JSON file")
+	parser.add_argument('--save', help="write the results as a new baseline")
+	parser.add_argument('--baseline', help="compare against this baseline and fail on regressions")
+	parser.add_argument('--threshold', type=float, default=0.25, help="allowed slowdown against the baseline, 0.25 is 25%%")
+	parser.add_argument('--floor', type=float, default=0.002, help="slowdowns smaller than this many seconds never fail")
+	parser.add_argument('--list', action='store_true', help="list the cases and exit")
+	args = parser.parse_args(argv)
+
+	allCases = cases()
+	if args.list:
+		for c in allCases:
+			print(f"{c.name}: {c.param} {c.sizes}")
+		return 0
+	selected = [ c for c in allCases if not args.cases or c.name in args.cases ]
+	unknown = set(args.cases) - set(c.name for c in allCases)
+	if unknown:
+		print("unknown cases:", ", ".join(sorted(unknown)))
+		return 2
+
+	results = measure(selected, args.repeat)
+	doc = { 'machine': machine(), 'repeat': args.repeat, 'results': results }
+	for path in (args.output, args.save):
+		if path:
+			with open(path, 'w') as f:
+				json.dump(doc, f, indent=1)
+
+	if args.baseline:
+		with open(args.baseline) as f:
+			baseline = json.load(f)['results']
+		bad = regressions(results, baseline, args.threshold, args.floor)
+		for name, size, base, now in bad:
+			print(f"REGRESSION {name} @ {size}: {base*1000:.2f} ms -> {now*1000:.2f} ms (+{(now/base-1)*100:.0f}%)")
+		if bad:
+			return 1
+		print(f"no regressions beyond {args.threshold*100:.0f}% against {args.baseline}")
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
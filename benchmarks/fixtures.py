@@ -0,0 +1,86 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Fixed fixture geometry for the algorithm benchmarks.
+#
+# Everything is built from closed form point sets, so the same size gives the
+# same geometry on every machine and run.
+
+from math import sin, cos, pi
+
+import FreeCAD as App
+import Part
+
+def wavyPoints(n, step=5.0):
+	"n points along X with a gentle wave in Y and Z"
+	return [ App.Vector(i*step, 5*sin(i*0.35), 2*cos(i*0.21)) for i in range(n) ]
+
+def polyline(n, step=0.005):
+	"n points of a densely sampled wavy outline as an (n,3) list, like discretize() or scan output"
+	return [ (i*step, 5*sin(i*step/7), 0.0) for i in range(n) ]
+
+def busyPolyline(n, length=1000.0):
+	"n points of a sine with a crest every 3 mm or so over length, many features to keep, like a scanned knurl"
+	step = length/(n-1)
+	return [ (i*step, 5*sin(i*step), 0.0) for i in range(n) ]
+
+def spine(length):
+	"a planar wavy edge of about length mm, the PathHelix spine"
+	n = max(int(length/5), 4)
+	bs = Part.BSplineCurve()
+	bs.interpolate([ App.Vector(i*5.0, 5*sin(i*0.2), 0) for i in range(n) ])
+	return bs.toShape()
+
+def curve(poles):
+	"a 3D BSpline edge with the given number of poles and plenty of slope changes"
+	bs = Part.BSplineCurve()
+	bs.buildFromPoles([ App.Vector(i*3.0, 10*sin(i*0.7), 5*cos(i*0.3)) for i in range(poles) ])
+	return bs.toShape()
+
+def biArcs(poles, tolerance=0.01):
+	"the biarc decomposition of curve(poles), as ToBiArcs and getRadii make it"
+	from grabbag.core.biarc import EdgeToBiArcs
+	return EdgeToBiArcs(curve(poles), tolerance)
+
+def polygonFace(edges, radius=50.0):
+	"a regular polygon face with the given number of edges"
+	pts = [ App.Vector(radius*cos(2*pi*i/edges), radius*sin(2*pi*i/edges), 0) for i in range(edges) ]
+	return Part.Face(Part.makePolygon(pts + pts[:1]))
+
+def faceCompound(faces, size=10.0):
+	"a compound of square faces in a row, each its own sub shape, the Extruder input"
+	shapes = []
+	for i in range(faces):
+		x = i*size*1.5
+		pts = [ App.Vector(x, 0, 0), App.Vector(x+size, 0, 0), App.Vector(x+size, size, 0), App.Vector(x, size, 0) ]
+		shapes.append(Part.Face(Part.makePolygon(pts + pts[:1])))
+	return Part.makeCompound(shapes)
+
+def outline(edges, radius=100.0):
+	"a closed outline of BSpline edges around a wavy circle, like an imported SVG path or ShapeString"
+	def point(t):
+		r = radius + 4*sin(37*t)
+		return App.Vector(r*cos(t), r*sin(t), 0)
+	shapes = []
+	for i in range(edges):
+		t0, t1 = 2*pi*i/edges, 2*pi*(i+1)/edges
+		bs = Part.BSplineCurve()
+		bs.interpolate([ point(t0+(t1-t0)*k/5) for k in range(6) ])
+		shapes.append(bs.toShape())
+	return Part.Wire(shapes)
@@ -0,0 +1,62 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# G2/G3 biarc G-code against a G1 polyline of the same path.
+#
+# Writes both for the outline fixture to a temporary directory and compares
+# line count, file size and time. The polyline discretizes the original edges
+# at the same tolerance the biarcs are fitted with; the G2/G3 time includes
+# that fit. Run it with FreeCAD's python:
+#	python benchmarks/gcode_size.py --edges 64 512 --tolerance 0.01
+
+import os, sys, time, tempfile, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="G-code size comparison")
+	parser.add_argument('--edges', type=int, nargs='*', default=[ 64, 512 ])
+	parser.add_argument('--tolerance', type=float, default=0.01)
+	parser.add_argument('--feed', type=float, default=1200)
+	args = parser.parse_args(argv)
+
+	import fixtures
+	from grabbag.core.biarc import iterBiArcs, biArcCache
+	from grabbag.core.gcode import gcode, polyline, writeLines
+
+	with tempfile.TemporaryDirectory() as d:
+		for n in args.edges:
+			edges = fixtures.outline(n).Edges
+			biArcCache.clear()
+			res = {}
+			for name, lines in (
+					('G2/G3', lambda: gcode(iterBiArcs(edges, args.tolerance), args.feed, tolerance=args.tolerance)),
+					('G1', lambda: polyline((e.Curve for e in edges), args.feed, tolerance=args.tolerance)) ):
+				t = time.perf_counter()
+				with open(os.path.join(d, f"{n}-{name.replace('/', '')}.nc"), 'w') as f:
+					count, size = writeLines(f, lines())
+				res[name] = (count, size, time.perf_counter()-t)
+			(ac, asz, at), (lc, lsz, lt) = res['G2/G3'], res['G1']
+			print(f"{n:5} edges: G2/G3 {ac:7} lines {asz/1024:8.1f} KiB {at*1000:8.1f} ms | G1 {lc:7} lines {lsz/1024:8.1f} KiB {lt*1000:8.1f} ms | x{lc/ac:.1f} fewer lines")
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
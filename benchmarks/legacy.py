@@ -0,0 +1,74 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Previous implementations of optimized GrabBag algorithms, kept verbatim so
+# the benchmarks can compare against them. Not used by the add-on.
+
+import Part
+
+def splitGeoByLen(c,l):	# proportional parameter, only right for arcs and lines
+	if(l<=0):
+		raise Exception("BUG! can't splitGeoByLen by <=0 length!")
+
+	a=c.copy()
+	b=c.copy()
+
+	r=a.LastParameter-a.FirstParameter
+	l=l/a.length()
+	r*=l
+	r+=a.FirstParameter
+
+	if type(c) in [Part.LineSegment,Part.BSplineCurve ]:
+		a = a.toNurbs(a.FirstParameter,r)
+		b = b.toNurbs(r, b.LastParameter)
+	else:
+		a.setParameterRange(a.FirstParameter, r)
+		b.setParameterRange(r, b.LastParameter)
+	return a,b
+
+def SegmentByLength(l, lenlist):	# lenlist must be sorted in reverse order
+	i=j=0
+	curlen=0
+	cmplen=0
+
+	while j<len(l):
+		if not cmplen:
+			try:
+				cmplen=lenlist.pop()
+			except:
+				yield l[i:]
+				return
+
+		if curlen+l[j].length()>cmplen:
+			a,b = splitGeoByLen(l[j], cmplen-curlen)
+			l[j]=a
+			yield l[i:j+1]
+			curlen+= a.length()	# b's length will be added below
+			i=j
+			l[j]=b
+			cmplen=0	# cause pop of new cmplen
+			continue	# re-asess the second part of the curve in case it's long enough to go past the next length
+		elif cmplen+l[j].length()==cmplen:
+			yield l[i:j+1]
+			i=j+1
+
+		curlen+= l[j].length()
+		j+=1
+
+	yield l[-1]
@@ -0,0 +1,88 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Serial against pooled biarc fitting of a many-edge outline.
+#
+# Times cachedBiArcs edge by edge against grabbag.pool.fitBiArcs on the same
+# edges, with the biarc cache emptied before every run so both really fit.
+# The pool is started and warmed up before timing; its startup is reported
+# separately. Run it with FreeCAD's python:
+#	python benchmarks/parallel_biarcs.py --edges 16 50 200 800 --workers 4
+# It prints both times per edge count and the smallest edge count at which
+# the pool was faster, the value for Mod/GrabBag/ParallelFitMinEdges.
+
+import os, sys, time, argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+def timeIt(fn, repeat, before):
+	best = None
+	for i in range(repeat):
+		before()
+		t = time.perf_counter()
+		res = fn()
+		t = time.perf_counter()-t
+		best = t if best is None else min(best, t)
+	return best, res
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="parallel biarc fitting benchmark")
+	parser.add_argument('--edges', type=int, nargs='*', default=[ 16, 50, 200, 800 ])
+	parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+	parser.add_argument('--tolerance', type=float, default=0.01)
+	parser.add_argument('--repeat', type=int, default=3)
+	args = parser.parse_args(argv)
+
+	import fixtures
+	from grabbag import pool, worker
+	from grabbag.core.biarc import cachedBiArcs, biArcCache
+
+	ctx = multiprocessing.get_context('spawn')
+	ctx.set_executable(pool.pythonExecutable())
+	t = time.perf_counter()
+	with ProcessPoolExecutor(max_workers=args.workers, mp_context=ctx) as ex:
+		list(ex.map(worker.run, [ ('biArcs', ([], args.tolerance)) ]*args.workers))	# start every worker
+		print(f"pool of {args.workers} started in {(time.perf_counter()-t)*1000:.0f} ms")
+
+		wins = None	# fewest edges the pool was faster at
+		for n in sorted(args.edges):
+			edges = fixtures.outline(n).Edges
+			serial, serialRes = timeIt(lambda: [ cachedBiArcs(e, args.tolerance) for e in edges ], args.repeat, biArcCache.clear)
+			pooled, pooledRes = timeIt(lambda: pool.fitBiArcs(edges, args.tolerance, ex, args.workers, 0), args.repeat, biArcCache.clear)
+
+			for i, (a, b) in enumerate(zip(serialRes, pooledRes)):
+				if len(a) != len(b) or abs(sum(c.length() for c in a)-sum(c.length() for c in b)) > 1e-6:
+					print(f"MISMATCH on edge {i} of {n}: {len(a)} vs {len(b)} arcs")
+					return 1
+			arcs = sum(len(a) for a in serialRes)
+			print(f"{n:6} edges {arcs:7} arcs: serial {serial*1000:9.1f} ms, pool {pooled*1000:9.1f} ms, x{serial/pooled:.2f}")
+			if pooled < serial and wins is None:
+				wins = n
+	if wins is None:
+		print("the pool was never faster, leave ParallelFit off")
+	else:
+		print(f"the pool was faster from {wins} edges, set Mod/GrabBag/ParallelFitMinEdges to about that")
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
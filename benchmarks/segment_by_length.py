@@ -0,0 +1,75 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# SegmentByLength against the generator it replaced.
+#
+# The old generator summed lengths while walking the list and needed the split
+# distances reverse sorted (and consumed them); the current one builds a prefix
+# sum once and binary searches every distance. Run it with FreeCAD's python:
+#	python benchmarks/segment_by_length.py
+# Both are run on the same biarcs and split distances and their pieces are
+# checked to agree before the timings count.
+
+import sys, time, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+def distances(total, count):
+	"count split distances spread over total, away from the joints of the fixture"
+	return [ total*(k+0.37)/(count+1) for k in range(count) ]
+
+def timeIt(fn, repeat):
+	best = None
+	for i in range(repeat):
+		t = time.perf_counter()
+		res = fn()
+		t = time.perf_counter()-t
+		best = t if best is None else min(best, t)
+	return best, res
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="SegmentByLength benchmark")
+	parser.add_argument('--poles', type=int, nargs='*', default=[ 64, 512 ], help="fixture sizes, more poles give more biarcs")
+	parser.add_argument('--splits', type=int, nargs='*', default=[ 10, 100, 1000 ])
+	parser.add_argument('--repeat', type=int, default=3)
+	args = parser.parse_args(argv)
+
+	import fixtures, legacy
+	from grabbag.core.biarc import SegmentByLength
+
+	for poles in args.poles:
+		arcs = fixtures.biArcs(poles)
+		total = sum(a.length() for a in arcs)
+		for count in args.splits:
+			d = distances(total, count)
+			old, oldRes = timeIt(lambda: list(legacy.SegmentByLength(list(arcs), sorted(d, reverse=True))), args.repeat)
+			new, newRes = timeIt(lambda: list(SegmentByLength(arcs, d)), args.repeat)
+
+			oldLen = [ sum(c.length() for c in seg) for seg in oldRes ]
+			newLen = [ sum(c.length() for c in seg) for seg in newRes ]
+			if len(oldLen) != len(newLen) or any(abs(a-b) > 1e-6 for a, b in zip(oldLen, newLen)):
+				print(f"MISMATCH at {poles} poles, {count} splits: {len(oldLen)} vs {len(newLen)} pieces")
+				return 1
+			print(f"{len(arcs):6} biarcs {count:6} splits: legacy {old*1000:9.2f} ms, prefix sum {new*1000:9.2f} ms, x{old/new:.1f}")
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,82 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Getting a biarc fit into a sketch: the joined BSpline as external geometry,
+# against the arcs and lines as native geometry, added one by one and in bulk.
+#
+# Each workflow gets its own sketch in a scratch document and is timed up to
+# and including the recompute that solves the sketch. Run it with FreeCAD's
+# python:
+#	python benchmarks/sketch_export.py
+# It prints the three times, the speed-up of the bulk export over the external
+# BSpline, and whether every sketch solved.
+
+import sys, time, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+def timed(doc, fill):
+	"time fill(sketch) on a new sketch and the recompute after it"
+	sk = doc.addObject("Sketcher::SketchObject", "Sketch")
+	t = time.perf_counter()
+	fill(sk)
+	doc.recompute()
+	return time.perf_counter()-t, sk
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="biarcs to Sketcher benchmark")
+	parser.add_argument('--edges', type=int, nargs='*', default=[ 16, 64, 256 ], help="fixture outline edges")
+	parser.add_argument('--tolerance', type=float, default=0.01)
+	args = parser.parse_args(argv)
+
+	import FreeCAD as App, Part, Sketcher, fixtures
+	from grabbag.core.biarc import EdgeToBiArcs, joinShape
+	from grabbag.core.sketch import sketchGeometry, addToSketch
+
+	doc = App.newDocument("SketchExportBench")
+	try:
+		for edges in args.edges:
+			arcs = [ a for e in fixtures.outline(edges).Edges for a in EdgeToBiArcs(e, args.tolerance) ]
+			joined = doc.addObject("Part::Feature", "Joined")
+			joined.Shape = joinShape(Part.makeCompound(arcs))
+			geo, coincident = sketchGeometry(arcs, App.Placement(), args.tolerance)
+
+			def external(sk):
+				for i in range(len(joined.Shape.Edges)):
+					sk.addExternal(joined.Name, f"Edge{i+1}")
+
+			def oneByOne(sk):
+				for g in geo:
+					sk.addGeometry(g, False)
+				for i, a, j, b in coincident:
+					sk.addConstraint(Sketcher.Constraint('Coincident', i, a, j, b))
+
+			ext, a = timed(doc, external)
+			one, b = timed(doc, oneByOne)
+			bulk, c = timed(doc, lambda sk: addToSketch(sk, geo, coincident))
+			solved = all(sk.solve() == 0 for sk in (a, b, c))
+			print(f"{edges:5} edges, {len(geo):6} arcs and lines: BSpline external {ext*1000:9.1f} ms, one by one {one*1000:9.1f} ms, bulk {bulk*1000:9.1f} ms, x{ext/bulk:.2f}, solved {solved}")
+	finally:
+		App.closeDocument(doc.Name)
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
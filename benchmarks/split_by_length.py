@@ -0,0 +1,82 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Splitting a BSpline into equal lengths, proportional parameter against the
+# arc length inversion (grabbag.core.biarc.ArcLength).
+#
+# The legacy generator maps a length to a parameter by proportion and splits
+# the remainder of the curve again for every further cut; the current one
+# inverts the arc length and trims each piece once from the original curve.
+# Run it with FreeCAD's python:
+#	python benchmarks/split_by_length.py
+# It prints the worst piece length error of both, and for both the same two
+# counts: trimmed curves made (a legacy split trims the curve into two, the
+# current code trims one piece per call) and segments produced.
+
+import sys, time, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+def counting(module, name, counter, weight=1):
+	"wrap module.name so every call adds weight to counter[0]"
+	fn = getattr(module, name)
+	def wrapper(*args):
+		counter[0] += weight
+		return fn(*args)
+	setattr(module, name, wrapper)
+
+def run(fn, counter):
+	counter[0] = 0
+	t = time.perf_counter()
+	res = fn()
+	return time.perf_counter()-t, res, counter[0]
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="arc length splitting benchmark")
+	parser.add_argument('--poles', type=int, nargs='*', default=[ 16, 128 ])
+	parser.add_argument('--splits', type=int, nargs='*', default=[ 10, 100 ])
+	args = parser.parse_args(argv)
+
+	import fixtures, legacy
+	from grabbag.core import biarc
+
+	oldCalls, newCalls = [0], [0]
+	counting(legacy, 'splitGeoByLen', oldCalls, 2)	# trims both halves
+	counting(biarc, 'trimGeo', newCalls)
+
+	for poles in args.poles:
+		c = fixtures.curve(poles).Curve
+		total = c.length()
+		for count in args.splits:
+			step = total/(count+1)
+			d = [ step*(k+1) for k in range(count) ]
+			old, oldRes, oldN = run(lambda: list(legacy.SegmentByLength([c], sorted(d, reverse=True))), oldCalls)
+			new, newRes, newN = run(lambda: list(biarc.SegmentByLength([c], d)), newCalls)
+
+			oldErr = max(abs(sum(p.length() for p in seg)-step) for seg in oldRes[:-1])
+			newErr = max(abs(sum(p.length() for p in seg)-step) for seg in newRes)
+			oldSegs = len(oldRes)	# the last is a bare curve, still one segment
+			print(f"{poles:5} poles {count:5} splits: proportional err {oldErr:10.3g} ({oldN} trims, {oldSegs} segments, {old*1000:8.2f} ms)"
+				f"  arc length err {newErr:10.3g} ({newN} trims, {len(newRes)} segments, {new*1000:8.2f} ms)")
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,65 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+
+# Import-time benchmark for the add-on startup path.
+#
+# Run it from the GrabBag directory with FreeCAD's python, e.g.
+#	FreeCADCmd benchmarks/startup.py
+#	python benchmarks/startup.py --budget 0.05
+# It fails (exit code 1) when importing GrabBagCommands takes longer than the
+# budget or drags in any of the tool modules.
+
+import sys, time, importlib, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def timeImport(name):
+	t = time.perf_counter()
+	importlib.import_module(name)
+	return time.perf_counter()-t
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="GrabBag startup benchmark")
+	parser.add_argument('--budget', type=float, default=0.05, help="seconds allowed for the lazy registry import")
+	parser.add_argument('--eager', action='store_true', help="also time importing every tool module, for comparison")
+	args = parser.parse_args(argv)
+
+	import FreeCAD	# FreeCAD's own startup is not ours to measure
+
+	lazy = timeImport('GrabBagCommands')
+	import GrabBagCommands
+	tools = set(m for m, *_ in GrabBagCommands.Commands.values())
+	loaded = sorted(tools & set(sys.modules))
+
+	print(f"GrabBagCommands import: {lazy*1000:.2f} ms (budget {args.budget*1000:.2f} ms)")
+	if args.eager:
+		eager = sum(timeImport(m) for m in sorted(tools))
+		print(f"eager import of {len(tools)} tool modules: {eager*1000:.2f} ms")
+
+	ok = True
+	if loaded:
+		print("FAIL: tool modules imported at startup:", ", ".join(loaded))
+		ok = False
+	if lazy > args.budget:
+		print("FAIL: startup import over budget")
+		ok = False
+	return 0 if ok else 1
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,73 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Sweeping along joined biarcs, as joined and after compactCurve.
+#
+# A circle is swept along the joined biarc fit of the fixture curve for every
+# CompactMode. Run it with FreeCAD's python:
+#	python benchmarks/sweep_compact.py
+# It prints the pole count, deviation, compaction time and sweep time of each,
+# and the sweep speed-up over the uncompacted curve ('None'). 'Knot removal'
+# is run once for every limit on the halvings of its removal tolerance, up to
+# CompactTries, to show how many of them pay off.
+
+import sys, time, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+def sweep(edge, radius):
+	"a circle of radius swept along edge, the solid"
+	import Part
+	p, t = edge.valueAt(edge.FirstParameter), edge.tangentAt(edge.FirstParameter)
+	profile = Part.Wire(Part.makeCircle(radius, p, t))
+	return Part.Wire(edge).makePipeShell([ profile ], True, True)
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="sweep along compacted biarcs")
+	parser.add_argument('--poles', type=int, nargs='*', default=[ 16, 64, 128 ])
+	parser.add_argument('--tolerance', type=float, default=0.01)
+	parser.add_argument('--radius', type=float, default=0.5)
+	args = parser.parse_args(argv)
+
+	import Part, fixtures
+	from grabbag.core import biarc
+
+	tries = biarc.CompactTries
+	runs = [ ('None', 0), *(('Knot removal', k) for k in range(1, tries+1)), ('Approximate', 0) ]
+	for poles in args.poles:
+		joined = biarc.joinShape(Part.makeCompound(fixtures.biArcs(poles, args.tolerance)))
+		base = None	# sweep time of the uncompacted curve
+		for mode, k in runs:
+			biarc.CompactTries = k or tries
+			t = time.perf_counter()
+			bs, d = biarc.compactCurve(joined.Curve, args.tolerance, mode)
+			t = time.perf_counter()-t
+			s = time.perf_counter()
+			solid = sweep(bs.toShape(), args.radius)
+			s = time.perf_counter()-s
+			base = base or s
+			name = f"{mode} {k}" if k else mode
+			print(f"{poles:5} fixture poles {name:>14}: {bs.NbPoles:6} poles, deviation {d:9.3g}, compact {t*1000:8.1f} ms, sweep {s*1000:9.1f} ms, x{base/s:5.2f}, valid {solid.isValid()}")
+	biarc.CompactTries = tries
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,4 @@
+# GrabBag support code that is shared by the tool modules.
+#
+# Nothing in this package imports FreeCADGui or PySide at module level, so it
+# can be used from FreeCADCmd, worker processes and benchmarks.
@@ -0,0 +1,290 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Headless batch runner.
+#
+# Builds and recomputes GrabBag features without the GUI, exports the results
+# and writes a timing manifest. Jobs run in parallel worker processes. Run it
+# with FreeCAD's python and FreeCAD's lib directory on the path:
+#	python -m grabbag.batch jobs.json -o out
+#	python -m grabbag.batch parts/ -o out --force
+# or from FreeCADCmd:
+#	from grabbag import batch; batch.run('jobs.json', 'out')
+#
+# A directory runs every FCStd file in it: the document is opened, recomputed
+# and its GrabBag features exported to <outdir>/<document>.step. A job spec is
+# a JSON file with a list of jobs (or { "jobs": [ ... ] }):
+#	{
+#	  "name": "helix",
+#	  "document": "spine.FCStd",		optional, otherwise an empty document
+#	  "inputs": { "Spine": "spine.brep" },	Part::Features read from BREP/STEP/IGES
+#	  "features": [ { "type": "PathHelix", "name": "Helix",
+#	                  "properties": { "Spine": "Spine", "Pitch": 1, "Radius": 3 } } ],
+#	  "set": { "Helix": { "Resolution": 8 } },	property changes on existing objects
+#	  "matrix": { "Helix.Pitch": [ 1, 2 ], "Helix.Radius": [ 3, 4 ] },
+#	  "export": [ "helix.step", "helix.brep" ],
+#	  "objects": [ "Helix" ]			what to export, default every GrabBag feature
+#	}
+# Link properties take object names; a LinkSub takes [ name, [ subelements ] ].
+# A matrix expands the job into one job per combination of values, numbered
+# helix-000, helix-001... and so are its export files. Paths are relative to the
+# spec (inputs, document) or to the output directory (export).
+
+import os, sys, json, time, glob, itertools, argparse, traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import FreeCAD as App
+import Part
+
+# type: (module, proxy class, defaults of the GUI create helpers)
+Features = {
+	'PathHelix':	('PathHelix', 'PathHelix', { 'Radius': 3, 'Pitch': 1, 'Rotation': 0, 'Resolution': 8 }),
+	'SineWall':	('SineWall', 'SineWall', {}),
+	'RibThread':	('RibThread', 'RibThread', { 'Diameter': 5, 'DrillDiameter': 4.5, 'Height': 10, 'RibCount': 3, 'BoreDepth': 1 }),
+	'TearDrop':	('TearDrop', 'Teardrop', { 'Diameter': 5, 'Height': 10, 'Angle': 120 }),
+	'ToBiArcs':	('BiArc', 'ToBiArcs', {}),
+}
+
+Exporters = {
+	'.step': 'exportStep', '.stp': 'exportStep',
+	'.brep': 'exportBrep', '.brp': 'exportBrep',
+	'.iges': 'exportIges', '.igs': 'exportIges',
+}
+
+class JobError(Exception):
+	pass
+
+def _proxyClass(type):
+	import importlib
+
+	if type not in Features:
+		raise JobError(f"unknown feature type {type}, expected one of {', '.join(Features)}")
+	module, cls, defaults = Features[type]
+	return getattr(importlib.import_module(module), cls), defaults
+
+def isGrabBag(obj):
+	proxy = getattr(obj, 'Proxy', None)
+	return any(type(proxy).__name__ == cls and type(proxy).__module__ == module for module, cls, _ in Features.values())
+
+def _value(doc, obj, prop, value):
+	"JSON value to property value, links are given by object name"
+	def link(name):
+		o = doc.getObject(name)
+		if o is None:
+			raise JobError(f"{obj.Name}.{prop}: no object named {name}")
+		return o
+
+	kind = obj.getTypeIdOfProperty(prop)
+	if kind in ('App::PropertyLink', 'App::PropertyLinkGlobal'):
+		return link(value) if value else None
+	if kind == 'App::PropertyLinkList':
+		return [ link(v) for v in value ]
+	if kind == 'App::PropertyLinkSub':
+		name, subs = value
+		return (link(name), subs)
+	return value
+
+def setProperties(doc, obj, props):
+	# links first, onChanged handlers may look at them
+	order = sorted(props, key=lambda p: 'Link' not in obj.getTypeIdOfProperty(p) if p in obj.PropertiesList else True)
+	for prop in order:
+		if prop not in obj.PropertiesList:
+			raise JobError(f"{obj.Name} has no property {prop}")
+		setattr(obj, prop, _value(doc, obj, prop, props[prop]))
+
+def build(doc, feature):
+	cls, defaults = _proxyClass(feature['type'])
+	obj = doc.addObject("Part::FeaturePython", feature.get('name', feature['type']))
+	cls(obj)
+	props = dict(defaults)
+	props.update(feature.get('properties', {}))
+	setProperties(doc, obj, props)
+	return obj
+
+def exportShapes(objs, paths):
+	shape = Part.makeCompound([ o.Shape for o in objs ])
+	for path in paths:
+		ext = os.path.splitext(path)[1].lower()
+		if ext not in Exporters:
+			raise JobError(f"can't export {path}, known formats: {', '.join(Exporters)}")
+		os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+		getattr(shape, Exporters[ext])(path)
+
+def expand(job):
+	"one job per combination of the matrix values"
+	matrix = job.get('matrix')
+	if not matrix:
+		return [ job ]
+	keys = list(matrix)
+	res = []
+	for i, values in enumerate(itertools.product(*(matrix[k] for k in keys))):
+		j = dict(job)
+		del j['matrix']
+		j['name'] = f"{job.get('name', 'job')}-{i:03d}"
+		j['values'] = dict(zip(keys, values))
+		sets = { o: dict(p) for o, p in job.get('set', {}).items() }
+		for key, v in j['values'].items():
+			o, prop = key.split('.', 1)
+			sets.setdefault(o, {})[prop] = v
+		j['set'] = sets
+		j['export'] = [ f"{root}-{i:03d}{ext}" for root, ext in map(os.path.splitext, job.get('export', [])) ]
+		res.append(j)
+	return res
+
+def loadSpec(path, force=False):
+	"list of jobs for a JSON spec or a directory of FCStd files, paths made absolute"
+	if os.path.isdir(path):
+		return [ { 'name': os.path.splitext(os.path.basename(f))[0], 'document': os.path.abspath(f),
+			'export': [ os.path.splitext(os.path.basename(f))[0]+'.step' ], 'force': force }
+			for f in sorted(glob.glob(os.path.join(path, '*.FCStd'))) ]
+
+	with open(path) as f:
+		spec = json.load(f)
+	if isinstance(spec, dict):
+		spec = spec['jobs']
+	base = os.path.dirname(os.path.abspath(path))
+	jobs = []
+	for job in spec:
+		job = dict(job)
+		if 'document' in job:
+			job['document'] = os.path.join(base, job['document'])
+		job['inputs'] = { n: os.path.join(base, p) for n, p in job.get('inputs', {}).items() }
+		job.setdefault('force', force)
+		jobs.extend(expand(job))
+	return jobs
+
+def runJob(job, outdir):
+	"build, recompute and export one job in this process, returns its manifest entry"
+	from grabbag import pool, fingerprint
+
+	pool.enabled = False	# we are the worker
+	times = {}
+	entry = { 'name': job.get('name', 'job'), 'status': 'ok', 'seconds': times }
+	if 'values' in job:
+		entry['values'] = job['values']
+	t0 = last = time.perf_counter()
+	def lap(what):
+		nonlocal last
+		t = time.perf_counter()
+		times[what] = t-last
+		last = t
+
+	doc = None
+	try:
+		if job.get('document'):
+			doc = App.openDocument(job['document'], hidden=True)
+		else:
+			doc = App.newDocument(entry['name'], hidden=True)
+		for name, path in job.get('inputs', {}).items():
+			doc.addObject("Part::Feature", name).Shape = Part.read(path)
+		lap('load')
+
+		built = [ build(doc, f) for f in job.get('features', []) ]
+		for name, props in job.get('set', {}).items():
+			obj = doc.getObject(name)
+			if obj is None:
+				raise JobError(f"no object named {name}")
+			setProperties(doc, obj, props)
+		if job.get('force'):
+			for obj in doc.Objects:
+				if isGrabBag(obj):
+					obj.touch()
+		lap('build')
+
+		doc.recompute()
+		lap('recompute')
+
+		if job.get('objects'):
+			objs = [ doc.getObject(n) for n in job['objects'] ]
+			if None in objs:
+				raise JobError(f"no object named {job['objects'][objs.index(None)]}")
+		else:
+			objs = built or [ o for o in doc.Objects if isGrabBag(o) ]
+		invalid = [ o.Name for o in objs if 'Invalid' in o.State or o.Shape.isNull() ]
+		if invalid:
+			raise JobError(f"recompute failed for {', '.join(invalid)}")
+		entry['objects'] = [ o.Name for o in objs ]
+
+		paths = [ os.path.join(outdir, p) for p in job.get('export', []) ]
+		exportShapes(objs, paths)
+		entry['outputs'] = paths
+		lap('export')
+	except Exception as e:
+		entry['status'] = 'failed'
+		entry['error'] = f"{type(e).__name__}: {e}"
+		if not isinstance(e, JobError):
+			entry['traceback'] = traceback.format_exc()
+	finally:
+		if doc is not None:
+			App.closeDocument(doc.Name)
+		fingerprint.clear()	# results of closed documents
+	times['total'] = time.perf_counter()-t0
+	return entry
+
+def run(spec, outdir, workers=None, force=False, manifest='manifest.json'):
+	"run every job of spec (JSON file or FCStd directory), returns the manifest"
+	from grabbag import pool
+
+	jobs = loadSpec(spec, force)
+	os.makedirs(outdir, exist_ok=True)
+	outdir = os.path.abspath(outdir)
+	if workers is None:
+		workers = pool.workerCount() or os.cpu_count() or 1
+	workers = max(1, min(workers, len(jobs)))
+
+	t = time.perf_counter()
+	if workers == 1:
+		entries = [ runJob(job, outdir) for job in jobs ]
+	else:
+		ctx = multiprocessing.get_context('spawn')
+		ctx.set_executable(pool.pythonExecutable())
+		with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as ex:
+			futures = [ ex.submit(runJob, job, outdir) for job in jobs ]
+			entries = []
+			for job, f in zip(jobs, futures):
+				try:
+					entries.append(f.result())
+				except Exception as e:	# the worker died
+					entries.append({ 'name': job.get('name', 'job'), 'status': 'failed', 'error': f"{type(e).__name__}: {e}" })
+
+	res = { 'spec': os.path.abspath(spec), 'workers': workers, 'seconds': time.perf_counter()-t,
+		'failed': sum(e['status'] != 'ok' for e in entries), 'jobs': entries }
+	if manifest:
+		with open(os.path.join(outdir, manifest), 'w') as f:
+			json.dump(res, f, indent=1)
+	return res
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(prog='grabbag.batch', description="Build, recompute and export GrabBag features without the GUI")
+	parser.add_argument('spec', help="JSON job spec or a directory of FCStd files")
+	parser.add_argument('-o', '--outdir', default='out')
+	parser.add_argument('-j', '--workers', type=int, help="worker processes, default Mod/GrabBag/Workers or one per core")
+	parser.add_argument('--force', action='store_true', help="recompute GrabBag features even when their saved shape is up to date")
+	parser.add_argument('--manifest', default='manifest.json', help="timing manifest, written to the output directory")
+	args = parser.parse_args(argv)
+
+	res = run(args.spec, args.outdir, args.workers, args.force, args.manifest)
+	for e in res['jobs']:
+		print(f"{e['name']}: {e['status']} {e.get('seconds', {}).get('total', 0):.2f}s {e.get('error', '')}")
+	print(f"{len(res['jobs'])} jobs, {res['failed']} failed, {res['seconds']:.2f}s with {res['workers']} workers")
+	return 1 if res['failed'] else 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,11 @@
+# Headless geometry algorithms behind the GrabBag features.
+
+from grabbag.core.helix import MakeHelix, FillHelix
+from grabbag.core.minmax import ComputeMinMax
+from grabbag.core.biarc import EdgeToBiArcs, cachedBiArcs, joinCurves, joinShape, cumulativeLengths, SegmentByLength, SegmentByRadius, SegmentCache, ArcLength, compactCurve, periodicDistances, mergeArcs, iterBiArcs
+from grabbag.core.biarctable import BiArcTable, cachedBiArcTable
+from grabbag.core.pointfit import fitPoints
+from grabbag.core.recompose import getRadii, periodic_interpolate, joinEdges, moveStart, periodicParameters
+from grabbag.core.sinewall import computeEdge, computeWall, computeDiscreet
+from grabbag.core.gcode import gcode, polyline, writeLines
+from grabbag.core.sketch import sketchGeometry, addToSketch
@@ -0,0 +1,630 @@
+#   Copyright (c) 2025 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Biarc decomposition, splitting and joining used by ToBiArcs. No GUI imports here.
+
+import Part
+import hashlib
+from math import pi
+from bisect import bisect_right
+from heapq import merge
+from grabbag.lru import LRUCache
+
+def EdgeToBiArcs(Edge, tolerance=0.01):
+	if type(Edge.Curve) in [ Part.Line, Part.Circle ]:
+		l=  Edge.Curve.toNurbs(Edge.FirstParameter,Edge.LastParameter)
+		l = l.toBiArcs(tolerance)
+	else:
+		l = Edge.Curve.toBiArcs(tolerance)
+	return l
+
+# Biarc decompositions by (edge geometry, tolerance). Only the tolerance changes
+# the fit, so switching ToBiArcs modes or split distances reuses it. The budget
+# is the float parameter Mod/GrabBag/BiArcCacheMB.
+ArcBytes = 1024		# rough memory of one arc or line segment, for the cache budget
+MB = 1024*1024
+
+def _cacheLimit():
+	import FreeCAD as App
+	return App.ParamGet("User parameter:BaseApp/Preferences/Mod/GrabBag").GetFloat("BiArcCacheMB", 64)*MB
+
+biArcCache = LRUCache(_cacheLimit(), lambda arcs: len(arcs)*ArcBytes)
+
+def setCacheLimit(mb):
+	biArcCache.resize(mb*MB)
+
+def edgeHash(edge):
+	return hashlib.sha1(edge.exportBrepToString().encode()).hexdigest()
+
+def cachedBiArcs(edge, tolerance=0.01):
+	"EdgeToBiArcs through biArcCache. Returns a new list, the arcs themselves are shared and must not be modified"
+	key = (edgeHash(edge), tolerance)
+	arcs = biArcCache.get(key)
+	if arcs is None:
+		arcs = EdgeToBiArcs(edge, tolerance)
+		biArcCache.put(key, arcs)
+	return list(arcs)
+
+def _mergeable(a, b, tolerance):
+	"a followed by b is a single arc or line within tolerance"
+	if a.EndPoint.distanceToPoint(b.StartPoint) > tolerance:
+		return False
+	if isinstance(a, Part.LineSegment) and isinstance(b, Part.LineSegment):
+		d = a.EndPoint-a.StartPoint
+		if d.Length < tolerance or d.dot(b.EndPoint-b.StartPoint) <= 0:	# degenerate or turning back
+			return False
+		return b.EndPoint.distanceToLine(a.StartPoint, d) <= tolerance
+	if isinstance(a, Part.ArcOfCircle) and isinstance(b, Part.ArcOfCircle):
+		if abs(a.Radius-b.Radius) > tolerance or a.Center.distanceToPoint(b.Center) > tolerance:
+			return False
+		if a.Axis.dot(b.Axis) < 1-tolerance/a.Radius:	# turning the other way
+			return False
+		sweep = (a.LastParameter-a.FirstParameter) + (b.LastParameter-b.FirstParameter)
+		return sweep < 2*pi-1e-6	# a full circle can't be one arc
+	return False
+
+def _merged(a, b, tolerance):
+	"the single line or arc from the start of a to the end of b through their joint, or None if they don't make one"
+	if not _mergeable(a, b, tolerance):
+		return None
+	if isinstance(b, Part.LineSegment):
+		return Part.LineSegment(a.StartPoint, b.EndPoint)
+	try:
+		return Part.Arc(a.StartPoint, a.EndPoint, b.EndPoint)	# through the joint, so on the same side
+	except Exception:	# the three points are collinear, no circle through them
+		return None
+
+def _inner(c):
+	"points inside c that a curve replacing it must pass within tolerance, besides its ends"
+	if isinstance(c, Part.ArcOfCircle):
+		return [ c.value((c.FirstParameter+c.LastParameter)/2) ]
+	return []
+
+def _deviation(c, p):
+	if isinstance(c, Part.LineSegment):
+		return p.distanceToLine(c.StartPoint, c.EndPoint-c.StartPoint)
+	return abs(p.distanceToPoint(c.Center)-c.Radius)
+
+def iterMergeArcs(curves, tolerance=0.01):
+	"""
+	merge runs of co-circular arcs and collinear lines, as toBiArcs leaves
+	them, into single arcs and lines. Every joint merged away (and the middle
+	of every merged arc) is checked against the new curve, so a long run of
+	nearly collinear pieces can't drift off by a tolerance per joint. A
+	generator over any iterable of curves, which are not modified.
+	"""
+	a = None
+	points = []	# what the curves merged into a passed through
+	for c in curves:
+		if a is not None:
+			m = _merged(a, c, tolerance)
+			if m is not None:
+				p = points + [ a.EndPoint ] + _inner(c)
+				if all(_deviation(m, q) <= tolerance for q in p):
+					a, points = m, p
+					continue
+			yield a
+		a, points = c, _inner(c)
+	if a is not None:
+		yield a
+
+def mergeArcs(curves, tolerance=0.01):
+	return list(iterMergeArcs(curves, tolerance))
+
+def iterBiArcs(edges, tolerance=0.01):
+	"the biarcs of every edge in turn, for consumers that stream"
+	for e in edges:
+		yield from cachedBiArcs(e, tolerance)
+
+def EdgeToBSpline(e):
+	try:
+		c=e.toNurbs().Edge1.Curve
+	except:
+		import FreeCAD as App
+		App.Console.PrintLog("EdgeToBSpline: toNurbs failed, converting the curve\n")
+		c=e.Curve.toBSpline()
+	c.segment(e.FirstParameter,e.LastParameter)
+	return c
+
+def joinCurves(curves):
+	"""
+	join a list of BSplines, neighbours pairwise, level by level. Every level
+	touches each pole about once, so n pieces take log(n) passes instead of
+	the n growing rebuilds of joining left to right. Seams that won't join
+	are left open. Returns the joined runs and the indices of the failed
+	seams, seam i being the one between curves[i] and curves[i+1]. The
+	first curve of each run is modified.
+	"""
+	items = [ (c, i, i) for i, c in enumerate(curves) ]	# curve, index of its first and last piece
+	failed = set()
+
+	while any(a[2] not in failed for a in items[:-1]):	# an untried seam left
+		merged = []
+		k = 0
+		while k < len(items):
+			a = items[k]
+			if k+1 < len(items) and a[2] not in failed:
+				b = items[k+1]
+				if a[0].join(b[0]):
+					merged.append( (a[0], a[1], b[2]) )
+				else:
+					failed.add(a[2])
+					merged += [ a, b ]
+				k += 2
+			else:
+				merged.append(a)
+				k += 1
+		items = merged
+
+	return [ a[0] for a in items ], sorted(failed)
+
+def joinShape(shp, failed=None, offset=0, compact=None, stats=None):
+	"""
+	join the edges of shp into one edge, or a compound of the joined runs if
+	some seams won't join. The distances of those seams from the start of
+	shp, plus offset, are added to the list failed. compact(curve) can
+	replace every joined run, returning ( curve, deviation ), see
+	compactCurve; ( deviation, pole count ) of each run is added to stats.
+	"""
+	bs = [ EdgeToBSpline(e) for e in shp.Edges ]
+	ends = cumulativeLengths(bs)[1:] if failed is not None else None	# before join changes the curves
+
+	runs, seams = joinCurves(bs)
+	if failed is not None:
+		failed.extend(offset+ends[i] for i in seams)
+	if compact or stats is not None:
+		done = []
+		for r in runs:
+			c, d = compact(r) if compact else (r, 0.0)
+			if stats is not None:
+				stats.append( (d, getattr(c, 'NbPoles', 0)) )
+			done.append(c)
+		runs = done
+	if len(runs) == 1:
+		return runs[0].toShape()
+	return Part.makeCompound([ r.toShape() for r in runs ])
+
+# Joined biarcs are degree 2 rational BSplines with a double knot at every
+# joint, hundreds of knots that every sweep or loft along them pays for.
+# compactCurve trades them for a few poles within the fit tolerance.
+CompactModes = [ 'None', 'Knot removal', 'Approximate' ]
+CompactTries = 4	# halvings of the removal tolerance before giving up
+
+def curveDeviation(c, ref):
+	"largest distance from points along ref to the curve c, sampled a few times per knot span of ref"
+	d = 0.0
+	for p in ref.discretize(Number=max(64, 4*ref.NbKnots)):
+		d = max(d, p.distanceToPoint(c.value(c.parameter(p))))
+	return d
+
+def compactCurve(bs, tolerance, mode='Knot removal'):
+	"""
+	a curve with fewer poles than the BSpline bs, deviating from it by at most
+	tolerance. 'Knot removal' removes every interior knot it can, 'Approximate'
+	fits a non rational degree 5 or lower BSpline through points of bs.
+	Returns the curve and its measured deviation; bs itself, unmodified, if
+	nothing within tolerance was found.
+	"""
+	if not isinstance(bs, Part.BSplineCurve):	# a single arc or line, nothing to compact
+		return bs, 0.0
+	if mode == 'Knot removal':
+		tol = tolerance
+		for k in range(CompactTries):
+			c = bs.copy()
+			for i in range(c.NbKnots-1, 1, -1):	# interior knots, from the end so the indices stay valid
+				c.removeKnot(i, 0, tol)
+			d = curveDeviation(c, bs)
+			if d <= tolerance:
+				return c, d
+			tol /= 2	# the removals add up, each one must stay smaller
+	elif mode == 'Approximate':
+		pts = bs.discretize(Deflection=tolerance/4)
+		c = Part.BSplineCurve()
+		c.approximate(Points=pts, DegMin=3, DegMax=5, Tolerance=tolerance/2, Continuity='C2', ParamType='Centripetal')
+		d = curveDeviation(c, bs)
+		if d <= tolerance and c.NbPoles < bs.NbPoles:
+			return c, d
+	return bs, 0.0
+
+LineRadius = 1000000	# the radius getRad reports for lines, and BiArcTable stores
+
+def getRad(c):
+	if type(c) in [Part.Circle, Part.ArcOfCircle]:
+		return c.Radius
+	else:
+		return LineRadius
+
+def splitGeo(c):
+	a=c.copy()
+	b=c.copy()
+
+	a.setParameterRange(a.FirstParameter, (a.FirstParameter+a.LastParameter)/2)
+	b.setParameterRange(a.LastParameter, b.LastParameter)
+	return a,b
+
+# Curves whose parameter is proportional to arc length. Anything else (the
+# BSplines splitGeoByLen makes of lines, or curves passed in directly) goes
+# through ArcLength.
+Uniform = ( Part.Line, Part.LineSegment, Part.Circle, Part.ArcOfCircle )
+
+GaussOrder = 8		# Gauss-Legendre points per knot span
+MaxNewton = 20
+_gauss = None
+
+def gaussLegendre():
+	"nodes and weights of GaussOrder point Gauss-Legendre quadrature on [0, 1]"
+	global _gauss
+	if _gauss is None:
+		from numpy.polynomial.legendre import leggauss
+		x, w = leggauss(GaussOrder)
+		_gauss = list(zip(((x+1)/2).tolist(), (w/2).tolist()))
+	return _gauss
+
+class ArcLength:
+	"""
+	arc length along the curve c as a function of its parameter, and the
+	inverse. The length of every knot span (Panels equal spans for curves
+	without knots) is integrated once by Gauss-Legendre quadrature and kept,
+	so a length is found by binary search for the span and Newton's method
+	inside it, the speed |c'(u)| being the derivative.
+	"""
+	Panels = 8
+
+	def __init__(self, c):
+		self.curve = c
+		u0, u1 = c.FirstParameter, c.LastParameter
+		knots = [ k for k in c.getKnots() if u0 < k < u1 ] if hasattr(c, 'getKnots') else []
+		if not knots:
+			knots = [ u0+(u1-u0)*i/self.Panels for i in range(1, self.Panels) ]
+		self.bounds = [u0] + knots + [u1]
+		self.acc = [0.0]
+		for a, b in zip(self.bounds, self.bounds[1:]):
+			self.acc.append(self.acc[-1] + self.integral(a, b))
+		self.length = self.acc[-1]
+
+	def speed(self, u):
+		return self.curve.getD1(u)[1].Length
+
+	def integral(self, a, b):
+		"arc length from parameter a to b, within one span"
+		h = b-a
+		return h*sum(w*self.speed(a+h*x) for x, w in gaussLegendre())
+
+	def lengthAt(self, u):
+		i = min(bisect_right(self.bounds, u), len(self.bounds)-1) - 1
+		return self.acc[i] + self.integral(self.bounds[i], u)
+
+	def parameter(self, l, tolerance=1e-9):
+		"the parameter at arc length l from the start"
+		i = min(bisect_right(self.acc, l), len(self.acc)-1) - 1
+		a, b = self.bounds[i], self.bounds[i+1]
+		span = self.acc[i+1]-self.acc[i]
+		u = a + (b-a)*(l-self.acc[i])/span if span > 0 else a	# proportional within the span to start with
+		for k in range(MaxNewton):
+			f = self.acc[i] + self.integral(a, u) - l
+			s = self.speed(u)
+			if abs(f) <= tolerance or s == 0:
+				break
+			u = min(max(u-f/s, a), b)
+		return u
+
+def arcLength(c):
+	"an ArcLength for c, or None if its parameter is proportional to length already"
+	return None if type(c) in Uniform else ArcLength(c)
+
+def parameterAtLength(c, l, table=None):
+	"the parameter of c at length l from its start, table being arcLength(c) if you have it"
+	if type(c) in Uniform:
+		return c.FirstParameter + (c.LastParameter-c.FirstParameter)*l/c.length()
+	return (table or ArcLength(c)).parameter(l)
+
+def trimGeo(c, u0, u1):
+	"the part of c from parameter u0 to u1, c is not modified"
+	if type(c) in [Part.LineSegment,Part.BSplineCurve ]:
+		return c.toNurbs(u0, u1)
+	a=c.copy()
+	a.setParameterRange(u0, u1)
+	return a
+
+def splitGeoByLen(c,l):
+	if(l<=0):
+		raise Exception("BUG! can't splitGeoByLen by <=0 length!")
+
+	r = parameterAtLength(c, l)
+	return trimGeo(c, c.FirstParameter, r), trimGeo(c, r, c.LastParameter)
+
+def cumulativeLengths(l):
+	"distance from the start of the curve list l to the start of each curve, plus the total length at the end"
+	acc=[0.0]
+	for c in l:
+		acc.append(acc[-1]+c.length())
+	return acc
+
+def periodicDistances(total, interval, offset=0, count=0):
+	"offset, offset+interval, ... up to total, or count of them if count is set. A generator, nothing is stored"
+	if interval <= 0:
+		return
+	k = n = 0
+	d = offset
+	while d < total and (not count or n < count):
+		if d > 0:
+			yield d
+			n += 1
+		k += 1
+		d = offset + k*interval
+
+def _distinct(sortedDistances):
+	last = None
+	for d in sortedDistances:
+		if d != last:
+			yield d
+			last = d
+
+def SegmentByLength(l, lenlist, cumulative=None, pattern=None):
+	"""
+	split the list of curves l at the distances in lenlist (measured from the
+	start of l, any order) and at the periodicDistances of pattern, a tuple
+	( interval, offset, count ), and yield the pieces as lists of curves.
+	Neither argument is modified. Lengths are summed once and every distance
+	is found by binary search, pass cumulativeLengths(l) as cumulative if
+	you have it. The pattern is merged in lazily, never as a list. Cuts are
+	placed by arc length (see ArcLength), each piece is trimmed once from
+	the curve it comes from.
+	"""
+	acc = cumulative or cumulativeLengths(l)
+	cuts = sorted(d for d in set(lenlist) if 0 < d < acc[-1])	# 0 and past the end split nothing
+	if pattern:
+		cuts = _distinct(merge(cuts, periodicDistances(acc[-1], *pattern)))
+
+	i=0		# first curve of l not yielded yet
+	head=None	# ( l[i-1], its arcLength, parameter of the previous cut in it ), the part after that cut not yielded yet
+
+	def rest(head):
+		c, t, u = head
+		return [ trimGeo(c, u, c.LastParameter) ]
+
+	for d in cuts:
+		if head is not None and d < acc[i]:	# another cut in the same curve
+			c, t, u = head
+			v = parameterAtLength(c, d-acc[i-1], t)
+			yield [ trimGeo(c, u, v) ]
+			head = (c, t, v)
+			continue
+
+		k = bisect_right(acc, d, i) - 1	# acc[k] <= d < acc[k+1]
+		seg = (rest(head) if head is not None else []) + l[i:k]
+		if d == acc[k]:		# right on the joint of two curves
+			yield seg
+			head,i = None,k
+		else:
+			c = l[k]
+			t = arcLength(c)	# shared by every cut in c
+			u = parameterAtLength(c, d-acc[k], t)
+			yield seg+[ trimGeo(c, c.FirstParameter, u) ]
+			head,i = (c, t, u),k+1
+
+	yield (rest(head) if head is not None else []) + l[i:]
+
+def curvesBetween(l, acc, a, b):
+	"the part of the curves l from distance a to b, acc being cumulativeLengths(l). Only the two end curves are split"
+	i = bisect_right(acc, a) - 1	# acc[i] <= a < acc[i+1]
+	k = bisect_right(acc, b, i) - 1
+	if k >= len(l):		# b is the total length
+		k = len(l)-1
+	first, last = l[i], l[k]
+	if i == k:		# a and b within one curve
+		if a == acc[i] and b >= acc[i+1]:
+			return [first]
+		t = arcLength(first)
+		ua = parameterAtLength(first, a-acc[i], t) if a > acc[i] else first.FirstParameter
+		ub = parameterAtLength(first, b-acc[i], t) if b < acc[i+1] else first.LastParameter
+		return [ trimGeo(first, ua, ub) ]
+	if a > acc[i]:
+		first = trimGeo(first, parameterAtLength(first, a-acc[i]), first.LastParameter)
+	seg = [first] + l[i+1:k]
+	if b > acc[k]:
+		if b < acc[k+1]:
+			last = trimGeo(last, last.FirstParameter, parameterAtLength(last, b-acc[k]))
+		seg.append(last)
+	return seg
+
+class SegmentCache:
+	"""
+	the joined segments of the last Split by Distance run of one feature, by
+	(start, end) distance. Adding a split distance only joins the two halves
+	of the segment it falls into, removing one only joins the merged segment;
+	the others are reused. key identifies the fitted curves, see toBiArcsShape.
+	"""
+	def __init__(self):
+		self.key = None
+		self.curves = None
+		self.acc = None
+		self.counts = None	# arcs before and after mergeArcs, for the report
+		self.segments = {}	# (start, end): (joined shape, failed seams from start, joinShape stats, its arcs and lines)
+
+	def fitted(self, key, fit):
+		"the curves of key, calling fit() only if they are not the ones kept"
+		if key != self.key or self.curves is None:
+			self.key, self.curves = key, fit()
+			self.acc = cumulativeLengths(self.curves)
+			self.segments = {}
+		return self.curves
+
+	def join(self, cuts, failed=None, compact=None, stats=None, pieces=None):
+		"""
+		the joined segments between the sorted distances cuts, reusing those
+		already joined. failed, compact and stats are as in joinShape, compact
+		must be the same for all calls with one key. The arcs and lines of
+		every segment, before joining, are added to pieces.
+		"""
+		ends = [0.0] + [ d for d in cuts if 0 < d < self.acc[-1] ] + [self.acc[-1]]
+		keep = {}
+		res = []
+		for a, b in zip(ends, ends[1:]):
+			if a == b:
+				continue
+			s = self.segments.get((a, b))
+			if s is None:
+				f, st = [], []
+				seg = curvesBetween(self.curves, self.acc, a, b)
+				s = ( joinShape(Part.makeCompound(seg), f, 0, compact, st), f, st, seg )
+			keep[(a, b)] = s
+			res.append(s[0])
+			if failed is not None:
+				failed.extend(a+d for d in s[1])
+			if stats is not None:
+				stats.extend(s[2])
+			if pieces is not None:
+				pieces.extend(s[3])
+		self.segments = keep	# only the current segmentation, so the memory stays that of one result
+		return res
+
+def SegmentByRadius( l, radii):
+	"""
+	split l, a list of curves or a BiArcTable, in the middle of every arc with
+	a radius in radii. Yields the lists of curves in between. Public, from
+	grabbag.core; ToBiArcs itself splits tables by distance with
+	splitDistances and SegmentByLength. A list is modified in place.
+	"""
+	if hasattr(l, 'splitDistances'):	# a BiArcTable, split the arcs in the middle by distance
+		yield from SegmentByLength(l.toCurves(), l.splitDistances(radii), l.cumulative.tolist())
+		return
+
+	radii = set(radii)	# membership is tested for every curve
+	i=j=0
+	curlen=0
+	while j<len(l):
+		while j<len(l) and not getRad(l[j]) in radii:
+			j+=1
+		if(True and j<len(l)):
+			a,b = splitGeo(l[j])
+			l[j]=a
+			yield l[i:j+1]
+			l[j]=b
+		else:
+			yield l[i:j]
+		i=j
+		j+=1
+
+def makeCumulative(l):
+	acc=0
+
+	for i in l:
+		acc+=i
+		yield acc
+
+def toBiArcsShape(shape, tolerance=0.01, mode='Just Join', distances=(), numRadii=1, fit=None, simplify=False, report=None, points=None, pattern=None, segments=None, radiusBelow=0, compact='None', curves=None):
+	"""
+	the ToBiArcs pipeline: convert the edges of shape (or the polylines in
+	points, a list of (N,3) point arrays) to biarcs, optionally
+	merge co-circular and collinear neighbours, and join/split them according
+	to mode. Returns the resulting shape and the RadiusSplits (None unless
+	splitting by radii). fit(edges, tolerance) can replace the serial per edge
+	fit, see grabbag.pool.fitBiArcs. pattern adds periodic split distances,
+	see SegmentByLength. If report is a dict it gets FailedSeams (distances
+	of seams that failed to join), ArcsBefore and ArcsAfter. A SegmentCache
+	in segments keeps the fit and the joined segments of Split by Distance
+	between calls, so changing one distance only rejoins one segment.
+	Split by Radii splits the arcs with the numRadii smallest radii, or all
+	arcs with a radius below radiusBelow if that is set. compact, one of
+	CompactModes, reduces the poles of every joined curve; the report then
+	also gets MaxDeviation and PoleCount (of all joined curves). The curves
+	the result is made of are added to the list curves, for the exporters:
+	the arcs and lines after fitting, Simplify and splitting, or the
+	compacted BSplines when compact joined them.
+	"""
+	counts = []
+
+	def fitted():
+		if points is not None:
+			from grabbag.core.pointfit import fitPoints
+			c = [ fitPoints(p, tolerance).toCurves() for p in points ]
+		elif fit:
+			c = fit(shape.Edges, tolerance)
+		else:
+			c = [ cachedBiArcs(e,tolerance) for e in shape.Edges ]
+		c = [ i for sub in c for i in sub ]	# combine the list of lists into a single list of elements
+		before = len(c)
+		if simplify:
+			c = mergeArcs(c, tolerance)
+		counts[:] = [ before, len(c) ]
+		return c
+
+	splits = None
+	failed = []
+	stats = []	# ( deviation, poles ) of every joined curve
+
+	def compacted(bs):
+		return compactCurve(bs, tolerance, compact)
+	squeeze = compacted if compact and compact != 'None' else None
+
+	if segments is not None and 'Distance' in mode:
+		if points is not None:
+			key = hashlib.sha1(repr(points).encode()).hexdigest()
+		else:
+			key = tuple(edgeHash(e) for e in shape.Edges)
+		c = segments.fitted((key, tolerance, simplify, compact), fitted)
+		if counts:
+			segments.counts = counts
+		counts = segments.counts	# fitted() didn't run if the curves were reused
+	else:
+		c = fitted()
+	if report is not None:
+		report.update(FailedSeams=failed, ArcsBefore=counts[0], ArcsAfter=counts[1])
+
+	pieces = []	# the arcs and lines of the result, in order
+
+	def joinSegments(segments):
+		j=[]
+		offset=0
+		for e in segments:
+			pieces.extend(e)
+			j.append(joinShape(Part.makeCompound(e), failed, offset, squeeze, stats))
+			offset+=j[-1].Length
+		return j
+
+	if 'Distance' in mode and segments is not None:
+		cuts = sorted(set(distances))
+		if pattern:
+			cuts = _distinct(merge(cuts, periodicDistances(segments.acc[-1], *pattern)))
+		c=Part.makeCompound(segments.join(cuts, failed, squeeze, stats, pieces))
+	elif 'Distance' in mode:
+		j = joinSegments(SegmentByLength(c, distances, pattern=pattern))
+		c=Part.makeCompound(j)
+	elif 'Radii' in mode and (numRadii>0 or radiusBelow>0):
+		from grabbag.core.biarctable import BiArcTable
+
+		t = BiArcTable.fromCurves(c)
+		splits = t.splitDistances(mask=t.radiusMask(numRadii, radiusBelow))	# split the arcs with the smallest radii in the middle
+		j = joinSegments(SegmentByLength(c, splits, t.cumulative.tolist()))
+		c=Part.makeCompound(j)
+
+	elif 'Join' in mode:
+		pieces = c
+		c=Part.makeCompound(c)
+		c = joinShape(c, failed, 0, squeeze, stats)
+	else:
+		pieces = c
+		c=Part.makeCompound(c)
+
+	if curves is not None:
+		curves.extend([ e.Curve for e in c.Edges ] if squeeze and stats else pieces)	# stats is empty unless something was joined
+	if report is not None:
+		report.update(MaxDeviation=max((d for d, n in stats), default=0.0), PoleCount=sum(n for d, n in stats))
+	return c, splits
@@ -0,0 +1,180 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Array backed biarc table. No GUI imports here.
+#
+# A fit of tens of thousands of arcs as Part geometry is one Python object (and
+# one OCC handle) per arc. BiArcTable keeps the same fit as a few NumPy arrays,
+# one row per arc or line, so radius and length passes run on whole arrays and
+# the fit can be cached on disk as .npz. Part geometry is only made again by
+# toCurves() when a Shape is needed.
+
+import os, heapq
+
+import numpy as np
+
+import Part
+import FreeCAD as App
+
+from grabbag.core.biarc import cachedBiArcs, edgeHash, MB, LineRadius
+from grabbag.lru import LRUCache
+
+LINE, ARC = 0, 1
+
+class BiArcTable:
+	Fields = ( 'kind', 'start', 'end', 'center', 'radius', 'axis', 'sweep', 'length' )
+
+	def __init__(self, kind, start, end, center, radius, axis, sweep, length):
+		self.kind = kind	# LINE or ARC
+		self.start = start	# (n,3)
+		self.end = end		# (n,3)
+		self.center = center	# (n,3), nan for lines
+		self.radius = radius	# LineRadius for lines
+		self.axis = axis	# (n,3) the arc turns counterclockwise around it, 0 for lines
+		self.sweep = sweep	# arc angle, 0 for lines
+		self.length = length
+		self.cumulative = np.concatenate(([0.0], np.cumsum(length)))	# distance of each start from the first, and the total
+
+	def __len__(self):
+		return len(self.kind)
+
+	@property
+	def nbytes(self):
+		return sum(getattr(self, f).nbytes for f in self.Fields) + self.cumulative.nbytes
+
+	@classmethod
+	def fromCurves(cls, curves):
+		"table of a biarc fit, a list of ArcOfCircle and LineSegment"
+		n = len(curves)
+		kind = np.zeros(n, np.int8)
+		start, end = np.zeros((n, 3)), np.zeros((n, 3))
+		center, axis = np.full((n, 3), np.nan), np.zeros((n, 3))
+		radius, sweep, length = np.full(n, float(LineRadius)), np.zeros(n), np.zeros(n)
+
+		for i, c in enumerate(curves):
+			start[i] = tuple(c.StartPoint)
+			end[i] = tuple(c.EndPoint)
+			if isinstance(c, Part.ArcOfCircle):
+				kind[i] = ARC
+				center[i] = tuple(c.Center)
+				axis[i] = tuple(c.Axis)
+				radius[i] = c.Radius
+				sweep[i] = c.LastParameter-c.FirstParameter
+				length[i] = c.Radius*sweep[i]
+			elif isinstance(c, Part.LineSegment):
+				length[i] = c.length()
+			else:
+				raise ValueError(f"BiArcTable holds arcs and lines, not {type(c).__name__}")
+		return cls(kind, start, end, center, radius, axis, sweep, length)
+
+	def midpoints(self):
+		"the point halfway along every row"
+		mid = (self.start+self.end)/2
+		arcs = self.kind == ARC
+		if arcs.any():
+			v = self.start[arcs]-self.center[arcs]
+			k = self.axis[arcs]
+			h = (self.sweep[arcs]/2)[:,None]
+			mid[arcs] = self.center[arcs] + v*np.cos(h) + np.cross(k, v)*np.sin(h)	# v is perpendicular to k
+		return mid
+
+	def toCurves(self, rows=None):
+		"Part geometry for the rows (default all)"
+		rows = range(len(self)) if rows is None else rows
+		mid = self.midpoints()
+		vec = lambda a: App.Vector(*a)
+		res = []
+		for i in rows:
+			if self.kind[i] == ARC:
+				res.append(Part.Arc(vec(self.start[i]), vec(mid[i]), vec(self.end[i])))
+			else:
+				res.append(Part.LineSegment(vec(self.start[i]), vec(self.end[i])))
+		return res
+
+	def smallestDistinct(self, k):
+		"the k smallest distinct radii, sorted. A heap over the distinct values rather than sorting every row"
+		return heapq.nsmallest(k, set(self.radius.tolist()))
+
+	def radiusMask(self, count=0, below=0):
+		"""
+		rows with one of the count smallest distinct radii, or a radius below
+		below if that is set. Both are a comparison against one value, no
+		membership test per row.
+		"""
+		if below > 0:
+			return self.radius < below
+		if count <= 0 or not len(self):
+			return np.zeros(len(self), bool)
+		return self.radius <= self.smallestDistinct(count)[-1]
+
+	def splitDistances(self, radii=None, mask=None):
+		"distances of the middle of every arc whose radius is in radii (or of the rows of mask), where SegmentByRadius splits"
+		if mask is None:
+			mask = np.isin(self.radius, np.fromiter(radii, float))
+		rows = np.nonzero(mask)[0]
+		return (self.cumulative[rows] + self.length[rows]/2).tolist()
+
+	def smallestRadii(self, threshold):
+		"""
+		for every run of rows with a radius below threshold, the distance of the
+		middle of its smallest arc. Like getRadii, a run still open at the end
+		doesn't count.
+		"""
+		below = np.concatenate(([False], self.radius < threshold, [False]))
+		edges = np.diff(below.astype(np.int8))
+		starts, stops = np.nonzero(edges == 1)[0], np.nonzero(edges == -1)[0]
+		res = []
+		for i, j in zip(starts, stops):
+			if j == len(self):	# still open at the end
+				continue
+			k = i + int(np.argmin(self.radius[i:j]))
+			res.append(float(self.cumulative[k] + self.length[k]/2))
+		return res
+
+	def save(self, path):
+		np.savez_compressed(path, **{ f: getattr(self, f) for f in self.Fields })
+
+	@classmethod
+	def load(cls, path):
+		with np.load(path) as data:
+			return cls(*(data[f] for f in cls.Fields))
+
+# Tables by (edge geometry, tolerance), in memory and, if the parameter
+# Mod/GrabBag/BiArcCacheDir names a directory, on disk as .npz.
+tableCache = LRUCache(16*MB, lambda t: t.nbytes)
+
+def _cacheDir():
+	return App.ParamGet("User parameter:BaseApp/Preferences/Mod/GrabBag").GetString("BiArcCacheDir", "")
+
+def cachedBiArcTable(edge, tolerance=0.01):
+	key = (edgeHash(edge), tolerance)
+	t = tableCache.get(key)
+	if t is not None:
+		return t
+	d = _cacheDir()
+	path = os.path.join(d, f"{key[0]}-{tolerance!r}.npz") if d else None
+	if path and os.path.isfile(path):
+		t = BiArcTable.load(path)
+	else:
+		t = BiArcTable.fromCurves(cachedBiArcs(edge, tolerance))
+		if path:
+			os.makedirs(d, exist_ok=True)
+			t.save(path)
+	tableCache.put(key, t)
+	return t
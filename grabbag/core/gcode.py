@@ -0,0 +1,101 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Streaming G-code for biarc paths. No GUI imports here.
+#
+# Controllers run arcs natively, so the arcs and lines of a biarc fit go out as
+# single G2/G3 and G1 moves instead of being discretized again. Everything is a
+# generator: curves are read one at a time and lines are yielded as they are
+# made, so a long path never sits in memory as a whole.
+#	with open('path.nc', 'w') as f:
+#		writeLines(f, gcode(iterBiArcs(shape.Edges, 0.01), feed=1200))
+
+import Part
+
+# plane: (G code, axes of the plane, normal axis, arc centre offset words)
+Planes = {
+	'XY': ('G17', (0, 1), 2, ('I', 'J')),
+	'ZX': ('G18', (2, 0), 1, ('K', 'I')),
+	'YZ': ('G19', (1, 2), 0, ('J', 'K')),
+}
+Axes = 'XYZ'
+
+def _fmt(v, precision):
+	s = f"{v:.{precision}f}".rstrip('0').rstrip('.')
+	return '0' if s in ('', '-0') else s
+
+def _words(pairs, precision):
+	return ' '.join(f"{w}{_fmt(v, precision)}" for w, v in pairs)
+
+def gcode(curves, feed=None, plane='XY', tolerance=0.01, precision=4, rapid=True, header=True, arcs=True):
+	"""
+	yield G-code lines for the curves, in order. Arcs in the plane (their axis
+	along its normal) become G2/G3 with centre offsets, lines become G1, any
+	other curve G1 moves within tolerance. Gaps between curves are crossed
+	with G0 if rapid is set, else G1. feed is in mm/min. Without arcs every
+	curve is discretized.
+	"""
+	if plane not in Planes:
+		raise ValueError(f"unknown plane {plane}, expected one of {', '.join(Planes)}")
+	code, (u, v), n, (wu, wv) = Planes[plane]
+
+	if header:
+		yield "G21 G90"	# mm, absolute
+		yield code
+	pos = None
+	feedSent = False
+
+	def move(g, p, extra=()):
+		nonlocal pos, feedSent
+		words = [ (Axes[i], p[i]) for i in range(3) if pos is None or abs(p[i]-pos[i]) > 10**-precision ]
+		line = g + ' ' + _words(words + list(extra), precision)
+		if g != 'G0' and feed and not feedSent:
+			line += f" F{_fmt(feed, precision)}"
+			feedSent = True
+		pos = p
+		return line
+
+	for c in curves:
+		start = c.StartPoint if hasattr(c, 'StartPoint') else c.value(c.FirstParameter)
+		if pos is None or pos.distanceToPoint(start) > tolerance:
+			yield move('G0' if rapid else 'G1', start)
+
+		if arcs and isinstance(c, Part.LineSegment):
+			yield move('G1', c.EndPoint)
+		elif arcs and isinstance(c, Part.ArcOfCircle) and abs(abs(c.Axis[n])-1) < 1e-9:
+			off = c.Center-start
+			yield move('G3' if c.Axis[n] > 0 else 'G2', c.EndPoint, ( (wu, off[u]), (wv, off[v]) ))
+		else:	# BSplines, or arcs out of the plane
+			for p in c.toShape().discretize(Deflection=tolerance)[1:]:
+				if p.distanceToPoint(pos) > 10**-precision:
+					yield move('G1', p)
+
+def polyline(curves, feed=None, plane='XY', tolerance=0.01, precision=4):
+	"the same path as nothing but G1 moves, the way a discretized shape goes out"
+	return gcode(curves, feed, plane, tolerance, precision, arcs=False)
+
+def writeLines(f, lines):
+	"write lines to the open file f, returns ( line count, bytes written )"
+	count = size = 0
+	for line in lines:
+		line += '\n'
+		f.write(line)
+		count += 1
+		size += len(line)
+	return count, size
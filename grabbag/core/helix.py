@@ -0,0 +1,153 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Helix construction used by PathHelix. No GUI imports here.
+
+import Part
+import FreeCAD as App
+from math import sin, cos, pi
+
+def radiusToGuide(p0,p1,guide):
+	N=p1-p0
+	N.normalize()
+	plane = Part.Plane(p0,N)
+
+	rp=guide.intersect(plane)[0]
+	# rp may be multiple points
+	rp = [p0.distanceToPoint(App.Vector(p.X,p.Y,p.Z)) for p in rp]	# convert Point to Vector then find distance to p0
+
+	return min(rp)
+
+def ComputePlane2d(angle):
+	y=sin(angle)
+	x=cos(angle)
+	z=0
+	return App.Vector(x,y,z)
+
+def computeRadial(v0,v1, angle, radius):#	-- start and end are vectors representing the sample point and the next sample point on the path
+	axis=v1-v0
+	axis.normalize()
+	u=ComputePlane2d(angle) * radius
+
+	Z=App.Vector(0,0,1)	# since the plane lies on XY
+	Y=App.Vector(0,1,0)
+
+	if abs(Z*axis) > abs(Y*axis): # compute u axis basis vector
+		y=axis.cross(Y)
+	else:
+		y=axis.cross(Z)
+
+	y.normalize()
+
+	t=axis.cross(y)		# compute x axis basis vector
+	t.normalize()
+	m=App.Matrix(t,y,axis)	# build a matrix to project the UV space into 3D space
+	v=m*u
+	return v	# Apply the transformed vector so that the origin is on the path.
+
+def DoesIntersect(line,face):
+	i=face.Surface.intersect(line)[0]
+
+	v = [ App.Vector(j.X,j.Y,j.Z) for j in i]
+	return [ i for i in v if face.isInside(i,0.001,True) ]	# Surface.intersect can return false positives sometimes, I don't know why
+								# face.isInside removes those
+
+def findIntersect(p, p1, theta, s):    # p is point as vector, v is direction from point, s is list of surfaves that might intersect.
+	v=computeRadial(p,p1, theta, 1)
+	v.normalize()
+	q = p+v*1000
+	ls=Part.LineSegment(p,q)
+	
+	i= [ DoesIntersect(ls,f) for f in s]
+	i = sum(i,[])
+	d= [ p.distanceToPoint(po) for po in i]
+	return p+(min(d)*v)
+
+def MakeHelix(path, pitch, radius, cont=0, rotation=0, direction=1, join=False, Guide=None, res=4, progress=None):
+	PathDistance=path.Length*res/pitch	# 4 sample points per turn
+	App.Console.PrintLog(f"MakeHelix distance={PathDistance}\n")
+	pathPoints = path.discretize(Distance=path.Length/PathDistance)
+
+	radialPoints = []
+
+	angle=rotation
+	increment = (-2*pi)*direction/res
+	rad = radius
+	for i in range(len(pathPoints)-1):
+		if progress:
+			progress(i, len(pathPoints)-1)
+		if Guide:
+			rad = radiusToGuide(pathPoints[i], pathPoints[i+1], Guide.Curve)
+		radialPoints.append( computeRadial(pathPoints[i], pathPoints[i+1], angle, rad) + pathPoints[i] )
+		angle = (angle+increment)%(2*pi)
+	if(cont):
+		i = len(pathPoints)-2
+		for x in range(cont):
+			radialPoints.append( computeRadial(pathPoints[i], pathPoints[i+1], angle, rad) + pathPoints[i] )
+			angle = (angle+increment)%(2*pi)
+
+	if path.isClosed():
+		radialPoints.append(radialPoints[0])
+		
+	arcs=[]
+	for i in range(0,len(radialPoints),2):
+		try:
+			arcs.append(Part.Arc(radialPoints[i], radialPoints[i+1], radialPoints[i+2]))
+		except:
+			App.Console.PrintLog(f"MakeHelix: arc failed through {radialPoints[i:i+3]}\n")
+
+
+	if join:
+		bs = [ a.toBSpline(a.FirstParameter, a.LastParameter) for a in arcs ]
+		b = bs[0]
+		[ b.join(e) for e in bs[1:] ]
+		return b.toShape()
+
+	shp=Part.Shape(arcs)
+	return Part.Wire(shp.Edges)
+
+def FillHelix(path, pitch, shape, rotation=0, direction=1, res=128, progress=None):
+	PathDistance=path.Length*res/pitch	# 4 sample points per turn
+	App.Console.PrintLog(f"FillHelix distance={PathDistance}\n")
+	pathPoints = path.discretize(Distance=path.Length/PathDistance)
+
+	shp = shape.Faces
+
+	angle=rotation
+	increment = (-2*pi)*direction/res
+
+	radialPoints = []
+	for i in range(len(pathPoints)-1):
+		if progress:
+			progress(i, len(pathPoints)-1)
+		radialPoints.append(findIntersect(pathPoints[i], pathPoints[i+1], angle, shp))
+		angle = (angle+increment)%(2*pi)
+
+	if path.isClosed():
+		radialPoints.append(radialPoints[0])
+
+	b = Part.BSplineCurve(radialPoints)
+
+	# need to approximate the BSplineCurve so it can work in a sweep
+	c=b.toBiArcs(0.001)
+	e=[ i.toBSpline(i.FirstParameter, i.LastParameter) for i in c]
+	c=e[0]
+	[ c.join(i) for i in e[1:]]
+	return c.toShape()
+
@@ -0,0 +1,206 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Vectorized biarc fit of raw polylines. No GUI imports here.
+#
+# Scanned outlines, slicer layers and discretize() output are already points;
+# interpolating a BSpline through them only so toBiArcs can fit it again is
+# wasted work. fitPoints() fits biarcs to an (N,3) point array directly:
+#	- Douglas-Peucker keeps the points needed to stay within tolerance/2
+#	- tangents at the kept points come from the circle through each point
+#	  and its neighbours
+#	- every span between kept points gets the equal-d biarc of its end points
+#	  and tangents, all spans at once in NumPy
+#	- a span whose biarc strays more than tolerance/2 from its chord is
+#	  replaced by the chord, so the result always stays within tolerance
+# The result is a BiArcTable, the same arcs and lines ToBiArcs works with.
+
+import numpy as np
+
+from grabbag.core.biarc import LineRadius
+from grabbag.core.biarctable import BiArcTable, LINE, ARC
+
+def _dot(a, b):
+	return np.einsum('ij,ij->i', a, b)
+
+def _unit(v):
+	n = np.linalg.norm(v, axis=-1, keepdims=True)
+	return np.divide(v, n, out=np.zeros_like(v), where=n > 0)
+
+DecimateWindow = 1000	# points between forced splits in decimate
+
+def _farthest(points, starts, ends):
+	"""
+	for every span starts[i]..ends[i] with points inside, the largest distance
+	of those points from the chord and the first point that far, like argmax.
+	All spans are measured at once. Returns ( spans with points inside,
+	distances, indices ).
+	"""
+	inner = ends-starts-1
+	spans = np.flatnonzero(inner > 0)
+	inner = inner[spans]
+	first = np.cumsum(inner)-inner	# where each span's points begin in the flat arrays
+	seg = np.repeat(np.arange(len(spans)), inner)
+	idx = starts[spans][seg] + 1 + np.arange(len(seg)) - first[seg]
+	a = points[starts[spans]]
+	d = points[ends[spans]]-a
+	l2 = _dot(d, d)
+	v = points[idx]-a[seg]
+	t = np.divide(_dot(v, d[seg]), l2[seg], out=np.zeros(len(seg)), where=l2[seg] > 0)	# a closed polyline measures from the point
+	dist = np.linalg.norm(v-np.clip(t, 0, 1)[:,None]*d[seg], axis=1)
+	if not len(dist):
+		return spans, dist, idx
+	best = np.maximum.reduceat(dist, first)
+	at = np.flatnonzero(dist == best[seg])
+	at = at[np.unique(seg[at], return_index=True)[1]]
+	return spans, best, idx[at]
+
+def decimate(points, tolerance):
+	"""
+	indices of the points Douglas-Peucker keeps, every other point is within
+	tolerance of the polyline through them. Level by level: the points of all
+	spans still open are measured at once, so the Python loop runs once per
+	level rather than once per span. The input is first split every
+	DecimateWindow points, otherwise a wave whose crests are all about as far
+	from the chord splits off one crest per level; the forced splits that
+	turn out not to be needed are dropped at the end.
+	"""
+	n = len(points)
+	keep = np.zeros(n, bool)
+	keep[0] = keep[-1] = True
+	starts = np.arange(0, n-1, DecimateWindow)
+	ends = np.append(starts[1:], n-1)
+	forced = starts[1:]
+	keep[forced] = True
+	while len(starts):
+		spans, best, k = _farthest(points, starts, ends)
+		split = best > tolerance
+		k = k[split]
+		keep[k] = True
+		starts, ends = np.concatenate((starts[spans][split], k)), np.concatenate((k, ends[spans][split]))
+
+	for f in (forced[::2], forced[1::2]):	# neighbouring forced splits can't both be dropped at once
+		kept = np.flatnonzero(keep)
+		pos = np.searchsorted(kept, f)
+		prev, next = kept[pos-1], kept[pos+1]
+		spans, best, k = _farthest(points, prev, next)
+		keep[f[spans][best <= tolerance]] = False
+	return np.nonzero(keep)[0]
+
+def tangents(p, closed=False):
+	"unit tangents at the points of polyline p, of the circle through each point and its neighbours"
+	d = np.diff(p, axis=0)
+	if len(p) == 2:
+		t = _unit(d[0])
+		return np.array([ t, t ])
+	l2 = _dot(d, d)[:,None]
+	t = np.empty_like(p)
+	t[1:-1] = d[:-1]*l2[1:] + d[1:]*l2[:-1]
+	if closed:
+		t[0] = t[-1] = d[-1]*l2[0] + d[0]*l2[-1]
+	else:	# mirror the neighbour's tangent over the end chord
+		t[1:-1] = _unit(t[1:-1])
+		w = _unit(d[0])
+		t[0] = 2*w.dot(t[1])*w - t[1]
+		w = _unit(d[-1])
+		t[-1] = 2*w.dot(t[-2])*w - t[-2]
+	return _unit(t)
+
+def _arcs(p, t, q):
+	"the arcs leaving p along t and ending at q: center, radius, axis, sweep, length, straight"
+	w = q-p
+	w2 = _dot(w, w)
+	nv = w - _dot(w, t)[:,None]*t
+	nl = np.linalg.norm(nv, axis=1)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		r = w2/(2*nl)
+		straight = ~(r < LineRadius)	# also catches nl == 0
+		c = p + np.where(straight, 0, r)[:,None]*_unit(nv)
+		sweep = 2*np.arccos(np.clip(_dot(t, _unit(w)), -1, 1))
+	axis = _unit(np.cross(p-c, t))
+	sweep = np.where(straight, 0, sweep)
+	r = np.where(straight, LineRadius, r)
+	length = np.where(straight, np.sqrt(w2), r*sweep)
+	return c, r, axis, sweep, length, straight
+
+def fitPoints(points, tolerance=0.01, closed=None):
+	"BiArcTable of biarcs within tolerance of the polyline through points, an (N,3) array"
+	p = np.asarray(points, float)
+	if len(p):
+		p = p[np.r_[True, np.any(np.diff(p, axis=0) != 0, axis=1)]]	# drop repeated points
+	if len(p) < 2:
+		raise ValueError("fitPoints needs at least 2 distinct points")
+	if closed is None:
+		closed = len(p) > 3 and np.allclose(p[0], p[-1])
+
+	p = p[decimate(p, tolerance/2)]
+	t = tangents(p, closed)
+	p1, p2, t1, t2 = p[:-1], p[1:], t[:-1], t[1:]
+
+	# equal-d biarcs, see e.g. Ryan Juckett's "Biarc Interpolation"
+	v = p2-p1
+	vt = _dot(v, t1+t2)
+	vv = _dot(v, v)
+	denom = 2*(1-_dot(t1, t2))
+	vt2 = _dot(v, t2)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		d = np.where(denom > 1e-12, (np.sqrt(vt*vt + denom*vv) - vt)/denom, vv/(4*vt2))
+	bad = ~np.isfinite(d) | (d <= 0)
+	d = np.where(bad, 0, d)
+	pm = (p1 + p2 + d[:,None]*(t1-t2))/2
+
+	c1, r1, a1, s1, l1, st1 = _arcs(p1, t1, pm)
+	c2, r2, a2, s2, l2, st2 = _arcs(p2, -t2, pm)	# fitted backwards from p2, so turn it around below
+	a2 = -a2
+
+	# how far the biarc strays from its chord: joint off the chord plus the arc sagittas
+	u = _unit(v)
+	off = pm-p1
+	joint = np.linalg.norm(off - _dot(off, u)[:,None]*u, axis=1)
+	sag = np.maximum(np.where(st1, 0, r1*(1-np.cos(s1/2))), np.where(st2, 0, r2*(1-np.cos(s2/2))))
+	chord = bad | (joint+sag > tolerance/2)
+
+	n = len(p1)
+	kind = np.empty(2*n, np.int8)
+	kind[0::2] = np.where(st1 | chord, LINE, ARC)
+	kind[1::2] = np.where(st2 | chord, LINE, ARC)
+	start = np.empty((2*n, 3))
+	end = np.empty((2*n, 3))
+	start[0::2], end[0::2] = p1, np.where(chord[:,None], p2, pm)
+	start[1::2], end[1::2] = np.where(chord[:,None], p2, pm), p2
+	center = np.empty((2*n, 3))
+	center[0::2], center[1::2] = c1, c2
+	radius = np.empty(2*n)
+	radius[0::2], radius[1::2] = r1, r2
+	axis = np.empty((2*n, 3))
+	axis[0::2], axis[1::2] = a1, a2
+	sweep = np.empty(2*n)
+	sweep[0::2], sweep[1::2] = s1, s2
+	length = np.empty(2*n)
+	length[0::2], length[1::2] = np.where(chord, np.sqrt(vv), l1), np.where(chord, 0, l2)
+
+	lines = kind == LINE
+	center[lines] = np.nan
+	radius[lines] = LineRadius
+	axis[lines] = 0
+	sweep[lines] = 0
+	length[lines] = np.linalg.norm(end[lines]-start[lines], axis=1)
+
+	rows = length > 0	# chords leave an empty second row, d == 0 an empty first one
+	return BiArcTable(kind[rows], start[rows], end[rows], center[rows], radius[rows], axis[rows], sweep[rows], length[rows])
@@ -0,0 +1,154 @@
+#   Copyright (c) 2025 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Curve resampling and split point helpers used by Recompose. No GUI imports here.
+
+import Part
+from grabbag.core.biarc import EdgeToBiArcs, cachedBiArcs, joinCurves, getRad, periodicDistances
+from grabbag.core.biarctable import cachedBiArcTable
+
+def parameterization(pts, val):
+	params = [0]
+	for i in range(1, len(pts)):
+		p = pts[i].sub(pts[i - 1])
+		pl = pow(p.Length, val)
+		params.append(params[-1] + pl)
+	m = float(max(params))
+	return [p / m for p in params]
+
+
+def periodic_interpolate(pts, params=None, tol=0):
+	if not params:
+		ptmp = pts + pts[:1]
+		params = parameterization(ptmp,1)
+
+	nbp = len(pts)
+	n = 1
+	if nbp <= 4:
+		n = 2
+	npts = pts
+	npts.extend(pts * (2 * n))
+	period = params[-1] - params[0]
+	nparams = []
+	for p in params:
+		for i in range(1, n + 1):
+			nparams.append(p)
+			nparams.append(p - i * period)
+			nparams.append(p + i * period)
+	npars = list(set(nparams))
+	npars.sort()
+	# interpolate the extended list of points
+	bs = Part.BSplineCurve()
+	bs.interpolate(Points=npts, Parameters=npars, PeriodicFlag=True)
+	# extract a one turn BSpline curve in the middle
+	offset = n * nbp
+	npoles = bs.getPoles()[offset:-offset - 1]
+	nmults = bs.getMultiplicities()[offset:-offset]
+	nknots = bs.getKnots()[offset:-offset]
+	nbs = Part.BSplineCurve()
+	nbs.buildFromPolesMultsKnots(npoles, nmults, nknots, True, 3)
+	return nbs.toShape()
+
+def resampleCurve(e, n, tol=0):
+	inc = e.Length/n
+	points = [ e.valueAt(e.FirstParameter+i*inc) for i in range(n) ]
+	
+	return periodic_interpolate(points, tol=tol)
+
+def forceRange(val, rnge):
+	while val<0:
+		val+=rnge
+	while val >= rnge:
+		val -= rnge
+
+	return val
+
+def joinEdges(l):
+	if not l:
+		return None
+	if len(l)==1:
+		return l[0]
+
+	c = [ e.Curve.toBSpline(e.FirstParameter, e.LastParameter) for e in l ]
+	runs, failed = joinCurves(c)
+	if failed:
+		return False
+
+	return runs[0].toShape()
+
+def moveStart(e,d):
+	p=e.getParameterByLength(d)
+	el = e.split(p).Edges
+	el = [ e.reversed() for e in el]
+	s=joinEdges(el)
+	return s.Edge1
+
+def getStartDistances(l):
+	acc=0
+
+	for e in l:
+		yield(acc)
+		acc+= e.length()
+
+def getLength(l):
+	acc=0
+	for e in l:
+		acc+=e.length()
+	return acc
+
+def getSmallest(c, i,j):
+	minval = getRad(c[i])
+	idx = i
+
+	for k in range(i+1,j):
+		r=getRad(c[k])
+		if r < minval:
+			minval=r
+			idx=k
+
+	return idx
+	
+
+def getRadii(edge, tr, tolerance=0.01):
+	"""
+	given an edge and a radius threshold, return a list of
+	distances where the radius is smallest.
+	"""
+	return cachedBiArcTable(edge,tolerance).smallestRadii(tr)
+
+def periodicParameters(edge, interval, offset=0, count=0):
+	"""
+	parameters of edge at the periodicDistances, each found from the previous
+	one so the curve length is integrated once over the whole edge
+	"""
+	c = edge.Curve
+	u = edge.FirstParameter
+	last = 0
+	for d in periodicDistances(edge.Length, interval, offset, count):
+		u = c.parameterAtDistance(d-last, u)
+		last = d
+		yield u
+
+def getKnotParams(edge):
+	c=edge.Curve
+	k = [ i for i in c.KnotSequence if i > edge.FirstParameter and i < edge.LastParameter ]
+	return k
+#	coeff = edge.Length/(edge.LastParameter - edge.FirstParameter)
+
+#	return [ d*coeff for d in k]
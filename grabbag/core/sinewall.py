@@ -0,0 +1,114 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+# Sine wave offset of face outlines used by SineWall. No GUI imports here.
+#
+# edges are lists of tuples ( edge, parent face of edge ), cg is the point the
+# wave is pushed away from.
+
+import Part
+from math import pi, sin, radians
+from grabbag.progress import scaled
+
+def computeOutVec(edge, param, cg):
+	P=edge.valueAt(param)
+	vc = (cg-P).normalize()
+	t = edge.tangentAt(param)
+	hinge = t.cross(vc).normalize()
+	return t.cross(hinge).normalize()
+
+def computeSinglePoint(edge, param, face, amplitude, cg):
+	P=edge.valueAt(param)
+	vec = computeOutVec(edge,param, cg)
+	if face.isInside(vec+P, 0.05, True):
+		vec = -vec
+
+	return P+(vec*amplitude)
+
+def computeEdge(edge, face, cg, amplitude=1, wavelength=10, granularity=64, phase=0, cutCorners=False, progress=None):
+	start,end = edge.ParameterRange
+	prange = end-start
+	count = int( (edge.Length/wavelength) * granularity)
+
+	if not count:
+		return [ edge.valueAt(start), edge.valueAt(end) ]
+	pInc = prange/count
+	aInc = 2*pi/granularity
+
+	def ComputeAval(i):
+		return sin((i%granularity)*aInc + 3*pi/2 + radians(phase))+1
+						
+	res = []
+	for i in range(count):
+		if progress:
+			progress(i, count)
+		res.append(computeSinglePoint(edge,start+(pInc*i), face, amplitude*ComputeAval(i), cg))
+	if cutCorners:
+		P = edge.valueAt(start)
+		if not P == res[0]:
+			Q = [P]
+			Q.extend(res)
+			res = Q
+		P = edge.valueAt(end)
+		if not P == res[-1]:
+			res.extend([P])
+
+	return res
+
+def computeWall(edges, cg, amplitude=1, wavelength=10, granularity=64, phase=0, alternatePhase=False, cutCorners=False, debug=False, progress=None):
+	pts=[]
+	for k,(e,f) in enumerate(edges):
+		p1 = computeEdge(e,f, cg, amplitude, wavelength, granularity, phase, cutCorners, scaled(progress, k, len(edges)))
+		if alternatePhase:
+			phase = (phase+180)%360
+		if pts and (p1[0]-pts[-1]).Length > (p1[-1]-pts[-1]).Length:	# if the end of the new segment is closer than the beginning (The edge is reversed)
+			p1.reverse()
+		if pts and (p1[0]-pts[-1]).Length > (p1[0] - pts[0]).Length:	# if the first one is backward compared to the second one
+			pts.reverse()
+		pts.extend(p1)
+	
+	if debug:
+		bs1=Part.BSplineCurve(pts)
+		Part.show(bs1.toShape())
+	pts.append(pts[0])	# close the loop.
+	bs = Part.BSplineCurve(pts)
+	try:
+		return bs.approximateBSpline(0.2,len(pts)//10,3,'C0') # caution, len(pts)/10 guessed empirically!
+	except:
+		return bs
+		
+def computeDiscreet(edges, cg, amplitude=1, wavelength=10, granularity=64, phase=0, cutCorners=False, progress=None):
+	bss=[]
+	for k,(e,f) in enumerate(edges):
+		pts=computeEdge(e,f, cg, amplitude, wavelength, granularity, phase, cutCorners, scaled(progress, k, len(edges)))
+		bs=Part.BSplineCurve(pts)
+		bss.append(bs.approximateBSpline(0.2, len(pts)//10, 3, 'C0'))	# caution, len(pts)/10 guessed empirically!
+			
+	return bss
+		
+def edgeInFace(edge, face):
+	for i in face.Edges:
+		if edge.isSame(i):
+			return True
+	return False
+
+def faceForEdge(edge, faces):
+	for f in faces:
+		if edgeInFace(edge, f):
+			return f
+	return None
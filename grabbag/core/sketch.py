@@ -0,0 +1,92 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+# Biarcs as native Sketcher geometry. No GUI imports here.
+#
+# The Sketcher solves circles and lines much faster than BSplines pulled in as
+# external geometry, so the arcs and lines of a biarc fit are moved into the
+# plane of a sketch and added as they are, tied together by coincident
+# constraints. Everything goes in with one addGeometry and one addConstraint:
+#	geo, coincident = sketchGeometry(curves, sketch.getGlobalPlacement())
+#	addToSketch(sketch, geo, coincident)
+
+import Part
+import FreeCAD as App
+
+def curvesPlacement(curves, tolerance=0.01):
+	"a placement whose XY plane holds all the curves, for a new sketch. ValueError if they aren't planar"
+	curves = list(curves)
+	plane = Part.makeCompound([ c.toShape() for c in curves ]).findPlane(tolerance) if curves else None
+	if plane is None:
+		raise ValueError("the biarcs are not in one plane, a sketch can't hold them")
+	return App.Placement(curves[0].StartPoint, App.Rotation(App.Vector(0, 0, 1), plane.Axis))
+
+def _local(c, inverse):
+	"""
+	c moved by the matrix inverse (a copy) and projected on its XY plane,
+	as ( geometry, pos of the start of c, pos of its end ) in Sketcher terms
+	"""
+	c = c.copy()	# the cached fits are shared
+	c.transform(inverse)
+	if isinstance(c, Part.ArcOfCircle):
+		mid = c.value((c.FirstParameter+c.LastParameter)/2)
+		s, m, e = ( App.Vector(p.x, p.y, 0) for p in (c.StartPoint, mid, c.EndPoint) )
+		if c.Axis.z < 0:	# the Sketcher keeps arcs counterclockwise, build it from the other end
+			return Part.Arc(e, m, s), 2, 1
+		return Part.Arc(s, m, e), 1, 2
+	if isinstance(c, Part.BSplineCurve) and (c.Degree > 1 or c.NbPoles > 2):	# compacted
+		for i, p in enumerate(c.getPoles(), 1):
+			c.setPole(i, App.Vector(p.x, p.y, 0), c.getWeight(i))
+		return c, 1, 2
+	s, e = c.StartPoint, c.EndPoint	# a line, or a split line which is a degree 1 BSpline
+	return Part.LineSegment(App.Vector(s.x, s.y, 0), App.Vector(e.x, e.y, 0)), 1, 2
+
+def sketchGeometry(curves, placement, tolerance=0.01):
+	"""
+	the arcs and lines of curves in the coordinates of a sketch at placement,
+	and the coincident constraints between neighbours that touch within
+	tolerance, as ( first, pos, second, pos ) geometry indices from 0.
+	A closed path is also closed in the sketch.
+	"""
+	inverse = placement.inverse().toMatrix()
+	geo, ends = [], []
+	for c in curves:
+		g, s, e = _local(c, inverse)
+		geo.append(g)
+		ends.append( (s, e) )
+
+	def point(i, pos):
+		return geo[i].StartPoint if pos == 1 else geo[i].EndPoint
+
+	coincident = []
+	pairs = list(zip(range(len(geo)-1), range(1, len(geo))))
+	if len(geo) > 2:
+		pairs.append( (len(geo)-1, 0) )
+	for i, j in pairs:
+		a, b = ends[i][1], ends[j][0]
+		if point(i, a).distanceToPoint(point(j, b)) <= tolerance:
+			coincident.append( (i, a, j, b) )
+	return geo, coincident
+
+def addToSketch(sketch, geo, coincident):
+	"add geo and the coincident constraints to sketch in one call each. Returns the index of the first new geometry"
+	import Sketcher
+	first = sketch.GeometryCount
+	sketch.addGeometry(geo, False)
+	sketch.addConstraint([ Sketcher.Constraint('Coincident', first+i, a, first+j, b) for i, a, j, b in coincident ])
+	return first
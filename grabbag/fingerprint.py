@@ -0,0 +1,219 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+# Input fingerprints for GrabBag features.
+#
+# FreeCAD touches every downstream object when anything upstream recomputes,
+# even if nothing the feature reads has actually changed. @cached wraps a proxy's
+# execute: it hashes the geometry of every linked object together with the
+# values of the feature's own properties, and if the hash matches the previous
+# run it puts the previous result back instead of recomputing it.
+#
+# Properties that execute writes (rather than reads) are listed in the proxy's
+# OutputProperties so they don't take part in the fingerprint and are restored
+# together with the Shape on a hit.
+#
+# Results are kept until their object or its document is deleted. Other per
+# object caches register with onForget() to be dropped at the same time.
+#
+# Features that call addProperties() also keep the fingerprint of their last
+# result in the document. FreeCAD already saves the Shape itself as BREP in the
+# FCStd, so restore() can adopt it on document open when the inputs still hash
+# the same, instead of recomputing.
+
+import hashlib, functools
+
+import FreeCAD as App
+
+# properties of every feature that execute doesn't read
+Ignored = { 'Shape', 'Placement', 'Label', 'Label2', 'Visibility', 'ExpressionEngine', 'Proxy', 'PersistResult', 'InputFingerprint', 'Offload', 'ParallelFit' }
+
+stats = { 'hits': 0, 'misses': 0 }
+objectStats = {}	# object name: [ hits, misses ]
+
+_results = {}
+_links = {}	# (document, object name): { link name: (fingerprint, result) }
+_forgetters = []	# f(document name, object name or None) of other per object caches
+_observer = None
+
+def shapeHash(shape):
+	return hashlib.sha1(shape.exportBrepToString().encode()).hexdigest()
+
+def _valueKey(v):
+	if isinstance(v, App.DocumentObject):
+		shp = getattr(v, 'Shape', None)
+		if shp is None and hasattr(getattr(v, 'Points', None), 'Points'):	# Points::Feature
+			return v.Name + ':' + hashlib.sha1(repr([ tuple(p) for p in v.Points.Points ]).encode()).hexdigest()
+		return v.Name + ':' + (shapeHash(shp) if shp is not None else '')
+	if isinstance(v, (list, tuple)):
+		return '(' + ','.join(_valueKey(i) for i in v) + ')'
+	return repr(v)
+
+def fingerprint(obj, outputs=()):
+	h = hashlib.sha1()
+	for name in sorted(obj.PropertiesList):
+		if name in Ignored or name in outputs:
+			continue
+		h.update(name.encode())
+		h.update(_valueKey(getattr(obj, name)).encode())
+	return h.hexdigest()
+
+def _key(obj):
+	return (obj.Document.Name, obj.Name)
+
+def _count(obj, hit):
+	s = objectStats.setdefault(obj.Name, [0, 0])
+	s[0 if hit else 1] += 1
+	stats['hits' if hit else 'misses'] += 1
+
+def lookup(obj, fp):
+	"previous result of obj if it was computed from fp, else None"
+	res = _results.get(_key(obj))
+	if res and res[0] == fp:
+		return res
+	return None
+
+def store(obj, fp, shape, outputs=None):
+	_results[_key(obj)] = (fp, shape, outputs or {})
+
+def forget(obj):
+	_forgetKeys(lambda k: k == _key(obj))
+	for f in _forgetters:
+		f(obj.Document.Name, obj.Name)
+
+def forgetDocument(name):
+	"drop the results of every object of the document called name"
+	_forgetKeys(lambda k: k[0] == name)
+	for f in _forgetters:
+		f(name, None)
+
+def _forgetKeys(match):
+	for d in (_results, _links):
+		for k in [ k for k in d if match(k) ]:
+			del d[k]
+
+def onForget(f):
+	"also call f(document name, object name) when an object's results are dropped, object name None for a whole document"
+	if f not in _forgetters:
+		_forgetters.append(f)
+
+def perLink(obj, links, key, compute):
+	"""
+	compute(link) for every link of obj, in order. A link whose geometry and
+	key (the rest of the inputs) hashed the same on the previous call gets its
+	previous result back, so features with many Base links only redo the ones
+	that changed. Results of links no longer there are dropped.
+	"""
+	old = _links.get(_key(obj), {})
+	new = {}
+	res = []
+	for l in links:
+		fp = (_valueKey(l), key)
+		r = old.get(l.Name)
+		if r is None or r[0] != fp:
+			r = (fp, compute(l))
+		new[l.Name] = r
+		res.append(r[1])
+	_links[_key(obj)] = new
+	return res
+
+def inputKey(obj, outputs=(), exclude=('Base',)):
+	"fingerprint of the feature's own properties, without the links in exclude, for perLink"
+	return fingerprint(obj, tuple(outputs)+tuple(exclude))
+
+def _persist(obj, fp):
+	"record fp as the fingerprint of the shape about to be saved, if the feature persists its result"
+	if hasattr(obj, 'InputFingerprint'):
+		v = fp if obj.PersistResult else ''
+		if obj.InputFingerprint != v:
+			obj.InputFingerprint = v
+
+def cached(execute):
+	"decorator for FeaturePython execute methods"
+	@functools.wraps(execute)
+	def wrapper(self, obj):
+		outputs = getattr(self, 'OutputProperties', ())
+		fp = fingerprint(obj, outputs)
+		res = lookup(obj, fp)
+		if res:		# also the results grabbag.pool computed in the workers
+			_count(obj, True)
+			obj.Shape = res[1]
+			for k, v in res[2].items():
+				setattr(obj, k, v)
+			_persist(obj, fp)
+			return
+		_count(obj, False)
+		ret = execute(self, obj)
+		store(obj, fp, obj.Shape, { k: getattr(obj, k) for k in outputs })
+		_persist(obj, fp)
+		return ret
+	return wrapper
+
+def addProperties(obj):
+	"add the persisted result properties, for __init__ and onDocumentRestored"
+	if not hasattr(obj, 'PersistResult'):
+		obj.addProperty("App::PropertyBool", "PersistResult", "Cache", "Reuse the saved shape on document open if the inputs are unchanged").PersistResult=True
+	if not hasattr(obj, 'InputFingerprint'):
+		obj.addProperty("App::PropertyString", "InputFingerprint", "Cache", "Fingerprint of the inputs the saved shape was computed from")
+		obj.setEditorMode("InputFingerprint", 1)
+
+def restore(proxy, obj):
+	"""
+	call from onDocumentRestored. Adopts the saved shape if it was computed
+	from the current inputs, and marks the feature for recompute if not.
+	"""
+	if not obj.PersistResult or not obj.InputFingerprint:
+		return False
+	outputs = getattr(proxy, 'OutputProperties', ())
+	fp = fingerprint(obj, outputs)
+	if fp != obj.InputFingerprint:
+		obj.touch()
+		return False
+	store(obj, fp, obj.Shape, { k: getattr(obj, k) for k in outputs })
+	obj.purgeTouched()
+	return True
+
+class _DeleteObserver:
+	def slotDeletedObject(self, obj):
+		forget(obj)
+
+	def slotDeletedDocument(self, doc):
+		forgetDocument(doc.Name)
+
+def install():
+	"drop the results of objects when they or their document go away"
+	global _observer
+
+	if _observer is None:
+		_observer = _DeleteObserver()
+		App.addDocumentObserver(_observer)
+
+def report():
+	lines = [ f"{'Object':<24}{'Hits':>8}{'Misses':>8}" ]
+	for name, (h, m) in sorted(objectStats.items()):
+		lines.append(f"{name[:23]:<24}{h:>8}{m:>8}")
+	lines.append(f"{'Total':<24}{stats['hits']:>8}{stats['misses']:>8}")
+	return "\n".join(lines)
+
+def clear():
+	_results.clear()
+	_links.clear()
+	objectStats.clear()
+	stats['hits'] = stats['misses'] = 0
+
+install()
@@ -0,0 +1,78 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+
+# Least recently used cache with a size budget. No FreeCAD imports here.
+
+from collections import OrderedDict
+
+class LRUCache:
+	"maps keys to values, dropping the least recently used ones when the sizes add up to more than maxSize"
+	def __init__(self, maxSize, sizeof=len):
+		self.maxSize = maxSize
+		self.sizeof = sizeof	# estimated size of a value, in the unit of maxSize
+		self.size = 0
+		self.hits = 0
+		self.misses = 0
+		self._data = OrderedDict()	# key: (value, size), least recently used first
+
+	def __len__(self):
+		return len(self._data)
+
+	def __contains__(self, key):
+		return key in self._data
+
+	def get(self, key, default=None):
+		item = self._data.get(key)
+		if item is None:
+			self.misses += 1
+			return default
+		self._data.move_to_end(key)
+		self.hits += 1
+		return item[0]
+
+	def put(self, key, value):
+		if key in self._data:
+			self.size -= self._data.pop(key)[1]
+		size = self.sizeof(value)
+		if size > self.maxSize:	# would evict everything else and still not fit
+			return
+		self._data[key] = (value, size)
+		self.size += size
+		self._evict()
+
+	def pop(self, key):
+		item = self._data.pop(key, None)
+		if item is not None:
+			self.size -= item[1]
+
+	def resize(self, maxSize):
+		self.maxSize = maxSize
+		self._evict()
+
+	def clear(self):
+		self._data.clear()
+		self.size = self.hits = self.misses = 0
+
+	def _evict(self):
+		while self.size > self.maxSize:
+			key, (value, size) = self._data.popitem(last=False)
+			self.size -= size
+
+	def report(self, unit=1, unitName=''):
+		return f"{len(self)} entries, {self.size/unit:.1f}{unitName} of {self.maxSize/unit:.1f}{unitName}, hits: {self.hits}, misses: {self.misses}"
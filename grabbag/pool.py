@@ -0,0 +1,187 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+# Worker pool for the heavy GrabBag features.
+#
+# FreeCAD recomputes on a single thread. Before a document recompute, prefetch()
+# looks for touched features that support offloading (their proxy has an
+# offload() method returning a grabbag.worker job) and whose inputs are not
+# going to change during this recompute. Those jobs run concurrently in worker
+# processes; their results are put in the grabbag.fingerprint cache, so the
+# normal recompute that follows picks them up instead of executing.
+#
+# The pool is off unless the integer parameter Mod/GrabBag/Workers is set
+# (-1 for one worker per core). Features can opt out with their Offload
+# property.
+
+import os, sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import FreeCAD as App
+
+from grabbag import fingerprint, worker
+from grabbag.core.biarc import EdgeToBiArcs, biArcCache, edgeHash
+
+_executor = None
+_observer = None
+enabled = True	# cleared in processes that are workers themselves, e.g. grabbag.batch
+
+def _param():
+	return App.ParamGet("User parameter:BaseApp/Preferences/Mod/GrabBag")
+
+def workerCount():
+	n = _param().GetInt("Workers", 0)
+	if n < 0:
+		n = os.cpu_count() or 1
+	return n
+
+def parallelFitMinEdges():
+	"fewest edges missing from the biarc cache worth sending to the pool, see benchmarks/parallel_biarcs.py"
+	return _param().GetInt("ParallelFitMinEdges", 16)
+
+def pythonExecutable():
+	"the python interpreter matching FreeCAD's, FreeCAD itself can't be used to spawn workers"
+	exe = _param().GetString("PythonExecutable", "")
+	if exe:
+		return exe
+	if os.path.basename(sys.executable).lower().startswith('python'):
+		return sys.executable
+	home = App.getHomePath()
+	for d in ('bin', ''):
+		for name in ('python3', 'python', 'python.exe'):
+			exe = os.path.join(home, d, name)
+			if os.path.isfile(exe):
+				return exe
+	return sys.executable
+
+def executor():
+	global _executor
+
+	if _executor is None:
+		ctx = multiprocessing.get_context('spawn')	# fork is not safe with the Qt and OCC state of the parent
+		ctx.set_executable(pythonExecutable())
+		_executor = ProcessPoolExecutor(max_workers=max(workerCount(), 1), mp_context=ctx)
+	return _executor
+
+def shutdown():
+	global _executor
+
+	if _executor is not None:
+		_executor.shutdown(cancel_futures=True)
+		_executor = None
+
+def addProperties(obj):
+	"add the per feature opt-out, for __init__ and onDocumentRestored"
+	if not hasattr(obj, 'Offload'):
+		obj.addProperty("App::PropertyBool", "Offload", "Cache", "Compute in a worker process when the GrabBag worker pool is enabled").Offload=True
+
+def fitBiArcs(edges, tolerance, ex=None, workers=None, minEdges=None):
+	"""
+	cachedBiArcs for a list of edges, with the edges missing from the biarc
+	cache fitted in chunks in the worker pool (or in ex, which has workers
+	processes). The result is in the order of edges. Fits here when fewer
+	than minEdges edges are missing, by default the ParallelFitMinEdges
+	parameter.
+	"""
+	if minEdges is None:
+		minEdges = parallelFitMinEdges()
+	keys = [ (edgeHash(e), tolerance) for e in edges ]
+	res = [ biArcCache.get(k) for k in keys ]
+	todo = [ i for i, r in enumerate(res) if r is None ]
+
+	if len(todo) < minEdges or (ex is None and not (enabled and workerCount())):
+		for i in todo:
+			res[i] = EdgeToBiArcs(edges[i], tolerance)
+	else:
+		ex = ex or executor()
+		n = max(len(todo)//(4*max(workers or workerCount(), 1)), 1)	# a few chunks per worker balances uneven edges
+		chunks = [ todo[i:i+n] for i in range(0, len(todo), n) ]
+		futures = [ ex.submit(worker.run, ('biArcs', ([ edges[i].exportBrepToString() for i in chunk ], tolerance))) for chunk in chunks ]
+		for chunk, f in zip(chunks, futures):
+			try:
+				fits = [ worker.decodeCurves(data) for data in f.result() ]
+			except Exception as e:
+				App.Console.PrintWarning(f"GrabBag: worker failed fitting biarcs, fitting them locally: {e}\n")
+				fits = [ EdgeToBiArcs(edges[i], tolerance) for i in chunk ]
+			for i, fit in zip(chunk, fits):
+				res[i] = fit
+	for i in todo:
+		biArcCache.put(keys[i], res[i])
+	return [ list(r) for r in res ]
+
+def _ready(obj):
+	"touched and none of its inputs will be recomputed before it"
+	if not obj.isTouched() and not obj.mustExecute():
+		return False
+	return not any(o.isTouched() or o.mustExecute() for o in obj.OutListRecursive)
+
+def jobs(doc):
+	"( object, fingerprint, job ) for every feature of doc that can be computed in a worker right now"
+	res = []
+	for obj in doc.Objects:
+		proxy = getattr(obj, 'Proxy', None)
+		if not hasattr(proxy, 'offload') or not getattr(obj, 'Offload', False):
+			continue
+		if not _ready(obj):
+			continue
+		fp = fingerprint.fingerprint(obj, getattr(proxy, 'OutputProperties', ()))
+		if fingerprint.lookup(obj, fp):
+			continue
+		try:
+			job = proxy.offload(obj)
+		except Exception as e:	# let the normal recompute report it
+			App.Console.PrintLog(f"GrabBag: can't offload {obj.Name}: {e}\n")
+			continue
+		if job:
+			res.append( (obj, fp, job) )
+	return res
+
+def prefetch(doc):
+	"compute the ready features of doc in the pool, returns how many results were stored"
+	todo = jobs(doc)
+	if len(todo) < 2:	# nothing to run concurrently, the serial path is cheaper
+		return 0
+
+	ex = executor()
+	futures = [ ex.submit(worker.run, job) for obj, fp, job in todo ]
+	done = 0
+	for (obj, fp, job), f in zip(todo, futures):
+		try:
+			brep, outputs = f.result()
+		except Exception as e:
+			App.Console.PrintWarning(f"GrabBag: worker failed on {obj.Name}, computing it locally: {e}\n")
+			continue
+		fingerprint.store(obj, fp, worker.shape(brep), outputs)
+		done += 1
+	return done
+
+class _RecomputeObserver:
+	def slotBeforeRecomputeDocument(self, doc):
+		if enabled and workerCount():
+			prefetch(doc)
+
+def install():
+	"hook prefetch() into every document recompute"
+	global _observer
+
+	if _observer is None:
+		_observer = _RecomputeObserver()
+		App.addDocumentObserver(_observer)
+
+install()
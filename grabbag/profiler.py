@@ -0,0 +1,180 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+# Opt-in recompute profiler for the GrabBag features.
+#
+# Proxy classes register themselves with @instrumented. While profiling is off
+# their methods are left untouched, so it costs nothing. enable() swaps execute
+# and onChanged for wrappers that run the call under cProfile and tracemalloc
+# and keep one record per call: wall time, peak Python memory, the number of
+# sample points evaluated and the number of calls into the OCC methods below.
+#
+# Profiling can be switched on for a whole session with the parameter
+# Mod/GrabBag/Profile, or from the python console:
+#	from grabbag import profiler
+#	profiler.enable(); App.ActiveDocument.recompute(); print(profiler.report())
+
+import cProfile, pstats, tracemalloc, functools, json, time, re
+
+import FreeCAD as App
+
+OCCCalls = ( 'valueAt', 'tangentAt', 'isInside', 'intersect', 'toBiArcs', 'join' )
+SampleCalls = ( 'computeRadial', 'findIntersect', 'computeSinglePoint', 'computeSlopeTheta' )	# one call per sample point
+Methods = ( 'execute', 'onChanged' )
+
+_classes = []
+_originals = {}
+_depth = 0
+_stats = None
+
+records = []
+enabled = False
+
+def _param():
+	return App.ParamGet("User parameter:BaseApp/Preferences/Mod/GrabBag")
+
+def _callName(key):
+	filename, line, name = key
+	m = re.match(r"<(?:built-in )?method '?(\w+)'?", name)
+	return m.group(1) if m else name
+
+def _record(cls, method, obj, wall, peak, prof):
+	global _stats
+
+	calls = dict.fromkeys(OCCCalls, 0)
+	samples = 0
+	if prof:
+		st = pstats.Stats(prof)
+		for key, (cc, nc, tt, ct, callers) in st.stats.items():
+			name = _callName(key)
+			if name in calls:
+				calls[name] += nc
+			elif name in SampleCalls:
+				samples += nc
+		if _stats is None:
+			_stats = st
+		else:
+			_stats.add(st)
+
+	records.append({
+		'object': obj.Name,
+		'label': obj.Label,
+		'class': cls.__name__,
+		'method': method,
+		'wall': wall,
+		'peak': peak,
+		'samples': samples,
+		'calls': calls,
+		'nested': prof is None,
+		})
+
+def _wrap(cls, method, fn):
+	@functools.wraps(fn)
+	def wrapper(self, obj, *args):
+		global _depth
+
+		if _depth:	# only one cProfile can be active, nested calls are timed only
+			t = time.perf_counter()
+			_depth += 1
+			try:
+				return fn(self, obj, *args)
+			finally:
+				_depth -= 1
+				_record(cls, method, obj, time.perf_counter()-t, 0, None)
+
+		prof = cProfile.Profile()
+		tracing = tracemalloc.is_tracing()
+		if not tracing:
+			tracemalloc.start()
+		tracemalloc.reset_peak()
+		_depth += 1
+		t = time.perf_counter()
+		try:
+			return prof.runcall(fn, self, obj, *args)
+		finally:
+			wall = time.perf_counter()-t
+			_depth -= 1
+			peak = tracemalloc.get_traced_memory()[1]
+			if not tracing:
+				tracemalloc.stop()
+			_record(cls, method, obj, wall, peak, prof)
+	return wrapper
+
+def _instrument(cls):
+	for m in Methods:
+		fn = cls.__dict__.get(m)
+		if fn and (cls, m) not in _originals:
+			_originals[(cls, m)] = fn
+			setattr(cls, m, _wrap(cls, m, fn))
+
+def instrumented(cls):
+	"class decorator for FeaturePython proxies"
+	_classes.append(cls)
+	if enabled:
+		_instrument(cls)
+	return cls
+
+def enable():
+	global enabled
+	enabled = True
+	for cls in _classes:
+		_instrument(cls)
+
+def disable():
+	global enabled
+	enabled = False
+	for (cls, m), fn in _originals.items():
+		setattr(cls, m, fn)
+	_originals.clear()
+
+def clear():
+	global _stats
+	records.clear()
+	_stats = None
+
+def summary():
+	"records merged per object and method, slowest first"
+	res = {}
+	for r in records:
+		s = res.setdefault((r['object'], r['method']), {
+			'object': r['object'], 'label': r['label'], 'class': r['class'], 'method': r['method'],
+			'count': 0, 'wall': 0.0, 'peak': 0, 'samples': 0, 'calls': dict.fromkeys(OCCCalls, 0) })
+		s['count'] += 1
+		s['wall'] += r['wall']
+		s['peak'] = max(s['peak'], r['peak'])
+		s['samples'] += r['samples']
+		for k, v in r['calls'].items():
+			s['calls'][k] += v
+	return sorted(res.values(), key=lambda s: s['wall'], reverse=True)
+
+def report():
+	lines = [ f"{'Object':<24}{'Method':<11}{'Calls':>6}{'Wall s':>10}{'Peak kB':>10}{'Samples':>9}  OCC calls" ]
+	for s in summary():
+		occ = ", ".join(f"{k}={v}" for k, v in s['calls'].items() if v)
+		lines.append(f"{s['label'][:23]:<24}{s['method']:<11}{s['count']:>6}{s['wall']:>10.3f}{s['peak']/1024:>10.0f}{s['samples']:>9}  {occ}")
+	return "\n".join(lines)
+
+def dump(basename):
+	"write basename.json with all records and basename.prof with the merged cProfile stats"
+	with open(basename+'.json', 'w') as f:
+		json.dump({ 'summary': summary(), 'records': records }, f, indent=1)
+	if _stats is not None:
+		_stats.dump_stats(basename+'.prof')
+
+if _param().GetBool("Profile", False):
+	enabled = True
@@ -0,0 +1,103 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+# Progress reporting and cancellation for the long running loops.
+#
+# The loops in grabbag.core take an optional progress callable and call it as
+# progress(done, total) between samples. Execute methods decorated with
+# @reporting make one available as current() while they run. With the GUI up it
+# drives FreeCAD's status bar progress indicator, and pressing Esc there cancels
+# the computation: the next progress call raises Cancelled. The exception
+# leaves execute, so FreeCAD keeps the previous shape and flags the feature for
+# another recompute.
+
+import functools
+
+import FreeCAD as App
+
+class Cancelled(Exception):
+	pass
+
+class _StatusBar:
+	"FreeCAD's progress indicator, Esc aborts the next step"
+	def __init__(self, label):
+		self.label = label
+		self.bar = None
+		self.pct = 0
+
+	def __call__(self, done, total):
+		if self.bar is None:
+			self.bar = App.Base.ProgressIndicator()
+			self.bar.start(f"{self.label} (Esc to cancel)", 100)
+		pct = min(int(100*done/total), 100) if total else 0
+		while self.pct < pct:
+			self.pct += 1
+			self.bar.next(True)
+
+	def stop(self):
+		if self.bar is not None:
+			self.bar.stop()
+			self.bar = None
+
+class Progress:
+	def __init__(self, label='', callback=None):
+		self.label = label
+		self.callback = callback
+		self.cancelled = False
+
+	def cancel(self):
+		self.cancelled = True
+
+	def __call__(self, done, total):
+		if self.cancelled:
+			raise Cancelled(f"{self.label}: cancelled, previous shape kept")
+		if self.callback:
+			try:
+				self.callback(done, total)
+			except Exception:	# the indicator raises when Esc was pressed
+				self.cancelled = True
+				raise Cancelled(f"{self.label}: cancelled, previous shape kept")
+
+	def stop(self):
+		if hasattr(self.callback, 'stop'):
+			self.callback.stop()
+
+_active = []
+
+def current():
+	"progress of the execute running right now, or None"
+	return _active[-1] if _active else None
+
+def scaled(progress, i, n):
+	"progress for step i of n, for loops that call other loops"
+	if not progress:
+		return None
+	return lambda done, total: progress(i + (done/total if total else 0), n)
+
+def reporting(execute):
+	"decorator for FeaturePython execute methods"
+	@functools.wraps(execute)
+	def wrapper(self, obj):
+		p = Progress(obj.Label, _StatusBar(obj.Label) if App.GuiUp else None)
+		_active.append(p)
+		try:
+			return execute(self, obj)
+		finally:
+			_active.pop()
+			p.stop()
+	return wrapper
@@ -0,0 +1,110 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+# Coalescing recompute scheduler.
+#
+# Several features recompute themselves from onChanged so the result follows
+# the property editor. Editing a few properties in a row, or a script setting
+# many of them, used to run one full recompute per change. request() only
+# marks the feature dirty; the pending features are recomputed once each:
+#	- with the GUI up, on the next event loop tick
+#	- in a script, when the open transaction is committed or inside batch()
+#	- otherwise right away, as before
+
+from contextlib import contextmanager
+
+import FreeCAD as App
+
+stats = { 'requests': 0, 'recomputes': 0 }
+
+_pending = {}	# (document name, object name): recursive
+_timer = False
+_batch = 0
+_observer = None
+
+class _TransactionObserver:
+	def slotCommitTransaction(self, doc):
+		flush()
+
+	def slotAbortTransaction(self, doc):
+		flush()
+
+def _defer():
+	global _timer
+
+	if _batch:
+		return True
+	if App.GuiUp:
+		if not _timer:
+			from PySide import QtCore
+			QtCore.QTimer.singleShot(0, flush)
+			_timer = True
+		return True
+	return False
+
+def request(obj, recursive=False):
+	"ask for obj.recompute(recursive), merged with any other request before the next flush"
+	global _observer
+
+	stats['requests'] += 1
+	key = (obj.Document.Name, obj.Name)
+	_pending[key] = _pending.get(key, False) or recursive
+
+	if _defer():
+		return
+	if obj.Document.HasPendingTransaction:
+		if _observer is None:
+			_observer = _TransactionObserver()
+			App.addDocumentObserver(_observer)
+		return
+	flush()
+
+def flush():
+	global _timer
+
+	_timer = False
+	while _pending:
+		(docName, name), recursive = _pending.popitem()
+		try:
+			obj = App.getDocument(docName).getObject(name)
+		except NameError:	# document closed in the meantime
+			continue
+		if obj is None:		# object deleted in the meantime
+			continue
+		stats['recomputes'] += 1
+		obj.recompute(recursive)
+
+@contextmanager
+def batch():
+	"defer every request made inside the block to its end"
+	global _batch
+
+	_batch += 1
+	try:
+		yield
+	finally:
+		_batch -= 1
+		if not _batch:
+			flush()
+
+def saved():
+	"number of recomputes that were merged into another one"
+	return stats['requests'] - stats['recomputes'] - len(_pending)
+
+def report():
+	return f"Recompute requests: {stats['requests']}, recomputes run: {stats['recomputes']}, saved: {saved()}"
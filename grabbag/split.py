@@ -0,0 +1,36 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+
+# Periodic "split every N mm" properties shared by ToBiArcs and Recompose.
+# Only the interval, offset and count are stored, the split positions are
+# generated when the feature recomputes.
+
+def addSplitPattern(obj, group):
+	"add the periodic split properties, for __init__ and onDocumentRestored"
+	if not hasattr(obj, 'SplitInterval'):
+		obj.addProperty("App::PropertyFloatConstraint", "SplitInterval", group, "Also split every SplitInterval along the curve, 0 to disable").SplitInterval=(0.0, 0.0, float('inf'), 1.0)
+	if not hasattr(obj, 'SplitOffset'):
+		obj.addProperty("App::PropertyFloat", "SplitOffset", group, "Distance of the first periodic split from the start of the curve")
+	if not hasattr(obj, 'SplitCount'):
+		obj.addProperty("App::PropertyInteger", "SplitCount", group, "Number of periodic splits, 0 to repeat until the end of the curve")
+
+def splitPattern(obj):
+	"(interval, offset, count) for SegmentByLength, or None when the periodic split is off"
+	if obj.SplitInterval <= 0:
+		return None
+	return (obj.SplitInterval, obj.SplitOffset, max(obj.SplitCount, 0))
@@ -0,0 +1,104 @@
+#   Copyright (c) 2026 Steven James <pyro@4axisprinting.com>        
+#                                                                         
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#                                                                         
+
+# Job functions run in the worker processes of grabbag.pool.
+#
+# Shapes travel as BREP strings both ways, everything else as plain python
+# values. Every job returns ( BREP of the result, { output property: value } ),
+# except biArcs, which returns the curves themselves, see encodeCurves.
+
+import FreeCAD as App
+import Part
+
+from grabbag.core.helix import MakeHelix, FillHelix
+from grabbag.core.biarc import EdgeToBiArcs, toBiArcsShape
+from grabbag.core.sinewall import computeWall, computeDiscreet
+
+def shape(brep):
+	s = Part.Shape()
+	s.importBrepFromString(brep)
+	return s
+
+def encodeCurves(curves):
+	"arcs and lines as points, anything else as BREP, the biarc fits are mostly the former"
+	res = []
+	for c in curves:
+		if isinstance(c, Part.ArcOfCircle):
+			mid = c.value((c.FirstParameter+c.LastParameter)/2)
+			res.append( ('arc', tuple(c.StartPoint), tuple(mid), tuple(c.EndPoint)) )
+		elif isinstance(c, Part.LineSegment):
+			res.append( ('line', tuple(c.StartPoint), tuple(c.EndPoint)) )
+		else:
+			res.append( ('brep', c.toShape().exportBrepToString()) )
+	return res
+
+def decodeCurves(data):
+	res = []
+	for kind, *args in data:
+		if kind == 'arc':
+			res.append(Part.Arc(*(App.Vector(*p) for p in args)))
+		elif kind == 'line':
+			res.append(Part.LineSegment(*(App.Vector(*p) for p in args)))
+		else:
+			e = shape(args[0]).Edge1
+			res.append(e.Curve.toBSpline(e.FirstParameter, e.LastParameter))
+	return res
+
+def helix(spine, pitch, radius, cont, rotation, direction, join, guide):
+	if guide:
+		guide = shape(guide).Edge1
+	w = MakeHelix(shape(spine), pitch, radius, cont=cont, rotation=rotation, direction=direction, join=join, Guide=guide)
+	return w.exportBrepToString(), {}
+
+def fillHelix(spine, pitch, fill, rotation, direction, res):
+	w = FillHelix(shape(spine), pitch, shape(fill), rotation=rotation, direction=direction, res=res)
+	return w.exportBrepToString(), {}
+
+def sineWall(pairs, faces, cg, amplitude, wavelength, granularity, phase, alternatePhase, cutCorners, discreet):
+	faces = [ shape(f).Face1 for f in faces ]
+	edges = [ (shape(e).Edge1, faces[fi] if fi is not None else None) for e, fi in pairs ]
+	cg = App.Vector(*cg)
+	if discreet:
+		bss = computeDiscreet(edges, cg, amplitude, wavelength, granularity, phase, cutCorners)
+		c = Part.makeCompound([ bs.toShape() for bs in bss ])
+	else:
+		c = computeWall(edges, cg, amplitude, wavelength, granularity, phase, alternatePhase, cutCorners).toShape()
+	return c.exportBrepToString(), {}
+
+def toBiArcs(base, tolerance, mode, distances, numRadii, simplify, pattern, radiusBelow, compact):
+	outputs = {}
+	c, splits = toBiArcsShape(shape(base), tolerance, mode, distances, numRadii, simplify=simplify, report=outputs, pattern=pattern, radiusBelow=radiusBelow, compact=compact)
+	if splits is not None:
+		outputs['RadiusSplits'] = splits
+	return c.exportBrepToString(), outputs
+
+def biArcs(edges, tolerance):
+	"the biarc fit of every edge, in order"
+	return [ encodeCurves(EdgeToBiArcs(shape(e).Edge1, tolerance)) for e in edges ]
+
+Jobs = {
+	'helix': helix,
+	'fillHelix': fillHelix,
+	'sineWall': sineWall,
+	'toBiArcs': toBiArcs,
+	'biArcs': biArcs,
+}
+
+def run(job):
+	name, args = job
+	return Jobs[name](*args)
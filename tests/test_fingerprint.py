@@ -0,0 +1,91 @@
+# Fingerprint cache behaviour that needs a FreeCAD document. Run with FreeCAD's
+# python: python -m pytest tests
+
+import sys
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+App = pytest.importorskip("FreeCAD")
+import Part
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from grabbag import fingerprint, pool
+import BiArc
+
+@pytest.fixture
+def doc():
+	d = App.newDocument("FingerprintTest")
+	yield d
+	App.closeDocument(d.Name)
+	fingerprint.clear()
+
+def test_prefetched_result_saves_fingerprint(doc, monkeypatch):
+	"a result computed by pool.prefetch is a cache hit on recompute, and still records InputFingerprint"
+	features = []
+	for i in range(2):	# prefetch only runs two or more jobs
+		line = doc.addObject("Part::Feature", f"Line{i}")
+		line.Shape = Part.makeLine(App.Vector(0, i, 0), App.Vector(10, i, 0))
+		f = doc.addObject("Part::FeaturePython", f"ToBiArcs{i}")
+		BiArc.ToBiArcs(f)
+		f.Base = [ line ]
+		features.append(f)
+	doc.recompute()
+	for f in features:
+		f.InputFingerprint = ''
+		f.touch()
+
+	monkeypatch.setattr(pool, 'executor', lambda: ThreadPoolExecutor(1))	# the jobs run here instead of in spawned processes
+	assert pool.prefetch(doc) == 2
+	hits = fingerprint.stats['hits']
+	doc.recompute()
+
+	assert fingerprint.stats['hits'] == hits+2
+	for f in features:
+		assert f.InputFingerprint == fingerprint.fingerprint(f, BiArc.ToBiArcs.OutputProperties)
+
+def test_deleting_drops_results(doc):
+	"the cached results of a feature and its per link results go when it is deleted"
+	line = doc.addObject("Part::Feature", "Line")
+	line.Shape = Part.makeLine(App.Vector(0, 0, 0), App.Vector(10, 0, 0))
+	f = doc.addObject("Part::FeaturePython", "ToBiArcs")
+	BiArc.ToBiArcs(f)
+	f.Base = [ line ]
+	doc.recompute()
+	key = (doc.Name, f.Name)
+	assert key in fingerprint._results and key in fingerprint._links
+	assert any(k[:2] == key for k in BiArc._segments)
+
+	doc.removeObject(f.Name)
+	assert key not in fingerprint._results and key not in fingerprint._links
+	assert not any(k[:2] == key for k in BiArc._segments)
+
+def test_saved_result_is_adopted_on_open(tmp_path):
+	"the linked shapes hash the same after a save and reopen, so the saved shape is used as it is"
+	doc = App.newDocument("PersistTest")
+	line = doc.addObject("Part::Feature", "Line")
+	line.Shape = Part.makeLine(App.Vector(0, 0, 0), App.Vector(10, 5, 0))
+	f = doc.addObject("Part::FeaturePython", "ToBiArcs")
+	BiArc.ToBiArcs(f)
+	f.Base = [ line ]
+	doc.recompute()
+	saved = f.InputFingerprint
+	assert saved
+
+	path = str(tmp_path/"persist.FCStd")
+	doc.saveAs(path)
+	App.closeDocument(doc.Name)	# else openDocument hands back the open one
+	fingerprint.clear()
+	doc = App.openDocument(path)
+	try:
+		f = doc.getObject("ToBiArcs")
+		assert fingerprint.fingerprint(f, BiArc.ToBiArcs.OutputProperties) == saved
+		assert f.InputFingerprint == saved
+		assert not f.isTouched() and not f.mustExecute()
+		doc.recompute()
+		assert fingerprint.stats['misses'] == 0
+	finally:
+		App.closeDocument(doc.Name)
+		fingerprint.clear()
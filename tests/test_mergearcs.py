@@ -0,0 +1,38 @@
+# Merging of toBiArcs' split lines and arcs. Run with FreeCAD's python:
+# python -m pytest tests
+
+import sys
+from math import pi
+from pathlib import Path
+
+import pytest
+
+App = pytest.importorskip("FreeCAD")
+import Part
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from grabbag.core.biarc import mergeArcs
+
+def test_collinear_lines_merge():
+	points = [App.Vector(i, 0, 0) for i in range(10)]
+	merged = mergeArcs([Part.LineSegment(a, b) for a, b in zip(points, points[1:])])
+	assert len(merged) == 1
+	assert merged[0].EndPoint.isEqual(points[-1], 1e-9)
+
+def test_drift_is_checked_at_every_joint():
+	"each joint is within tolerance of its neighbours' line, but not of the merged one"
+	points = [App.Vector(i, 0.0004*i*i, 0) for i in range(40)]
+	merged = mergeArcs([Part.LineSegment(a, b) for a, b in zip(points, points[1:])], 0.01)
+	assert len(merged) > 1
+	for line in merged:
+		for p in points:
+			if line.StartPoint.x <= p.x <= line.EndPoint.x:
+				assert p.distanceToLine(line.StartPoint, line.EndPoint-line.StartPoint) <= 0.01+1e-9
+
+def test_cocircular_arcs_merge():
+	circle = Part.Circle(App.Vector(), App.Vector(0, 0, 1), 5)
+	arcs = [Part.ArcOfCircle(circle, i*pi/8, (i+1)*pi/8) for i in range(8)]
+	merged = mergeArcs(arcs)
+	assert len(merged) == 1
+	assert abs(merged[0].Radius-5) < 1e-9
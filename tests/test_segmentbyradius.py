@@ -0,0 +1,39 @@
+# SegmentByRadius, public in grabbag.core, on curves and on a BiArcTable.
+# Run with FreeCAD's python: python -m pytest tests
+
+import sys
+from math import pi
+from pathlib import Path
+
+import pytest
+
+App = pytest.importorskip("FreeCAD")
+import Part
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from grabbag.core import SegmentByRadius
+from grabbag.core.biarctable import BiArcTable
+
+def curves():
+	"line, quarter arc of radius 2, line, quarter arc of radius 5"
+	v = App.Vector
+	small = Part.ArcOfCircle(Part.Circle(v(10, 2, 0), v(0, 0, 1), 2), -pi/2, 0)
+	big = Part.ArcOfCircle(Part.Circle(v(7, 12, 0), v(0, 0, 1), 5), 0, pi/2)
+	return [ Part.LineSegment(v(0, 0, 0), v(10, 0, 0)), small, Part.LineSegment(v(12, 2, 0), v(12, 12, 0)), big ]
+
+def lengths(segments):
+	return [ sum(c.length() for c in s) for s in segments ]
+
+@pytest.mark.parametrize('table', [ False, True ])
+def test_splits_in_the_middle_of_matching_arcs(table):
+	l = curves()
+	total = sum(c.length() for c in l)
+	first = 10 + pi	# the line and half of the radius 2 arc
+	segments = list(SegmentByRadius(BiArcTable.fromCurves(l) if table else l, [ 2 ]))
+	assert len(segments) == 2
+	assert lengths(segments) == pytest.approx([ first, total-first ])
+
+def test_no_matching_radius_is_one_segment():
+	l = curves()
+	assert lengths(SegmentByRadius(l, [ 3 ])) == pytest.approx([ sum(c.length() for c in curves()) ])
@@ -0,0 +1,28 @@
+# Biarcs and compacted curves as Sketcher geometry. Run with FreeCAD's python:
+# python -m pytest tests
+
+import sys
+from pathlib import Path
+
+import pytest
+
+App = pytest.importorskip("FreeCAD")
+import Part
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from grabbag.core.sketch import sketchGeometry
+
+def test_everything_is_projected_on_the_sketch_plane():
+	"curves off the plane of an existing sketch land in it, compacted BSplines too"
+	v = App.Vector
+	bs = Part.BSplineCurve()
+	bs.interpolate([ v(0, 0, 1), v(2, 1, 2), v(4, 0, 3), v(6, 1, 4) ])
+	line = Part.LineSegment(v(6, 1, 4), v(8, 0, 5))
+	arc = Part.Arc(v(8, 0, 5), v(9, 1, 5.5), v(10, 0, 6))
+	geo, coincident = sketchGeometry([ bs, line, arc ], App.Placement())
+	assert isinstance(geo[0], Part.BSplineCurve)
+	for g in geo:
+		for u in (g.FirstParameter, (g.FirstParameter+g.LastParameter)/2, g.LastParameter):
+			assert abs(g.value(u).z) < 1e-9
+	assert bs.StartPoint.z == pytest.approx(1)	# the input is not modified
@@ -0,0 +1,33 @@
+# The ToBiArcs feature in a FreeCAD document. Run with FreeCAD's python:
+# python -m pytest tests
+
+import sys
+from pathlib import Path
+
+import pytest
+
+App = pytest.importorskip("FreeCAD")
+import Part
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from grabbag import fingerprint
+import BiArc
+
+@pytest.fixture
+def doc():
+	d = App.newDocument("ToBiArcsTest")
+	yield d
+	App.closeDocument(d.Name)
+	fingerprint.clear()
+
+def test_empty_base(doc):
+	"a feature without Base recomputes to an empty shape and a zero report"
+	f = doc.addObject("Part::FeaturePython", "ToBiArcs")
+	BiArc.ToBiArcs(f)
+	doc.recompute()
+	assert f.Shape.isNull()
+	assert f.ArcsBefore == f.ArcsAfter == f.PoleCount == 0
+	assert f.MaxDeviation == 0
+	assert list(f.FailedSeams) == []
+	assert f.Proxy.curves(f) == []